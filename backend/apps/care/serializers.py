@@ -2,10 +2,11 @@
 Serializers Care — Praticiens et services.
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import Practitioner, ServiceCategory, Service
 
 
-class ServiceCategorySerializer(serializers.ModelSerializer):
+class ServiceCategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les catégories de soins."""
     services_count = serializers.SerializerMethodField()
 
@@ -17,7 +18,7 @@ class ServiceCategorySerializer(serializers.ModelSerializer):
         return obj.services.filter(is_available=True).count()
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les services/soins."""
     practitioner_name = serializers.ReadOnlyField(source="practitioner.name")
     practitioner_slug = serializers.ReadOnlyField(source="practitioner.slug")
@@ -51,7 +52,7 @@ class PractitionerSerializer(serializers.ModelSerializer):
         return obj.services.filter(is_available=True).count()
 
 
-class PractitionerListSerializer(serializers.ModelSerializer):
+class PractitionerListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer allégé pour les listes de praticiens."""
     services_count = serializers.SerializerMethodField()
 
@@ -2,6 +2,7 @@
 Views Care — Praticiens et services.
 """
 from rest_framework import viewsets, permissions
+from apps.core.fieldsets import SparseFieldsetViewMixin
 from .models import Practitioner, ServiceCategory, Service
 from .serializers import (
     PractitionerSerializer,
@@ -11,7 +12,7 @@ from .serializers import (
 )
 
 
-class PractitionerViewSet(viewsets.ModelViewSet):
+class PractitionerViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les praticiens.
     GET: public, POST/PUT/DELETE: admin.
@@ -33,7 +34,7 @@ class PractitionerViewSet(viewsets.ModelViewSet):
         return [permissions.IsAdminUser()]
 
 
-class ServiceCategoryViewSet(viewsets.ModelViewSet):
+class ServiceCategoryViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les catégories de soins.
     GET: public, POST/PUT/DELETE: admin.
@@ -48,7 +49,7 @@ class ServiceCategoryViewSet(viewsets.ModelViewSet):
         return [permissions.IsAdminUser()]
 
 
-class CareServiceViewSet(viewsets.ModelViewSet):
+class CareServiceViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les services/soins.
     GET: public, POST/PUT/DELETE: admin.
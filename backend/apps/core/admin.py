@@ -10,6 +10,8 @@ from .models import (
     Bulletin,
     FaqItem,
     PendingContentEdit,
+    TranslationMemory,
+    BackgroundJob,
 )
 
 
@@ -249,3 +251,18 @@ class PendingContentEditAdmin(admin.ModelAdmin):
     list_filter = ("status", "content_type")
     search_fields = ("object_id", "requested_by__username")
     readonly_fields = ("requested_by", "created_at", "updated_at")
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ("source_text", "target_lang", "context_class", "hit_count", "last_used_at")
+    list_filter = ("target_lang", "context_class")
+    search_fields = ("source_text", "translated_text")
+    readonly_fields = ("source_hash", "hit_count", "created_at", "last_used_at")
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "status", "requested_by", "created_at", "finished_at")
+    list_filter = ("status", "kind")
+    readonly_fields = ("worker", "progress", "output", "error", "created_at", "started_at", "heartbeat_at", "finished_at")
@@ -5,3 +5,14 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     verbose_name = "Core (référentiels et configuration)"
+
+    def ready(self):
+        # Générations de contenu : invalidation du cache des vues publiques
+        from .signals import connect_content_signals
+
+        connect_content_signals()
+
+        # Empreintes des sources traduites : détection des traductions périmées
+        from .translation_fingerprints import connect_fingerprint_signals
+
+        connect_fingerprint_signals()
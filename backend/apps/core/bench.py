@@ -0,0 +1,398 @@
+"""
+Banc de mesure de l'API : latence, requêtes SQL et taille de réponse de chaque route GET.
+
+- seed_bench_data() part des données démo (load_demo_data) et ajoute un jeu proportionnel
+  à `scale` (événements, cours, partenaires, artistes, trainings…) ;
+- collect_routes() parcourt config/api_urls.py (routes path() et router DRF) et remplit les
+  paramètres (slug, username, uuid…) avec un objet existant ;
+- run_bench() appelle chaque route via le client de test : p50/p95 sur `iterations` appels,
+  requêtes SQL et octets du premier appel (cache vidé : travail complet de la vue) ;
+- check_budget() compare au fichier de budget versionné (backend/perf-budget.json).
+
+Le rapport (write_report) suit la forme du résumé Lighthouse du frontend
+(frontend/perf-reports/summary.json) : une entrée par page, les pires en premier.
+Utilisé par `python manage.py bench_api` et par apps/core/tests_bench.py.
+"""
+import json
+import math
+import re
+import statistics
+import time
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .content_cache import deferred_generation_bumps
+
+BUDGET_PATH = Path(settings.BASE_DIR) / "perf-budget.json"
+REPORT_PATH = Path(settings.BASE_DIR) / "perf-reports" / "summary.json"
+API_PREFIX = "/api/"
+BENCH_ADMIN = "bench-admin"
+METRICS = ("queries", "p95_ms", "bytes")
+
+# Routes appelées avec un superutilisateur (les autres en anonyme, comme le site public).
+AUTH_PREFIXES = ("admin/", "auth/")
+
+# Routes GET volontairement non mesurées.
+SKIPPED_ROUTES = {
+    "seed/": "GET qui écrit en base (chargement des données initiales)",
+    "auth/pending-staff/<int:user_id>/": "PATCH uniquement (la liste est sur auth/pending-staff/)",
+}
+
+# Préfixe de route (sans « admin/ ») → (modèle, filtres) où prendre la valeur des paramètres :
+# de préférence un objet du jeu du banc (avec enseignants, pass, lieux…), toujours le même.
+_SAMPLE_SOURCES = {
+    "identite/bulletins/": ("core.Bulletin", {"slug__startswith": "bench-"}),
+    "courses/theory/": ("courses.TheoryLesson", {"slug__startswith": "bench-"}),
+    "courses/": ("courses.Course", {"slug__startswith": "bench-", "is_active": True}),
+    "events/": ("events.Event", {"slug__startswith": "bench-"}),
+    "calendar/": ("organization.OrganizationNode", {}),
+    "organization/nodes/": ("organization.OrganizationNode", {}),
+    "partners/brands/": ("partners.Partner", {}),
+    "partners/nodes/": ("partners.PartnerNode", {}),
+    "partners/events/": ("partners.PartnerEvent", {}),
+    "partners/courses/": ("partners.PartnerCourse", {"is_active": True}),
+    "users/artists/": ("users.User", {"username__startswith": "bench-artist-"}),
+    "jobs/": ("core.BackgroundJob", {}),
+    "pending-edits/": ("core.PendingContentEdit", {}),
+}
+_PARAM_FIELDS = {"job_id": "pk", "pk": "pk"}
+_STATIC_PARAMS = {"scope": "node"}
+
+_PARAM_RE = re.compile(r"<(?:\w+:)?(\w+)>")
+_REGEX_GROUP_RE = re.compile(r"\(\?P<(\w+)>[^)]*\)")
+
+
+# ─── Données ─────────────────────────────────────────────────────────────────
+
+
+def seed_bench_data(scale=1):
+    """Données démo + jeu proportionnel à `scale` ; renvoie le superutilisateur du banc."""
+    from apps.care.models import Practitioner, Service, ServiceCategory
+    from apps.core.models import BackgroundJob, Bulletin, DanceProfession, DanceStyle, ExplorePreset, FaqItem, Level
+    from apps.core.models import PendingContentEdit
+    from apps.courses.models import Course, Schedule, TheoryLesson
+    from apps.events.agenda import rebuild_agenda
+    from apps.events.models import Event, EventPass
+    from apps.organization.models import NodeEvent, OrganizationNode
+    from apps.partners.models import Partner, PartnerCourse, PartnerEvent, PartnerNode, PartnerSchedule
+    from apps.projects.models import Project, ProjectCategory
+    from apps.shop.models import Category, Product
+    from apps.trainings.models import SubscriptionPass, TrainingSession
+    from apps.users.models import User
+
+    with deferred_generation_bumps():
+        call_command("load_demo_data", stdout=StringIO())
+        today = timezone.now().date()
+        nodes = list(OrganizationNode.objects.order_by("slug"))
+        styles = list(DanceStyle.objects.order_by("slug"))
+        levels = list(Level.objects.order_by("slug"))
+        professions = list(DanceProfession.objects.order_by("slug"))
+        admin, _ = User.objects.get_or_create(
+            username=BENCH_ADMIN, defaults={"user_type": User.UserType.ADMIN, "is_superuser": True}
+        )
+
+        artists = User.objects.bulk_create(
+            [
+                User(username=f"bench-artist-{i:03d}", first_name=f"Artiste {i}", email=f"bench-{i}@example.invalid")
+                for i in range(20 * scale)
+            ]
+        )
+        for i, artist in enumerate(artists):
+            artist.professions.add(professions[i % len(professions)])
+
+        for i in range(10 * scale):
+            node = nodes[i % len(nodes)]
+            event = Event.objects.create(
+                name=f"Bench festival {i}",
+                slug=f"bench-festival-{i}",
+                type=Event.EventType.FESTIVAL if i % 2 else Event.EventType.PARTY,
+                description="Événement du banc de mesure.",
+                start_date=today + timedelta(days=i),
+                end_date=today + timedelta(days=i + 1),
+                location_name="Paris",
+                node=node,
+            )
+            EventPass.objects.create(event=event, name="Full pass", price=80, quantity_available=100)
+            EventPass.objects.create(event=event, name="Party pass", price=25)
+            start = timezone.now() + timedelta(days=i)
+            NodeEvent.objects.create(
+                node=node, title=f"Bench soirée {i}", start_datetime=start, end_datetime=start + timedelta(hours=3)
+            )
+
+            course = Course.objects.create(
+                name=f"Bench cours {i}",
+                slug=f"bench-cours-{i}",
+                style=styles[i % len(styles)],
+                level=levels[i % len(levels)],
+                node=node,
+                is_active=True,
+            )
+            course.teachers.add(*artists[i % len(artists): i % len(artists) + 2])
+            for day in (i % 7, (i + 3) % 7):
+                Schedule.objects.create(course=course, day_of_week=day, start_time="19:00", end_time="20:30")
+
+            TheoryLesson.objects.create(
+                title=f"Bench théorie {i}", slug=f"bench-theorie-{i}", level=levels[i % len(levels)], content="# Bench"
+            )
+            Bulletin.objects.create(title=f"Bench bulletin {i}", slug=f"bench-bulletin-{i}")
+            FaqItem.objects.create(question=f"Question {i} ?", answer="Réponse.")
+            TrainingSession.objects.create(
+                title=f"Bench training {i}",
+                slug=f"bench-training-{i}",
+                date=start,
+                level=levels[i % len(levels)],
+                capacity=20,
+            )
+
+        for p in range(2 * scale):
+            partner = Partner.objects.create(name=f"Bench partenaire {p}", slug=f"bench-partenaire-{p}")
+            for n in range(2):
+                node = PartnerNode.objects.create(partner=partner, name=f"Bench lieu {p}-{n}", slug=f"bench-lieu-{p}-{n}")
+                node.linked_artists.add(*artists[:3])
+                PartnerEvent.objects.create(
+                    partner=partner,
+                    node=node,
+                    name=f"Bench soirée partenaire {p}-{n}",
+                    slug=f"bench-soiree-partenaire-{p}-{n}",
+                    type=PartnerEvent.EventType.PARTY,
+                    start_date=today + timedelta(days=n),
+                    end_date=today + timedelta(days=n),
+                )
+                course = PartnerCourse.objects.create(
+                    partner=partner,
+                    node=node,
+                    name=f"Bench cours partenaire {p}-{n}",
+                    slug=f"bench-cours-partenaire-{p}-{n}",
+                    style=styles[n % len(styles)],
+                    level=levels[n % len(levels)],
+                )
+                PartnerSchedule.objects.create(course=course, day_of_week=n, start_time="20:00", end_time="21:00")
+
+        SubscriptionPass.objects.create(name="Bench pass", slug="bench-pass", price=120, description="Pass mensuel.")
+        category = Category.objects.create(name="Bench vêtements", slug="bench-vetements")
+        Product.objects.create(category=category, name="Bench t-shirt", slug="bench-t-shirt", description="T-shirt.", price=20)
+        practitioner = Practitioner.objects.create(name="Bench kiné", slug="bench-kine", specialty="Kiné", bio="Bio.")
+        care_category = ServiceCategory.objects.create(name="Bench soins", slug="bench-soins")
+        Service.objects.create(
+            practitioner=practitioner,
+            category=care_category,
+            title="Bench massage",
+            slug="bench-massage",
+            description="Massage.",
+            duration_minutes=60,
+            price=50,
+        )
+        project_category = ProjectCategory.objects.create(title="Bench projets")
+        Project.objects.create(title="Bench projet", slug="bench-projet", category=project_category)
+        ExplorePreset.objects.create(name="Bench preset")
+        BackgroundJob.objects.create(kind="translate_models", requested_by=admin)
+        PendingContentEdit.objects.create(
+            content_type=PendingContentEdit.ContentType.BULLETIN,
+            object_id="bench-bulletin-0",
+            payload={"title": "Bench bulletin modifié"},
+            requested_by=admin,
+        )
+        rebuild_agenda()
+    return admin
+
+
+# ─── Routes ──────────────────────────────────────────────────────────────────
+
+
+def _walk(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), pattern
+
+
+def _route_name(raw):
+    # Routes du router (regex) : '^shop/products/(?P<slug>[^/.]+)/$' → 'shop/products/<slug>/'.
+    return _REGEX_GROUP_RE.sub(r"<\1>", raw).lstrip("^").rstrip("$")
+
+
+def _serves_get(callback):
+    actions = getattr(callback, "actions", None)
+    if actions is not None:  # ViewSet
+        return "get" in actions
+    view_class = getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+    return view_class is None or hasattr(view_class, "get")
+
+
+def _viewset_sample(callback, field):
+    # Le get_queryset() de la vue elle-même : ses filtres (is_active…) s'appliquent à l'échantillon.
+    view = callback.cls(**callback.initkwargs)
+    view.action, view.kwargs, view.format_kwarg = "retrieve", {}, None
+    view.request = Request(APIRequestFactory().get("/"))
+    return view.get_queryset().order_by(field).values_list(field, flat=True).first()
+
+
+def _sample(route, name, callback):
+    if name in _STATIC_PARAMS:
+        return _STATIC_PARAMS[name]
+    if getattr(callback, "actions", None) is not None:
+        return _viewset_sample(callback, name)
+    bare = route.removeprefix("admin/")
+    source = max((p for p in _SAMPLE_SOURCES if bare.startswith(p)), key=len, default=None)
+    if source is None:
+        return None
+    label, filters = _SAMPLE_SOURCES[source]
+    field = _PARAM_FIELDS.get(name, name)
+    return apps.get_model(label).objects.filter(**filters).order_by(field).values_list(field, flat=True).first()
+
+
+def collect_routes(only=None):
+    """
+    Routes GET de config/api_urls.py : liste de dicts {route, path, auth} ou {route, skipped}.
+    `only` : sous-chaîne filtrant les routes.
+    """
+    from config import api_urls
+
+    routes, seen = [], set()
+    for raw, pattern in _walk(api_urls.urlpatterns):
+        if "format" in pattern.pattern.regex.groupindex:  # variantes .json/.api du router
+            continue
+        route = _route_name(raw)
+        if route in seen or (only and only not in route) or not _serves_get(pattern.callback):
+            continue
+        seen.add(route)
+        if route in SKIPPED_ROUTES:
+            routes.append({"route": route, "skipped": SKIPPED_ROUTES[route]})
+            continue
+        values, missing = {}, []
+        for name in _PARAM_RE.findall(route):
+            value = _sample(route, name, pattern.callback)
+            if value is None:
+                missing.append(name)
+            values[name] = value
+        if missing:
+            routes.append({"route": route, "skipped": f"aucun objet pour {', '.join(missing)}"})
+            continue
+        path = _PARAM_RE.sub(lambda m: str(values[m.group(1)]), route)
+        routes.append({"route": route, "path": API_PREFIX + path, "auth": route.startswith(AUTH_PREFIXES)})
+    return routes
+
+
+# ─── Mesure ──────────────────────────────────────────────────────────────────
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _get(client, path):
+    response = client.get(path)
+    # Les flux (ICS) ne lisent la base qu'à la consommation du corps.
+    body = b"".join(response.streaming_content) if response.streaming else response.content
+    return response, body
+
+
+def bench_route(client, path, iterations=5, warm=False):
+    """Mesure une route : {status, p50_ms, p95_ms, queries, bytes}."""
+    if warm:
+        _get(client, path)
+    timings, first = [], None
+    for _ in range(iterations):
+        if not warm:
+            cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response, body = _get(client, path)
+            timings.append((time.perf_counter() - started) * 1000)
+        if first is None:
+            first = {"status": response.status_code, "queries": len(queries), "bytes": len(body)}
+    return {
+        "status": first["status"],
+        "p50_ms": round(statistics.median(timings), 1),
+        "p95_ms": round(_percentile(timings, 0.95), 1),
+        "queries": first["queries"],
+        "bytes": first["bytes"],
+    }
+
+
+def run_bench(routes, admin=None, iterations=5, warm=False):
+    """Mesure chaque route de collect_routes() ; une exception de vue devient une entrée en erreur."""
+    anonymous, authenticated = APIClient(), APIClient()
+    if admin is not None:
+        authenticated.force_authenticate(admin)
+    results = []
+    for entry in routes:
+        if "skipped" in entry:
+            results.append({"page": API_PREFIX + entry["route"], **entry})
+            continue
+        client = authenticated if entry["auth"] else anonymous
+        result = {"page": entry["path"], "route": entry["route"]}
+        try:
+            result.update(bench_route(client, entry["path"], iterations=iterations, warm=warm))
+        except Exception as e:  # noqa: BLE001 — reporté dans le rapport, le banc continue
+            result.update(status=500, error=f"{type(e).__name__}: {e}")
+        results.append(result)
+    return results
+
+
+# ─── Budget et rapport ───────────────────────────────────────────────────────
+
+
+def load_budget(path=BUDGET_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_budget(results, budget, metrics=METRICS):
+    """Ajoute `violations` à chaque résultat mesuré ; renvoie les résultats en dépassement."""
+    failing = []
+    for result in results:
+        if "skipped" in result:
+            continue
+        limits = {**budget.get("defaults", {}), **budget.get("routes", {}).get(result["route"], {})}
+        violations = []
+        if result["status"] >= 500:
+            violations.append(f"status {result['status']}")
+        for metric in metrics:
+            if metric in result and metric in limits and result[metric] > limits[metric]:
+                violations.append(f"{metric} {result[metric]} > {limits[metric]}")
+        result["violations"] = violations
+        if violations:
+            failing.append(result)
+    return failing
+
+
+def budget_from_results(results, scale, previous=None):
+    """Budget régénéré depuis une mesure : requêtes exactes, marge sur la latence et la taille."""
+    routes = {}
+    for result in results:
+        if "skipped" in result or result["status"] >= 500:
+            continue
+        routes[result["route"]] = {
+            "queries": result["queries"],
+            "p95_ms": max(50, math.ceil(result["p95_ms"] * 3 / 10) * 10),
+            "bytes": max(1024, math.ceil(result["bytes"] * 1.5 / 1024) * 1024),
+        }
+    defaults = (previous or {}).get("defaults") or {"queries": 20, "p95_ms": 500, "bytes": 1024 * 1024}
+    return {"scale": scale, "defaults": defaults, "routes": dict(sorted(routes.items()))}
+
+
+def write_report(results, path=REPORT_PATH):
+    """Résumé JSON, pires routes en premier (dépassements, puis p95 décroissant)."""
+    ordered = sorted(
+        results,
+        key=lambda r: ("skipped" in r, not r.get("violations") and "error" not in r, -r.get("p95_ms", 0)),
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(ordered, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
@@ -0,0 +1,181 @@
+"""
+Backends de cache partagés entre workers Gunicorn, sans service externe.
+
+SQLiteCache : un fichier SQLite (mode WAL) commun à tous les processus de la machine.
+Une écriture ou une suppression faite par un worker est immédiatement visible
+par les autres (contrairement à LocMemCache, une copie par processus).
+Les entiers sont stockés tels quels pour que incr() soit atomique côté SQLite.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache_entries ("
+    " key TEXT PRIMARY KEY,"
+    " value BLOB NOT NULL,"
+    " expires REAL"
+    ")"
+)
+_INDEX = "CREATE INDEX IF NOT EXISTS cache_entries_expires ON cache_entries (expires)"
+# Vérifie le nombre d'entrées toutes les N écritures (COUNT(*) n'est pas gratuit).
+_CULL_CHECK_EVERY = 50
+
+
+def _encode(value):
+    # bool est un int en Python : on le pickle pour le retrouver tel quel.
+    if type(value) is int:
+        return value
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(raw):
+    if isinstance(raw, int):
+        return raw
+    return pickle.loads(raw)
+
+
+class SQLiteCache(BaseCache):
+    """
+    CACHES = {"default": {
+        "BACKEND": "apps.core.cache_backends.SQLiteCache",
+        "LOCATION": "/tmp/cache.sqlite3",
+    }}
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = str(location)
+        self._local = threading.local()
+        self._writes = 0
+
+    # ── Connexion (une par thread et par processus, autocommit) ─────────────
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        # Une connexion SQLite ne doit pas traverser un fork (gunicorn --preload).
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_INDEX)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # ── API Django ─────────────────────────────────────────────────────────
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cur = self._conn().execute(
+            "INSERT INTO cache_entries (key, value, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires = excluded.expires "
+            "WHERE cache_entries.expires IS NOT NULL AND cache_entries.expires <= ?",
+            (key, _encode(value), self.get_backend_timeout(timeout), now),
+        )
+        self._after_write()
+        return cur.rowcount > 0
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._conn().execute(
+            "SELECT value, expires FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return default
+        raw, expires = row
+        if expires is not None and expires <= time.time():
+            self._conn().execute(
+                "DELETE FROM cache_entries WHERE key = ? AND expires <= ?", (key, time.time())
+            )
+            return default
+        try:
+            return _decode(raw)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Entrée écrite par une version incompatible du code : on l'ignore.
+            return default
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._conn().execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)",
+            (key, _encode(value), self.get_backend_timeout(timeout)),
+        )
+        self._after_write()
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cur = self._conn().execute(
+            "UPDATE cache_entries SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (self.get_backend_timeout(timeout), key, time.time()),
+        )
+        return cur.rowcount > 0
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cur = self._conn().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        return cur.rowcount > 0
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._conn().execute(
+            "SELECT 1 FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def incr(self, key, delta=1, version=None):
+        """Incrément atomique (BEGIN IMMEDIATE) : sûr entre processus."""
+        key = self.make_and_validate_key(key, version=version)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+            if not isinstance(row[0], int):
+                raise TypeError("Key '%s' does not hold an integer" % key)
+            new_value = row[0] + delta
+            conn.execute("UPDATE cache_entries SET value = ? WHERE key = ?", (new_value, key))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return new_value
+
+    def clear(self):
+        self._conn().execute("DELETE FROM cache_entries")
+
+    def close(self, **kwargs):
+        # Connexions conservées d'une requête à l'autre (comme un pool par thread).
+        pass
+
+    # ── Nettoyage ──────────────────────────────────────────────────────────
+
+    def _after_write(self):
+        self._writes += 1
+        if self._writes % _CULL_CHECK_EVERY == 0:
+            self._cull()
+
+    def _cull(self):
+        conn = self._conn()
+        conn.execute("DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count <= self._max_entries:
+            return
+        to_delete = count // self._cull_frequency if self._cull_frequency else count
+        conn.execute(
+            "DELETE FROM cache_entries WHERE key IN ("
+            " SELECT key FROM cache_entries ORDER BY expires IS NULL, expires LIMIT ?"
+            ")",
+            (to_delete,),
+        )
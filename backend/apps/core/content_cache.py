@@ -0,0 +1,430 @@
+"""
+Cache des réponses publiques par « génération de contenu ».
+
+Chaque famille de modèles (cours, événements, partenaires…) a un compteur de version
+dans le cache partagé. Les signaux post_save / post_delete / m2m_changed l'incrémentent
+(voir apps/core/signals.py) ; les vues publiques stockent leur payload sous une clé
+construite à partir de ces versions, de la langue et des paramètres de requête.
+Une écriture rend donc obsolètes toutes les clés dérivées sans avoir à les connaître.
+
+La même clé sert de validateur HTTP (ETag) et l'horodatage du dernier incrément
+de Last-Modified : un client ou un CDN qui revalide reçoit un 304 sans que la vue
+ni le serializer ne soient exécutés.
+
+Invalidation coalescée et transactionnelle (bump_generation) :
+- dans deferred_generation_bumps() — une requête HTTP (ContentInvalidationMiddleware), une
+  commande de chargement, un lot d'approbations — les familles touchées sont collectées et
+  incrémentées une seule fois à la sortie du bloc ;
+- dans une transaction, l'incrément attend le commit (transaction.on_commit) et n'a pas lieu
+  en cas de rollback : un lecteur concurrent ne peut pas remettre en cache l'état d'avant ;
+- invalidation_metrics() compte, par processus, les familles demandées et réellement incrémentées.
+
+Avec cache_public_get(…, single_flight=True), une entrée manquante n'est recalculée que par
+une requête à la fois ; les autres reçoivent la réponse précédente (validateurs compris)
+le temps du calcul (apps/core/single_flight.py). cache_public_stream applique le même schéma
+aux réponses diffusées en flux (StreamingHttpResponse).
+
+Réponses qui dépendent de l'heure (?upcoming=1, fenêtre « à partir de maintenant ») :
+cache_public_get(…, clock=…) ajoute à la clé, donc à l'ETag, le début de la fenêtre de
+temps courante (ex. minuit pour upcoming_clock) et en fait le Last-Modified minimal ;
+le changement de jour rend la réponse précédente obsolète même sans écriture.
+"""
+import contextlib
+import functools
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, time as dt_time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .single_flight import SkipCache, get_or_build
+
+# Famille → modèles dont une écriture change le payload des vues de la famille.
+# Un modèle peut appartenir à plusieurs familles (ex. User : enseignants, artistes, staff).
+CONTENT_FAMILIES = {
+    "config": ("core.SiteConfiguration", "core.SiteVideoAmbience", "core.ExplorePreset"),
+    "menu": ("core.MenuItem",),
+    "faq": ("core.FaqItem",),
+    "bulletins": ("core.Bulletin",),
+    "courses": (
+        "courses.Course",
+        "courses.Schedule",
+        "courses.TheoryLesson",
+        "core.DanceStyle",
+        "core.Level",
+        "organization.OrganizationNode",
+        "users.User",
+    ),
+    "events": ("events.Event", "organization.OrganizationNode"),
+    "organization": (
+        "organization.OrganizationNode",
+        "organization.NodeEvent",
+        "organization.Pole",
+        "users.User",
+    ),
+    "partners": (
+        "partners.Partner",
+        "partners.PartnerNode",
+        "partners.PartnerEvent",
+        "partners.PartnerCourse",
+        "partners.PartnerSchedule",
+        "core.DanceStyle",
+        "core.Level",
+        "users.User",
+    ),
+    "artists": ("users.User", "core.DanceProfession", "partners.PartnerNode"),
+    "agenda": (
+        "events.Event",
+        "partners.PartnerEvent",
+        "organization.NodeEvent",
+        "trainings.TrainingSession",
+        "organization.OrganizationNode",
+        "partners.PartnerNode",
+    ),
+}
+
+CONTENT_CACHE_TIMEOUT = 60 * 60  # 1 h : la fraîcheur est assurée par les générations
+_GENERATION_KEY = "content_gen:{}"
+_GENERATION_AT_KEY = "content_gen_at:{}"
+# Toujours revalider : le 304 coûte une lecture de cache, jamais un payload périmé.
+PUBLIC_REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+STREAM_CACHE_MAX_BYTES = 2 * 1024 * 1024  # au-delà, un flux est servi sans être mis en cache
+
+
+def families_for_model(label: str) -> tuple:
+    """Familles impactées par une écriture sur le modèle `app_label.ModelName`."""
+    return tuple(f for f, labels in CONTENT_FAMILIES.items() if label in labels)
+
+
+def _initial_generation() -> int:
+    # Horodatage en ms plutôt que 1 : si le compteur est évincé du cache, la nouvelle
+    # valeur ne peut pas retomber sur une clé de payload encore présente.
+    return int(time.time() * 1000)
+
+
+logger = logging.getLogger(__name__)
+
+_deferred = threading.local()
+_metrics = Counter()
+_metrics_lock = threading.Lock()
+
+
+def _count(**values):
+    with _metrics_lock:
+        _metrics.update(values)
+
+
+def invalidation_metrics() -> dict:
+    """
+    Compteurs du processus : `requested` (familles demandées par les signaux / appels),
+    `flushed` (incréments réellement écrits), `coalesced` (demandes absorbées par un lot),
+    `deferred_batches` / `commit_batches` (lots vidés en fin de bloc / après commit).
+    """
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    for key in ("requested", "flushed", "deferred_batches", "commit_batches"):
+        metrics.setdefault(key, 0)
+    metrics["coalesced"] = max(0, metrics["requested"] - metrics["flushed"])
+    return metrics
+
+
+def reset_invalidation_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
+
+
+@contextlib.contextmanager
+def deferred_generation_bumps():
+    """
+    Regroupe les bump_generation() du bloc (thread courant) : un incrément par famille en
+    sortie, après le commit si le bloc est lui-même dans une transaction.
+    Utilisable en décorateur (@deferred_generation_bumps()) sur handle() d'une commande.
+    """
+    if getattr(_deferred, "families", None) is not None:
+        yield  # bloc imbriqué : l'englobant invalidera
+        return
+    _deferred.families = set()
+    try:
+        yield
+    finally:
+        families, _deferred.families = _deferred.families, None
+        if families:
+            _count(deferred_batches=1)
+            _schedule(families)
+
+
+class _CommitBatch:
+    """Familles à incrémenter au commit de la transaction en cours (un callback on_commit)."""
+
+    def __init__(self):
+        self.families = set()
+
+    def __call__(self):
+        if getattr(_deferred, "commit_batch", None) is self:
+            _deferred.commit_batch = None
+        _count(commit_batches=1)
+        _bump_now(self.families)
+
+
+def _in_transaction(connection) -> bool:
+    # La transaction qui enveloppe un TestCase n'est jamais validée : hors de celle-ci,
+    # on se comporte comme en autocommit.
+    return any(not getattr(block, "_from_testcase", False) for block in connection.atomic_blocks)
+
+
+def _schedule(families) -> None:
+    connection = transaction.get_connection()
+    if not _in_transaction(connection):
+        _bump_now(families)
+        return
+    batch = getattr(_deferred, "commit_batch", None)
+    # Un rollback (complet ou de savepoint) retire le callback : on en inscrit un nouveau.
+    if batch is None or not any(entry[1] is batch for entry in connection.run_on_commit):
+        batch = _deferred.commit_batch = _CommitBatch()
+        transaction.on_commit(batch)
+    batch.families.update(families)
+
+
+def _bump_now(families) -> None:
+    families = sorted(set(families))
+    if not families:
+        return
+    now = time.time()
+    for family in families:
+        key = _GENERATION_KEY.format(family)
+        try:
+            cache.incr(key)
+        except ValueError:
+            if not cache.add(key, _initial_generation(), None):
+                cache.incr(key)
+    cache.set_many({_GENERATION_AT_KEY.format(f): now for f in families}, None)
+    _count(flushed=len(families))
+    logger.debug("content generation bump: %s", ", ".join(families))
+
+
+def bump_generation(*families: str) -> None:
+    """Invalide toutes les réponses cachées des familles données (coalescé, après commit)."""
+    if not families:
+        return
+    _count(requested=len(families))
+    pending = getattr(_deferred, "families", None)
+    if pending is not None:
+        pending.update(families)
+        return
+    _schedule(families)
+
+
+def _load_state(families):
+    """({famille: version}, horodatage du dernier incrément) en une lecture de cache."""
+    keys = {}
+    for f in families:
+        keys[_GENERATION_KEY.format(f)] = f
+        keys[_GENERATION_AT_KEY.format(f)] = f
+    found = cache.get_many(list(keys))
+    generations = {}
+    modified_at = []
+    for family in families:
+        key = _GENERATION_KEY.format(family)
+        value = found.get(key)
+        if value is None:
+            cache.add(key, _initial_generation(), None)
+            value = cache.get(key)
+        generations[family] = value
+        at_key = _GENERATION_AT_KEY.format(family)
+        at = found.get(at_key)
+        if at is None:
+            cache.add(at_key, time.time(), None)
+            at = cache.get(at_key)
+        modified_at.append(at)
+    return generations, max(modified_at) if modified_at else None
+
+
+def get_generations(families) -> dict:
+    """Versions courantes {famille: int}, initialisées si absentes."""
+    return _load_state(families)[0]
+
+
+def _request_variant(request) -> list:
+    params = sorted(
+        (k, v) for k in request.query_params for v in request.query_params.getlist(k)
+    )
+    return [request.path, request.scheme, request.get_host(), repr(params)]
+
+
+def content_cache_key(request, families, generations=None, window=None) -> str:
+    """
+    Clé : chemin + hôte (URLs médias absolues) + query params triés + générations
+    (+ début de la fenêtre de temps pour une réponse qui dépend de l'heure).
+    """
+    if generations is None:
+        generations = get_generations(families)
+    parts = _request_variant(request) + [repr(sorted(generations.items()))]
+    if window is not None:
+        parts.append(window.isoformat())
+    raw = "|".join(parts)
+    return "content:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def latest_content_key(request) -> str:
+    """Dernière réponse calculée pour cette variante de requête, toutes générations confondues."""
+    raw = "|".join(_request_variant(request))
+    return "content_latest:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = PUBLIC_REVALIDATE_CACHE_CONTROL
+    patch_vary_headers(response, ("Accept-Language",))
+    return response
+
+
+def today_start():
+    """Minuit (heure locale) du jour courant."""
+    return timezone.make_aware(datetime.combine(timezone.localdate(), dt_time.min))
+
+
+def upcoming_requested(request) -> bool:
+    return request.query_params.get("upcoming", "").lower() in ("1", "true", "yes")
+
+
+def upcoming_clock(request):
+    """clock des listes filtrables par ?upcoming=1 : la réponse filtrée change à minuit."""
+    return today_start() if upcoming_requested(request) else None
+
+
+def _revalidate(request, families, clock=None):
+    """
+    (clé, ETag, Last-Modified, réponse 304 ou None) calculés sur les seules générations
+    et, avec `clock`, sur le début de la fenêtre de temps courante.
+    """
+    generations, modified_at = _load_state(families)
+    window = clock(request) if clock is not None else None
+    key = content_cache_key(request, families, generations, window)
+    etag = '"%s"' % key.rsplit(":", 1)[1]
+    if window is not None:
+        modified_at = max(modified_at or 0, window.timestamp())
+    last_modified = int(modified_at) if modified_at is not None else None
+    not_modified = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified,
+        response=_set_validators(HttpResponse(), etag, last_modified),
+    )
+    if not_modified is not None and not_modified.status_code == 304:
+        return key, etag, last_modified, not_modified
+    return key, etag, last_modified, None
+
+
+def cache_public_get(*families, timeout=CONTENT_CACHE_TIMEOUT, single_flight=False, clock=None):
+    """
+    Décorateur pour la méthode get() d'une APIView publique.
+    - If-None-Match / If-Modified-Since → 304 calculé sur les générations, avant toute requête SQL ;
+    - les réponses 200 sont mises en cache et portent ETag, Last-Modified,
+      Cache-Control « revalider à chaque fois » et Vary: Accept-Language ;
+    - les erreurs (404, 400…) ne sont jamais mises en cache ;
+    - single_flight : un seul recalcul à la fois par clé, réponse précédente servie en attendant,
+      rafraîchissement anticipé probabiliste avant l'expiration (routes à fort trafic) ;
+    - clock(request) → datetime ou None : début de la fenêtre de temps dont dépend la réponse
+      (voir upcoming_clock) ; None pour une requête qui ne dépend pas de l'heure.
+    """
+
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key, etag, last_modified, not_modified = _revalidate(request, families, clock)
+            if not_modified is not None:
+                return not_modified
+
+            if single_flight:
+                built = {}
+
+                def build():
+                    built["response"] = view_method(self, request, *args, **kwargs)
+                    if built["response"].status_code != 200:
+                        raise SkipCache()
+                    return built["response"].data
+
+                try:
+                    fill = get_or_build(
+                        key,
+                        build,
+                        timeout=timeout,
+                        stale_key=latest_content_key(request),
+                        meta=(etag, last_modified),
+                    )
+                except SkipCache:
+                    return built["response"]
+                # Réponse périmée servie pendant un recalcul : elle garde ses propres validateurs.
+                return _set_validators(Response(fill.value), *fill.meta)
+
+            data = cache.get(key)
+            if data is not None:
+                return _set_validators(Response(data), etag, last_modified)
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout)
+                _set_validators(response, etag, last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def cache_public_stream(*families, timeout=CONTENT_CACHE_TIMEOUT, max_bytes=STREAM_CACHE_MAX_BYTES):
+    """
+    Variante de cache_public_get pour une vue qui renvoie une StreamingHttpResponse (flux ICS…).
+    Mêmes validateurs et même 304 ; le corps est diffusé au fil de l'eau et, s'il ne dépasse
+    pas `max_bytes`, mis en cache une fois entièrement envoyé avec les en-têtes posés par la
+    vue (Content-Type, Content-Disposition…) : les requêtes suivantes de la même génération
+    reçoivent la même réponse, sans requête SQL.
+    """
+
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key, etag, last_modified, not_modified = _revalidate(request, families)
+            if not_modified is not None:
+                return not_modified
+            cached = cache.get(key)
+            if isinstance(cached, dict):
+                response = HttpResponse(cached["body"])
+                for header, value in cached["headers"].items():
+                    response[header] = value
+                return _set_validators(response, etag, last_modified)
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200 or not response.streaming:
+                return response
+            response.streaming_content = _tee_to_cache(
+                response.streaming_content, key, dict(response.items()), timeout, max_bytes
+            )
+            return _set_validators(response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
+
+
+def _tee_to_cache(chunks, key, headers, timeout, max_bytes):
+    parts, size = [], 0
+    for chunk in chunks:
+        yield chunk
+        if parts is not None:
+            parts.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                parts = None
+    # Flux interrompu (client parti) : GeneratorExit, rien n'est mis en cache.
+    if parts is not None:
+        cache.set(key, {"headers": headers, "body": b"".join(parts)}, timeout)
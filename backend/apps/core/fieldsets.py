@@ -0,0 +1,137 @@
+"""
+Sparse fieldsets pour les listes publiques : ?fields=a,b,c ou ?omit=x,y.
+
+- SparseFieldsetMixin (serializers) retire les champs non demandés de la réponse ;
+  seul le serializer racine (ou l'enfant d'un many=True racine) est concerné,
+  les serializers imbriqués gardent leurs champs.
+- sparse_queryset() applique la même sélection à la queryset : .defer() des colonnes
+  non demandées (gros champs markdown / contenu) et retrait des prefetch_related devenus
+  inutiles (ex. linked_artists, node_events).
+- SparseFieldsetViewMixin fait de même pour l'action list des ViewSets.
+
+Sans ?fields ni ?omit, rien ne change.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def requested_fieldset(request):
+    """(fields, omit) demandés par le client, chacun un frozenset ou None."""
+    if request is None:
+        return None, None
+    params = getattr(request, "query_params", request.GET)
+
+    def parse(name):
+        raw = params.get(name)
+        if not raw:
+            return None
+        return frozenset(part.strip() for part in raw.split(",") if part.strip()) or None
+
+    return parse("fields"), parse("omit")
+
+
+def selected_field_names(available, request):
+    """Noms de champs à garder parmi `available` (ordre conservé)."""
+    fields, omit = requested_fieldset(request)
+    names = [name for name in available if fields is None or name in fields]
+    if omit:
+        names = [name for name in names if name not in omit]
+    return names
+
+
+def trim_row(row: dict, request) -> dict:
+    """Même sélection pour les vues qui construisent des dicts à la main."""
+    fields, omit = requested_fieldset(request)
+    if fields is None and omit is None:
+        return row
+    keep = set(selected_field_names(row.keys(), request))
+    return {key: value for key, value in row.items() if key in keep}
+
+
+class SparseFieldsetMixin:
+    """
+    À placer avant serializers.ModelSerializer / Serializer.
+    Meta.sparse_field_sources (optionnel) : {champ API: (lookups modèle,)} pour les
+    SerializerMethodField dont le nom ne correspond pas à un champ du modèle.
+    """
+
+    def _is_root(self):
+        parent = self.parent
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        # Lecture seulement : un POST/PATCH valide toujours le serializer complet.
+        if request is None or request.method not in ("GET", "HEAD") or not self._is_root():
+            return fields
+        keep = set(selected_field_names(fields.keys(), request))
+        return {name: field for name, field in fields.items() if name in keep}
+
+
+def _field_roots(serializer_class, name, field):
+    sources = getattr(getattr(serializer_class, "Meta", None), "sparse_field_sources", {})
+    if name in sources:
+        return {lookup.split("__")[0] for lookup in sources[name]}
+    source = getattr(field, "source", None) or name
+    if source == "*":
+        return {name}
+    return {source.split(".")[0]}
+
+
+def sparse_queryset(queryset, request, serializer_class):
+    """
+    Diffère les colonnes et abandonne les prefetch dont aucun champ demandé n'a besoin.
+    Les clés étrangères ne sont jamais différées (incompatibles avec select_related).
+    """
+    fields, omit = requested_fieldset(request)
+    if fields is None and omit is None:
+        return queryset
+
+    all_fields = serializer_class().get_fields()
+    keep = set(selected_field_names(all_fields.keys(), request))
+    needed, dropped = set(), set()
+    for name, field in all_fields.items():
+        (needed if name in keep else dropped).update(_field_roots(serializer_class, name, field))
+    # Les colonnes de tri restent chargées (la pagination par curseur les relit).
+    ordering = [o for o in queryset.query.order_by if isinstance(o, str)]
+    if not ordering:
+        ordering = [o for o in queryset.model._meta.ordering if isinstance(o, str)]
+    needed.update(o.lstrip("-").split("__")[0] for o in ordering)
+    unused = dropped - needed
+
+    opts = queryset.model._meta
+    defer = []
+    for root in unused:
+        try:
+            model_field = opts.get_field(root)
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete and not model_field.is_relation and not model_field.primary_key:
+            defer.append(root)
+
+    lookups = queryset._prefetch_related_lookups
+    kept_lookups = [
+        lookup
+        for lookup in lookups
+        if (lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup).split("__")[0]
+        not in unused
+    ]
+    if len(kept_lookups) != len(lookups):
+        queryset = queryset.prefetch_related(None).prefetch_related(*kept_lookups)
+    if defer:
+        queryset = queryset.defer(*defer)
+    return queryset
+
+
+class SparseFieldsetViewMixin:
+    """Pour les ViewSets : sparse_queryset() sur l'action list (à placer avant viewsets.*)."""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, "action", None) == "list":
+            queryset = sparse_queryset(queryset, self.request, self.get_serializer_class())
+        return queryset
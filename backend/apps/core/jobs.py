@@ -0,0 +1,224 @@
+"""
+Tâches de fond en base de données (modèle BackgroundJob), sans broker externe.
+
+- enqueue_job() crée une tâche « queued » et rend la main (la vue répond 202 + id).
+- `python manage.py run_jobs` réclame les tâches une à une (verrou sur la plus ancienne
+  tâche en file : deux workers ne peuvent pas prendre la même ni dépasser ensemble la
+  limite) dans la limite de JOB_MAX_RUNNING tâches en cours, tous workers confondus, et
+  les exécute hors des processus web.
+- Pendant l'exécution, JobContext capture la sortie, publie la progression et le heartbeat
+  (écritures regroupées, au plus une par seconde) et relaie les demandes d'annulation.
+"""
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import BackgroundJob
+
+Status = BackgroundJob.Status
+
+JOB_FLUSH_INTERVAL = 1.0  # s entre deux écritures de sortie / progression
+JOB_HEARTBEAT_TIMEOUT = timedelta(minutes=5)  # au-delà, le worker est considéré perdu
+JOB_OUTPUT_MAX_CHARS = 100_000  # on garde la fin de la sortie
+
+_HANDLERS = {}
+
+
+def job_handler(kind):
+    """Enregistre `func(params, ctx)` comme exécutant des tâches `kind`."""
+
+    def register(func):
+        _HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def enqueue_job(kind, params=None, user=None):
+    if kind not in _HANDLERS:
+        raise ValueError(f"Type de tâche inconnu : {kind}")
+    return BackgroundJob.objects.create(
+        kind=kind,
+        params=params or {},
+        requested_by=user if getattr(user, "is_authenticated", False) else None,
+    )
+
+
+def request_cancel(job):
+    """Une tâche en file est annulée tout de suite ; une tâche en cours à son prochain point d'arrêt."""
+    now = timezone.now()
+    if BackgroundJob.objects.filter(pk=job.pk, status=Status.QUEUED).update(
+        status=Status.CANCELLED, cancel_requested=True, finished_at=now
+    ):
+        return
+    BackgroundJob.objects.filter(pk=job.pk, status=Status.RUNNING).update(cancel_requested=True)
+
+
+class JobContext:
+    """Fichier de sortie (pour call_command), progression et annulation d'une tâche en cours."""
+
+    def __init__(self, job):
+        self.job = job
+        self._output = []
+        self._size = 0
+        self._progress = dict(job.progress or {})
+        self._dirty = False
+        self._last_flush = 0.0
+        self._last_cancel_check = 0.0
+        self._cancelled = False
+
+    # Interface fichier ------------------------------------------------------
+    def write(self, text):
+        self._output.append(text)
+        self._size += len(text)
+        if self._size > JOB_OUTPUT_MAX_CHARS * 2:
+            tail = "".join(self._output)[-JOB_OUTPUT_MAX_CHARS:]
+            self._output, self._size = [tail], len(tail)
+        self._dirty = True
+        self.flush()
+
+    def isatty(self):
+        return False
+
+    # Progression / annulation ------------------------------------------------
+    def set_progress(self, **values):
+        self._progress.update(values)
+        self._dirty = True
+        self.flush()
+
+    def cancelled(self):
+        now = time.monotonic()
+        if not self._cancelled and now - self._last_cancel_check >= JOB_FLUSH_INTERVAL:
+            self._last_cancel_check = now
+            self._cancelled = BackgroundJob.objects.filter(pk=self.job.pk, cancel_requested=True).exists()
+        return self._cancelled
+
+    def flush(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_flush < JOB_FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+        fields = {"heartbeat_at": timezone.now()}
+        if self._dirty:
+            fields["output"] = "".join(self._output)[-JOB_OUTPUT_MAX_CHARS:]
+            fields["progress"] = self._progress
+            self._dirty = False
+        BackgroundJob.objects.filter(pk=self.job.pk).update(**fields)
+
+
+def fail_lost_jobs():
+    """Tâches « running » sans heartbeat récent (worker tué) : passées en échec, pas relancées."""
+    cutoff = timezone.now() - JOB_HEARTBEAT_TIMEOUT
+    return BackgroundJob.objects.filter(status=Status.RUNNING, heartbeat_at__lt=cutoff).update(
+        status=Status.FAILED, error="Worker perdu (plus de heartbeat).", finished_at=timezone.now()
+    )
+
+
+def claim_next_job(worker, max_running=None):
+    """
+    Réclame la plus ancienne tâche en file si la limite de tâches en cours le permet.
+    Tous les workers verrouillent d'abord cette même ligne (SELECT … FOR UPDATE) : les
+    réclamations passent une à une, et le comptage des tâches en cours, refait sous le verrou,
+    voit celles réclamées juste avant par un autre worker.
+    """
+    max_running = settings.JOB_MAX_RUNNING if max_running is None else max_running
+    fail_lost_jobs()
+    with transaction.atomic():
+        job = (
+            BackgroundJob.objects.select_for_update()
+            .filter(status=Status.QUEUED)
+            .order_by("created_at", "pk")
+            .first()
+        )
+        if job is None or BackgroundJob.objects.filter(status=Status.RUNNING).count() >= max_running:
+            return None
+        now = timezone.now()
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status=Status.RUNNING, worker=worker, started_at=now, heartbeat_at=now
+        )
+    job.refresh_from_db()
+    return job
+
+
+def run_job(job):
+    """Exécute une tâche réclamée et enregistre son statut final."""
+    ctx = JobContext(job)
+    final = {"status": Status.SUCCEEDED}
+    try:
+        handler = _HANDLERS.get(job.kind)
+        if handler is None:
+            raise ValueError(f"Type de tâche inconnu : {job.kind}")
+        handler(job.params or {}, ctx)
+        if ctx.cancelled():
+            final["status"] = Status.CANCELLED
+    except JobCancelled:
+        final["status"] = Status.CANCELLED
+    except Exception as e:  # noqa: BLE001 — l'échec est enregistré sur la tâche
+        ctx.write(traceback.format_exc())
+        final.update(status=Status.FAILED, error=str(e))
+    finally:
+        ctx.flush(force=True)
+        BackgroundJob.objects.filter(pk=job.pk).update(finished_at=timezone.now(), **final)
+        close_old_connections()
+    return final["status"]
+
+
+def default_worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def job_payload(job):
+    return {
+        "id": str(job.id),
+        "kind": job.kind,
+        "status": job.status,
+        "params": job.params,
+        "progress": job.progress,
+        "output": job.output,
+        "error": job.error,
+        "cancel_requested": job.cancel_requested,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+# ─── Exécutants ───────────────────────────────────────────────────────────────
+
+@job_handler("translate_models")
+def translate_models_job(params, ctx):
+    """params : targets, limit, dry_run, model, fields (ceux de POST /api/admin/translate/)."""
+    targets = params.get("targets") or []
+
+    def progress(report):
+        ctx.set_progress(
+            targets=targets,
+            objects_updated=report.objects_updated,
+            fields_translated=report.fields_translated,
+            failures=len(report.failures),
+        )
+
+    # Toutes les langues dans la même commande : une requête packée par objet.
+    call_command(
+        "translate_models",
+        target=",".join(targets),
+        limit=params.get("limit", 1),
+        dry_run=bool(params.get("dry_run")),
+        model=params.get("model") or "",
+        fields=",".join(params.get("fields") or []),
+        stdout=ctx,
+        stderr=ctx,
+        progress=progress,
+        should_stop=ctx.cancelled,
+    )
@@ -0,0 +1,12 @@
+"""Recopie de libellés traduits dans les tables dénormalisées (planning, agenda)."""
+from modeltranslation.settings import AVAILABLE_LANGUAGES
+
+
+def localized_copy(target, obj, field):
+    """{target_<lang>: obj.field_<lang>} ; valeur unique si `field` n'est pas traduit sur `obj`."""
+    if obj is None:
+        return {f"{target}_{lang}": "" for lang in AVAILABLE_LANGUAGES}
+    if hasattr(obj, f"{field}_{AVAILABLE_LANGUAGES[0]}"):
+        return {f"{target}_{lang}": getattr(obj, f"{field}_{lang}") for lang in AVAILABLE_LANGUAGES}
+    value = getattr(obj, field) or ""
+    return {f"{target}_{lang}": value for lang in AVAILABLE_LANGUAGES}
@@ -0,0 +1,90 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from apps.core import bench
+
+# Le banc vide le cache entre les appels : jamais celui d'un serveur qui tourne (Redis, fichier SQLite).
+BENCH_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bench-api"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Banc de l'API : base de test avec un jeu de données proportionnel à --scale, appel de "
+        "chaque route GET de config/api_urls.py (p50/p95, requêtes SQL, taille), comparaison au "
+        "budget versionné (perf-budget.json) et rapport JSON (perf-reports/summary.json)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--scale", type=int, default=None, help="Taille du jeu de données (défaut : celle du budget)")
+        parser.add_argument("--iterations", type=int, default=5, help="Appels mesurés par route")
+        parser.add_argument("--warm", action="store_true", help="Cache conservé entre les appels (mesure à chaud)")
+        parser.add_argument("--route", default=None, help="Ne mesurer que les routes contenant ce texte")
+        parser.add_argument("--budget", default=str(bench.BUDGET_PATH), help="Fichier de budget")
+        parser.add_argument("--output", default=str(bench.REPORT_PATH), help="Rapport JSON")
+        parser.add_argument("--check", action="store_true", help="Échoue si une route dépasse son budget")
+        parser.add_argument(
+            "--write-budget", action="store_true", help="Réécrit le budget depuis cette mesure (avec marge)"
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["iterations"] < 1:
+            raise CommandError("--iterations doit être ≥ 1.")
+        try:
+            budget = bench.load_budget(options["budget"])
+        except FileNotFoundError:
+            if not options["write_budget"]:
+                raise CommandError(f"Budget introuvable : {options['budget']} (--write-budget pour le créer).")
+            budget = {}
+        scale = options["scale"] or budget.get("scale", 1)
+        if budget and scale != budget.get("scale"):
+            self.stdout.write(self.style.WARNING(f"Budget établi à --scale {budget.get('scale')}, mesure à {scale}."))
+
+        # Base de test et cache en mémoire jetables : ni la base ni le cache de travail ne sont touchés.
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            with override_settings(CACHES=BENCH_CACHES):
+                self.stdout.write(f"Données (scale {scale})…")
+                admin = bench.seed_bench_data(scale)
+                routes = bench.collect_routes(options["route"])
+                self.stdout.write(f"{len(routes)} routes GET, {options['iterations']} appels chacune…")
+                results = bench.run_bench(
+                    routes, admin=admin, iterations=options["iterations"], warm=options["warm"]
+                )
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        failing = bench.check_budget(results, budget)
+        for r in results:
+            if "skipped" in r:
+                self.stdout.write(f"  {r['page']:<55} ignorée : {r['skipped']}")
+                continue
+            line = (
+                f"  {r['page']:<55} {r['status']} p50 {r.get('p50_ms', '-')} ms, p95 {r.get('p95_ms', '-')} ms, "
+                f"{r.get('queries', '-')} requêtes, {r.get('bytes', '-')} o"
+            )
+            if r.get("error"):
+                line += f" — {r['error']}"
+            self.stdout.write(self.style.ERROR(line) if r["violations"] else line)
+            for violation in r["violations"]:
+                self.stdout.write(self.style.ERROR(f"      ✗ {violation}"))
+
+        path = bench.write_report(results, options["output"])
+        self.stdout.write(f"Rapport : {path}")
+        if options["write_budget"]:
+            new_budget = bench.budget_from_results(results, scale, previous=budget)
+            with open(options["budget"], "w", encoding="utf-8") as f:
+                f.write(json.dumps(new_budget, indent=2, ensure_ascii=False) + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Budget réécrit : {options['budget']}"))
+        elif failing:
+            message = f"{len(failing)} route(s) hors budget."
+            if options["check"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("Toutes les routes sont dans le budget."))
@@ -6,6 +6,7 @@ from datetime import timedelta
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import Level, DanceStyle
 from apps.organization.models import OrganizationNode, NodeEvent
 from apps.courses.models import Course, Schedule
@@ -15,6 +16,7 @@ from apps.events.models import Event, EventPass
 class Command(BaseCommand):
     help = "Charge les données démo (cours, événements, NodeEvents) basées sur la hiérarchie existante."
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         today = timezone.now().date()
 
@@ -3,6 +3,7 @@ Management command to load FAQ data in 3 languages.
 Usage: python manage.py load_faq_data
 """
 from django.core.management.base import BaseCommand
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import FaqItem
 
 
@@ -157,6 +158,7 @@ Para participar, se requiere un mínimo de party pass.""",
 class Command(BaseCommand):
     help = "Load FAQ data in 3 languages (FR, EN, ES)"
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         created_count = 0
         updated_count = 0
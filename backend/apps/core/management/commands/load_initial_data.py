@@ -3,12 +3,14 @@ Commande : python manage.py load_initial_data
 Crée les données initiales : Level, DanceStyle, MenuItem (Accueil, Explore, Cours, Événements, Login).
 """
 from django.core.management.base import BaseCommand
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import Level, DanceStyle, MenuItem
 
 
 class Command(BaseCommand):
     help = "Charge les données initiales (Level, DanceStyle, MenuItem)."
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         self.stdout.write("Création des Level...")
         levels_data = [
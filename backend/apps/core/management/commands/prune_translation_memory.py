@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.core.models import TranslationMemory
+
+
+class Command(BaseCommand):
+    help = "Évince / invalide des entrées de la mémoire de traduction et affiche ses compteurs."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--older-than", type=int, default=0, help="Supprime les entrées inutilisées depuis N jours")
+        parser.add_argument("--max-entries", type=int, default=0, help="Garde au plus N entrées (les plus récemment utilisées)")
+        parser.add_argument("--context", default="", help="Invalide une classe de contexte (ex: location_name)")
+        parser.add_argument("--target", default="", help="Restreint --context / --all à une langue cible")
+        parser.add_argument("--all", action="store_true", help="Vide la mémoire (ou une langue avec --target)")
+
+    def handle(self, *args, **options) -> None:
+        qs = TranslationMemory.objects.all()
+        if options["target"]:
+            qs = qs.filter(target_lang=options["target"])
+        deleted = 0
+
+        if options["all"]:
+            deleted += qs.delete()[0]
+        if options["context"]:
+            deleted += qs.filter(context_class=options["context"]).delete()[0]
+        if options["older_than"]:
+            cutoff = timezone.now() - timedelta(days=options["older_than"])
+            deleted += TranslationMemory.objects.filter(last_used_at__lt=cutoff).delete()[0]
+        if options["max_entries"]:
+            keep = list(
+                TranslationMemory.objects.order_by("-last_used_at", "-id").values_list("id", flat=True)[
+                    : options["max_entries"]
+                ]
+            )
+            deleted += TranslationMemory.objects.exclude(id__in=keep).delete()[0]
+
+        stats = TranslationMemory.objects.aggregate(hits=Sum("hit_count"))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Supprimées : {deleted}. Entrées : {TranslationMemory.objects.count()}, "
+                f"hits cumulés : {stats['hits'] or 0}."
+            )
+        )
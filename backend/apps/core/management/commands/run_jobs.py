@@ -0,0 +1,54 @@
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.jobs import claim_next_job, default_worker_name, run_job
+
+
+class Command(BaseCommand):
+    help = "Worker des tâches de fond (BackgroundJob) : traductions admin, etc."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--concurrency", type=int, default=1, help="Tâches exécutées en parallèle par ce worker")
+        parser.add_argument(
+            "--max-running",
+            type=int,
+            default=None,
+            help="Tâches en cours max, tous workers confondus (défaut : settings.JOB_MAX_RUNNING)",
+        )
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Secondes entre deux scrutations")
+        parser.add_argument("--once", action="store_true", help="Vide la file puis s'arrête (cron, tests)")
+
+    def handle(self, *args, **options) -> None:
+        concurrency = max(1, options["concurrency"])
+        max_running = options["max_running"] if options["max_running"] is not None else settings.JOB_MAX_RUNNING
+        worker = default_worker_name()
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+            self.stdout.write("Arrêt demandé : fin des tâches en cours…")
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        self.stdout.write(f"Worker {worker} (concurrence {concurrency}, max en cours {max_running})")
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job") as pool:
+            active = set()
+            while True:
+                active = {f for f in active if not f.done()}
+                claimed = False
+                while not stopping and len(active) < concurrency:
+                    job = claim_next_job(worker, max_running)
+                    if job is None:
+                        break
+                    claimed = True
+                    self.stdout.write(f"→ {job.kind} {job.id}")
+                    active.add(pool.submit(run_job, job))
+                if stopping or (options["once"] and not claimed and not active):
+                    break
+                time.sleep(options["poll_interval"] if not claimed else 0.1)
@@ -1,10 +1,12 @@
 from django.core.management.base import BaseCommand
+from apps.core.content_cache import deferred_generation_bumps
 from apps.organization.models import OrganizationNode
 from apps.core.models import Level, DanceStyle, DanceProfession
 
 class Command(BaseCommand):
     help = "Initialise la hiérarchie des planètes (OrganizationNodes) et les données de base (Styles, Niveaux)."
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         # 1. Styles de danse
         bachata, _ = DanceStyle.objects.get_or_create(slug="bachata", defaults={"name": "Bachata"})
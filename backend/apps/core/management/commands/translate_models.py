@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
 from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Q
+from modeltranslation.settings import DEFAULT_LANGUAGE as SOURCE_LANGUAGE
 
-from google import genai
-
-from apps.core.gemini_utils import gemini_error_message
+from apps.core.models import TranslationFingerprint
+from apps.core.translation_engine import (
+    TranslationEngine,
+    TranslationTask,
+    get_translation_provider,
+)
+from apps.core.translation_fingerprints import record_translations, stale_fingerprints
+from apps.core.translation_memory import TranslationMemoryStore
 
 
 @dataclass(frozen=True)
@@ -82,11 +88,44 @@ TRANSLATION_TARGETS: tuple[TranslationTarget, ...] = (
 )
 
 
+def _empty_q(column: str) -> Q:
+    return Q(**{f"{column}__isnull": True}) | Q(**{column: ""})
+
+
+def missing_translation_q(fields, target: str) -> Q:
+    """Lignes où au moins un champ a une source remplie et une cible vide (NULL ou "")."""
+    condition = Q(pk__in=[])
+    for field in fields:
+        condition |= ~_empty_q(f"{field}_{SOURCE_LANGUAGE}") & _empty_q(f"{field}_{target}")
+    return condition
+
+
+def _chunked(queryset, chunk_size: int):
+    """
+    Parcours par paquets triés par pk (WHERE pk > dernier). Contrairement à un curseur
+    ouvert, les lignes traduites et sauvegardées entre deux paquets ne perturbent pas la lecture.
+    """
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1].pk
+
+
 class Command(BaseCommand):
     help = "Translate les champs modeltranslation manquants via Gemini Flash."
+    # Passés par call_command depuis une tâche de fond (apps/core/jobs.py).
+    stealth_options = ("progress", "should_stop")
 
     def add_arguments(self, parser) -> None:
-        parser.add_argument("--target", required=True, choices=["en", "es"], help="Langue cible")
+        parser.add_argument(
+            "--target",
+            required=True,
+            help="Langue(s) cible(s) : en, es ou en,es (toutes traduites dans la même requête packée)",
+        )
         parser.add_argument("--model", default="", help="Optionnel : app_label.ModelName (ex: courses.Course)")
         parser.add_argument(
             "--fields",
@@ -95,38 +134,164 @@ class Command(BaseCommand):
         )
         parser.add_argument("--limit", type=int, default=20, help="Nombre max d'objets à traiter")
         parser.add_argument("--dry-run", action="store_true", help="Ne sauvegarde rien")
+        parser.add_argument(
+            "--provider",
+            default="",
+            help="gemini (défaut, ou TRANSLATION_PROVIDER) ou fake (traducteur local pour mesurer)",
+        )
+        parser.add_argument("--workers", type=int, default=4, help="Appels de traduction simultanés")
+        parser.add_argument("--rate", type=float, default=5.0, help="Appels max par seconde (0 = illimité)")
+        parser.add_argument("--max-retries", type=int, default=4, help="Nouveaux essais sur quota / erreur serveur")
+        parser.add_argument("--batch-size", type=int, default=50, help="Objets sauvegardés par transaction")
+        parser.add_argument(
+            "--fake-latency",
+            type=float,
+            default=0.0,
+            help="Latence simulée par appel (secondes) avec --provider fake",
+        )
+        parser.add_argument("--chunk-size", type=int, default=200, help="Lignes lues par requête de sélection")
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Ignore les traductions périmées (source FR modifiée depuis la traduction)",
+        )
+        parser.add_argument(
+            "--record-baseline",
+            action="store_true",
+            help="Enregistre les traductions existantes comme à jour (empreintes) puis s'arrête",
+        )
+        parser.add_argument(
+            "--coverage",
+            action="store_true",
+            help="Affiche seulement les traductions manquantes par modèle / champ (aucun appel)",
+        )
+        parser.add_argument(
+            "--no-pack",
+            action="store_true",
+            help="Une requête par champ et par langue au lieu d'une requête packée par objet",
+        )
+        parser.add_argument(
+            "--no-memory",
+            action="store_true",
+            help="Ne pas consulter ni alimenter la mémoire de traduction",
+        )
 
-    def _gemini_translate(self, *, client: genai.Client, model_name: str, text: str, target_lang: str, context: str) -> str:
+    def _tasks(
+        self, targets, langs: list[str], limit: int, chunk_size: int, include_stale: bool
+    ) -> Iterator[TranslationTask]:
         """
-        Appel Gemini pour traduire un texte court/moyen.
+        Tâches (objet, champ, langue) à traduire, objet par objet, au plus `limit` objets.
+        La sélection est faite en SQL (missing_translation_q, plus les objets dont une
+        empreinte est périmée) et lue par paquets de `chunk_size` lignes triées par pk,
+        avec les seules colonnes source / cibles.
         """
-        prompt = (
-            f"Tu es un traducteur professionnel.\n"
-            f"Contexte du champ : {context}\n"
-            f"Langue cible : {target_lang}\n\n"
-            f"Règles :\n"
-            f"- Traduire uniquement.\n"
-            f"- Conserver la mise en forme (Markdown si présent) et les retours à la ligne.\n"
-            f"- Ne pas altérer les slugs / codes / URLs.\n\n"
-            f"Texte à traduire :\n{text}"
-        )
+        selected = 0
+        for t in targets:
+            Model = apps.get_model(t.app_label, t.model_name)
+            columns = [f"{field}_{lang}" for field in t.fields for lang in (SOURCE_LANGUAGE, *langs)]
+            condition = Q(pk__in=[])
+            stale = set()
+            for lang in langs:
+                condition |= missing_translation_q(t.fields, lang)
+                if include_stale:
+                    stale |= {
+                        (object_id, field, lang)
+                        for object_id, field in stale_fingerprints(Model, lang, t.fields).values_list(
+                            "object_id", "field"
+                        )
+                    }
+            if stale:
+                condition |= Q(pk__in=sorted({object_id for object_id, _, _ in stale}))
+            qs = Model.objects.filter(condition).only(*columns).order_by("pk")
+
+            for obj in _chunked(qs, chunk_size):
+                tasks = []
+                for field in t.fields:
+                    source_val = getattr(obj, f"{field}_{SOURCE_LANGUAGE}", None)
+                    if not source_val:
+                        continue
+                    for lang in langs:
+                        current = getattr(obj, f"{field}_{lang}", None)
+                        if current not in (None, "") and (str(obj.pk), field, lang) not in stale:
+                            continue
+                        tasks.append(
+                            TranslationTask(
+                                obj=obj,
+                                field=field,
+                                text=str(source_val),
+                                target=lang,
+                                context=f"{t.app_label}.{t.model_name}.{field}",
+                            )
+                        )
+                if not tasks:
+                    continue
+                yield from tasks
+                selected += 1
+                if selected >= limit:
+                    return
 
-        try:
-            resp = client.models.generate_content(
-                model=model_name,
-                contents=prompt,
+    def _coverage(self, targets, target: str) -> None:
+        """
+        Traductions manquantes et périmées par modèle et champ : une requête d'agrégat
+        par modèle, plus une sur les empreintes.
+        """
+        self.stdout.write(f"Couverture {SOURCE_LANGUAGE} → {target} (manquants / sources remplies, périmés)")
+        total_missing = total_stale = 0
+        for t in targets:
+            Model = apps.get_model(t.app_label, t.model_name)
+            aggregates = {}
+            for field in t.fields:
+                source_filled = ~_empty_q(f"{field}_{SOURCE_LANGUAGE}")
+                aggregates[f"{field}__filled"] = Count("pk", filter=source_filled)
+                aggregates[f"{field}__missing"] = Count("pk", filter=source_filled & _empty_q(f"{field}_{target}"))
+            counts = Model.objects.aggregate(**aggregates)
+            stale_counts = dict(
+                stale_fingerprints(Model, target, t.fields).values_list("field").annotate(n=Count("pk"))
             )
-        except Exception as e:
-            msg = str(e)
-            raise RuntimeError(
-                gemini_error_message(msg, api_key=api_key, model_name=model_name)
-            ) from e
+            for field in t.fields:
+                filled, missing = counts[f"{field}__filled"], counts[f"{field}__missing"]
+                stale = stale_counts.get(field, 0)
+                total_missing += missing
+                total_stale += stale
+                percent = 100.0 * (filled - missing) / filled if filled else 100.0
+                self.stdout.write(
+                    f"  {t.app_label}.{t.model_name}.{field:<28} {missing:>6} / {filled:<6} "
+                    f"({percent:5.1f} % traduits), {stale} périmé(s)"
+                )
+        self.stdout.write(self.style.SUCCESS(f"Total manquants : {total_missing}, périmés : {total_stale}"))
 
-        # SDK expose généralement `text`
-        return (getattr(resp, "text", None) or str(resp)).strip()
+    def _record_baseline(self, targets, target: str, chunk_size: int) -> None:
+        """Enregistre comme à jour les traductions existantes qui n'ont pas encore d'empreinte."""
+        recorded = 0
+        for t in targets:
+            Model = apps.get_model(t.app_label, t.model_name)
+            columns = [f"{field}_{lang}" for field in t.fields for lang in (SOURCE_LANGUAGE, target)]
+            filled = Q(pk__in=[])
+            for field in t.fields:
+                filled |= ~_empty_q(f"{field}_{SOURCE_LANGUAGE}") & ~_empty_q(f"{field}_{target}")
+            qs = Model.objects.filter(filled).only(*columns).order_by("pk")
+            known = set(
+                TranslationFingerprint.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Model), target_lang=target
+                ).values_list("object_id", "field")
+            )
+            for obj in _chunked(qs, chunk_size):
+                entries = [
+                    (field, target, None)
+                    for field in t.fields
+                    if getattr(obj, f"{field}_{SOURCE_LANGUAGE}", None)
+                    and getattr(obj, f"{field}_{target}", None) not in (None, "")
+                    and (str(obj.pk), field) not in known
+                ]
+                if entries:
+                    record_translations(obj, entries)
+                    recorded += len(entries)
+        self.stdout.write(self.style.SUCCESS(f"Empreintes enregistrées : {recorded}"))
 
     def handle(self, *args: Any, **options: Any) -> None:
-        target: str = options["target"]
+        langs = list(dict.fromkeys(lang.strip().lower() for lang in options["target"].split(",") if lang.strip()))
+        if not langs or any(lang not in ("en", "es") for lang in langs):
+            raise RuntimeError("--target attendu : en, es ou en,es")
         model_filter: str = options["model"].strip()
         fields_filter_raw: str = options.get("fields") or ""
         fields_filter = tuple(
@@ -135,13 +300,6 @@ class Command(BaseCommand):
         limit: int = options["limit"]
         dry_run: bool = bool(options["dry_run"])
 
-        api_key = os.getenv("GEMINI_API_KEY") or ""
-        if not api_key:
-            raise RuntimeError("Missing GEMINI_API_KEY environment variable")
-
-        model_name = os.getenv("GEMINI_MODEL_NAME") or "gemini-2.5-flash"
-        client = genai.Client(api_key=api_key)
-
         # Filtre cibles
         targets = TRANSLATION_TARGETS
         if model_filter:
@@ -169,63 +327,50 @@ class Command(BaseCommand):
                     f"Aucun champ ne correspond à --fields pour --model={model_filter or '<vide>'}"
                 )
 
-        translated_count = 0
+        if options["coverage"]:
+            for lang in langs:
+                self._coverage(targets, lang)
+            return
+        if options["record_baseline"]:
+            for lang in langs:
+                self._record_baseline(targets, lang, max(1, options["chunk_size"]))
+            return
 
-        for t in targets:
-            Model = apps.get_model(t.app_label, t.model_name)
+        provider_name = options["provider"].strip() or None
+        provider_kwargs = {}
+        if (provider_name or "").lower() == "fake":
+            provider_kwargs["latency"] = options["fake_latency"]
+        provider = get_translation_provider(provider_name, **provider_kwargs)
 
-            # Construction d'un queryset d'objets où au moins un champ cible n'est pas rempli
-            # (on se limite à la base : champs *_<target>).
-            # Note : on fait un check "OR" minimal.
-            filter_kwargs = {}
-            for field in t.fields:
-                filter_kwargs[f"{field}_{target}__isnull"] = True
-                # On ne peut pas faire un OR simple sans Q ; on traite brut en itérant
-                # et en checkant la valeur après coup.
-                # (On garde filter_kwargs vide pour éviter des erreurs si besoin d'élargissement)
-            # queryset simple, puis filtrage côté python
-            qs = Model.objects.all()[:limit]
-
-            for obj in qs:
-                # Vérifier si besoin de traduire
-                need_any = False
-                for field in t.fields:
-                    if getattr(obj, f"{field}_{target}", None) in (None, ""):
-                        need_any = True
-                        break
-                if not need_any:
-                    continue
-
-                with transaction.atomic():
-                    for field in t.fields:
-                        current = getattr(obj, f"{field}_{target}", None)
-                        if current not in (None, ""):
-                            continue
-
-                        source_val = getattr(obj, field, None)
-                        if not source_val:
-                            continue
-
-                        context = f"{t.app_label}.{t.model_name}.{field}"
-                        translated = self._gemini_translate(
-                            client=client,
-                            api_key=api_key,
-                            model_name=model_name,
-                            text=str(source_val),
-                            target_lang=target,
-                            context=context,
-                        )
-                        setattr(obj, f"{field}_{target}", translated)
-
-                    if not dry_run:
-                        obj.save()
-
-                translated_count += 1
-                if translated_count >= limit:
-                    break
-
-            if translated_count >= limit:
-                break
-
-        self.stdout.write(self.style.SUCCESS(f"Done. Updated objects: {translated_count}"))
+        engine = TranslationEngine(
+            provider,
+            workers=options["workers"],
+            rate=options["rate"],
+            max_retries=options["max_retries"],
+            write_batch_size=options["batch_size"],
+            dry_run=dry_run,
+            memory=None if options["no_memory"] else TranslationMemoryStore(),
+            on_progress=options.get("progress"),
+            should_stop=options.get("should_stop"),
+            pack=not options["no_pack"],
+        )
+        report = engine.run(
+            self._tasks(
+                targets, langs, limit, max(1, options["chunk_size"]), include_stale=not options["missing_only"]
+            )
+        )
 
+        if report.cancelled:
+            self.stdout.write(self.style.WARNING("Interrompu : annulation demandée."))
+        for task, error in report.failures:
+            self.stderr.write(f"{task.context} pk={task.obj.pk} : {error}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. Updated objects: {report.objects_updated} "
+                f"(fields: {report.fields_translated}, calls: {report.provider_calls}, "
+                f"packed: {report.packed_requests} (fallbacks: {report.pack_fallbacks}), "
+                f"memory hits: {report.memory_hits}, deduplicated: {report.deduplicated}, "
+                f"retries: {report.retries}, failures: {len(report.failures)}, "
+                f"provider: {provider.name}, {report.elapsed:.1f}s)"
+            )
+        )
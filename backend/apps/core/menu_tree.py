@@ -0,0 +1,48 @@
+"""
+Arbre du menu navbar (GET /api/menu/items/) construit en une seule requête SQL.
+
+Tous les MenuItem actifs sont chargés d'un coup puis rattachés à leur parent en mémoire ;
+le résultat sérialisé est mis en cache par langue et par génération « menu »
+(voir apps/core/content_cache.py), donc recalculé seulement après une écriture.
+"""
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.utils import translation
+
+from .content_cache import CONTENT_CACHE_TIMEOUT, get_generations
+from .models import MenuItem
+from .serializers import MenuItemSerializer
+
+
+def menu_children_map(items) -> dict:
+    """
+    {parent_id: [enfants]} en conservant l'ordre de `items` (déjà trié par order).
+    Mêmes règles que l'ancien get_children : un enfant doit être actif ET visible,
+    et un enfant exclu emporte tout son sous-arbre.
+    """
+    children = defaultdict(list)
+    for item in items:
+        if item.parent_id is not None and item.is_visible:
+            children[item.parent_id].append(item)
+    return children
+
+
+def build_menu_tree(lang: str) -> list:
+    """Sérialise les racines actives et leurs descendants (1 requête, quelle que soit la profondeur)."""
+    items = list(MenuItem.objects.filter(is_active=True).order_by("order"))
+    roots = [item for item in items if item.parent_id is None]
+    context = {"menu_children": menu_children_map(items)}
+    with translation.override(lang):
+        return MenuItemSerializer(roots, many=True, context=context).data
+
+
+def get_menu_tree(lang: str) -> list:
+    """Arbre du menu pour une langue, servi depuis le cache tant que la génération « menu » ne bouge pas."""
+    generation = get_generations(("menu",))["menu"]
+    key = f"menu_tree:{lang}:{generation}"
+    tree = cache.get(key)
+    if tree is None:
+        tree = build_menu_tree(lang)
+        cache.set(key, tree, CONTENT_CACHE_TIMEOUT)
+    return tree
@@ -0,0 +1,18 @@
+from typing import Callable
+
+from .content_cache import deferred_generation_bumps
+
+
+class ContentInvalidationMiddleware:
+    """
+    Regroupe les invalidations du cache public déclenchées pendant une requête : une écriture
+    admin qui sauvegarde plusieurs objets d'une même famille n'incrémente sa génération
+    qu'une fois, en fin de requête (après le commit si une transaction est encore ouverte).
+    """
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with deferred_generation_bumps():
+            return self.get_response(request)
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_seed_identite_adn_festival_markdown'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(max_length=64)),
+                ('target_lang', models.CharField(max_length=10)),
+                ('context_class', models.CharField(max_length=100)),
+                ('source_text', models.TextField()),
+                ('translated_text', models.TextField()),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Mémoire de traduction',
+                'verbose_name_plural': 'Mémoire de traduction',
+                'constraints': [models.UniqueConstraint(fields=('source_hash', 'target_lang', 'context_class'), name='unique_translation_memory_entry')],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0028_translationmemory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(max_length=64)),
+                ('field', models.CharField(max_length=100)),
+                ('target_lang', models.CharField(max_length=10)),
+                ('source_hash', models.CharField(max_length=64)),
+                ('translated_hash', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Empreinte de traduction',
+                'verbose_name_plural': 'Empreintes de traduction',
+                'indexes': [models.Index(fields=['content_type', 'target_lang', 'field'], name='translation_fp_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'field', 'target_lang'), name='unique_translation_fingerprint')],
+            },
+        ),
+    ]
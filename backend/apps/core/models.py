@@ -1,6 +1,7 @@
 """
 Modèles Core — BaseModel abstrait, DanceStyle, Level, DanceProfession,
-SiteConfiguration, MenuItem, Bulletin, FaqItem, PendingContentEdit.
+SiteConfiguration, MenuItem, Bulletin, FaqItem, PendingContentEdit, TranslationMemory,
+TranslationFingerprint, BackgroundJob.
 Alignés sur le MCD Phase 1 (sections 1.1).
 """
 import uuid
@@ -488,3 +489,113 @@ class PendingContentEdit(models.Model):
 
     def __str__(self):
         return f"{self.get_content_type_display()} ({self.object_id or 'config'}) — {self.get_status_display()}"
+
+
+class TranslationMemory(models.Model):
+    """
+    Mémoire de traduction : texte source normalisé (hash) + langue cible + classe de contexte
+    (nom du champ : location_name, cta_text, name…) → traduction déjà obtenue.
+    Consultée avant tout appel au fournisseur (apps/core/translation_memory.py).
+    """
+
+    source_hash = models.CharField(max_length=64)
+    target_lang = models.CharField(max_length=10)
+    context_class = models.CharField(max_length=100)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Mémoire de traduction"
+        verbose_name_plural = "Mémoire de traduction"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_hash", "target_lang", "context_class"],
+                name="unique_translation_memory_entry",
+            )
+        ]
+
+    def __str__(self):
+        return f"[{self.target_lang}] {self.context_class} : {self.source_text[:60]}"
+
+
+class TranslationFingerprint(models.Model):
+    """
+    Empreinte de la source d'une traduction : pour un champ d'un objet et une langue cible,
+    hash de la source FR au moment de la traduction (translated_hash) et hash de la source
+    FR actuelle (source_hash, tenu à jour à chaque save). Différents → traduction périmée.
+    Voir apps/core/translation_fingerprints.py.
+    """
+
+    content_type = models.ForeignKey("contenttypes.ContentType", on_delete=models.CASCADE)
+    object_id = models.CharField(max_length=64)
+    field = models.CharField(max_length=100)
+    target_lang = models.CharField(max_length=10)
+    source_hash = models.CharField(max_length=64)
+    translated_hash = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Empreinte de traduction"
+        verbose_name_plural = "Empreintes de traduction"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "field", "target_lang"],
+                name="unique_translation_fingerprint",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["content_type", "target_lang", "field"], name="translation_fp_lookup_idx"),
+        ]
+
+    @property
+    def is_stale(self) -> bool:
+        return self.source_hash != self.translated_hash
+
+    def __str__(self):
+        return f"{self.content_type.model}:{self.object_id}.{self.field} [{self.target_lang}]"
+
+
+class BackgroundJob(models.Model):
+    """
+    Tâche de fond en base (sans broker) : créée par une vue admin, exécutée par
+    `python manage.py run_jobs`. Voir apps/core/jobs.py.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "En file"
+        RUNNING = "running", "En cours"
+        SUCCEEDED = "succeeded", "Terminée"
+        FAILED = "failed", "Échec"
+        CANCELLED = "cancelled", "Annulée"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=64)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED, db_index=True)
+    progress = models.JSONField(default=dict, blank=True)
+    output = models.TextField(blank=True)
+    error = models.TextField(blank=True)
+    cancel_requested = models.BooleanField(default=False)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="background_jobs",
+    )
+    worker = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Tâche de fond"
+        verbose_name_plural = "Tâches de fond"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.kind} ({self.get_status_display()})"
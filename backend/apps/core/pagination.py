@@ -0,0 +1,162 @@
+"""
+Pagination par curseur (keyset), opt-in, pour les listes publiques.
+
+Sans ?limit ni ?cursor la réponse reste la liste complète (compatibilité front actuel), sauf
+pour les listes sans borne naturelle (always=True : /api/agenda/) toujours paginées.
+Avec ?limit=N (plafonné) et/ou ?cursor=… :
+    {"results": [...], "next_cursor": "…" | null, "next": "<url>" | null}
+
+Le curseur encode les valeurs des champs de tri de la dernière ligne (tri existant de la vue
+ou Meta.ordering, complété par pk) : la page suivante est un WHERE (a, b, pk) > (…) et non un
+OFFSET, donc stable quand des lignes sont ajoutées et de coût constant quelle que soit la page.
+"""
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Model, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+KEYSET_DEFAULT_LIMIT = 50
+KEYSET_MAX_LIMIT = 200
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder tronque les datetimes à la milliseconde : sur un tri par date-heure,
+    # le curseur tomberait avant la dernière ligne et la page suivante la répéterait.
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _ordering_of(queryset):
+    """Champs de tri ("-a", "b__c", …) de la queryset, complétés par pk pour l'unicité."""
+    ordering = [o for o in queryset.query.order_by if isinstance(o, str)]
+    if not ordering and queryset.query.default_ordering:
+        # Repasser par order_by() : modeltranslation y réécrit "name" en "name_<lang>",
+        # comme pour un tri explicite de la vue (le filtre du curseur vise la même colonne).
+        meta = [o for o in queryset.model._meta.ordering if isinstance(o, str)]
+        ordering = [o for o in queryset.order_by(*meta).query.order_by if isinstance(o, str)]
+    ordering = [o for o in ordering if o.lstrip("-") != "?"]
+    if not any(o.lstrip("-") in ("pk", "id", queryset.model._meta.pk.name) for o in ordering):
+        ordering.append("pk")
+    return ordering
+
+
+def _value_at(obj, path):
+    for part in path.split("__"):
+        if obj is None:
+            return None
+        obj = getattr(obj, part)
+    # Tri sur une clé étrangère ("pole") : on compare sur sa clé primaire.
+    return obj.pk if isinstance(obj, Model) else obj
+
+
+def _after(ordering, values):
+    """
+    Q « strictement après `values` » pour un tri où les NULL sont toujours en fin
+    (asc et desc) : (a > x) OR (a = x AND b > y) OR …
+    """
+    condition = Q(pk__in=[])
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-")
+        if value is None:
+            # Rien n'est « après » NULL sur ce champ ; seule l'égalité continue la chaîne.
+            equal &= Q(**{f"{name}__isnull": True})
+            continue
+        step = Q(**{f"{name}__{'lt' if descending else 'gt'}": value}) | Q(**{f"{name}__isnull": True})
+        condition |= equal & step
+        equal &= Q(**{name: value})
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    """
+    Utilisable comme pagination_class DRF (ViewSets) ou via keyset_paginated_response()
+    dans une APIView. paginate_queryset() renvoie None tant que le client n'a pas opté
+    (sauf always=True).
+    """
+
+    always = False
+    default_limit = KEYSET_DEFAULT_LIMIT
+    max_limit = KEYSET_MAX_LIMIT
+    invalid_cursor_message = "Curseur de pagination invalide."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if not self.always and "limit" not in params and "cursor" not in params:
+            return None
+        self.request = request
+        self.limit = self._limit(params.get("limit"))
+        self.ordering = _ordering_of(queryset)
+
+        queryset = queryset.order_by(
+            *[
+                F(o[1:]).desc(nulls_last=True) if o.startswith("-") else F(o).asc(nulls_last=True)
+                for o in self.ordering
+            ]
+        )
+        cursor = params.get("cursor")
+        if cursor:
+            queryset = queryset.filter(_after(self.ordering, self._decode(cursor)))
+
+        rows = list(queryset[: self.limit + 1])
+        page = rows[: self.limit]
+        self.next_cursor = None
+        if len(rows) > self.limit:
+            last = page[-1]
+            self.next_cursor = self._encode([_value_at(last, o.lstrip("-")) for o in self.ordering])
+        return page
+
+    def get_paginated_response(self, data):
+        next_url = None
+        if self.next_cursor:
+            url = self.request.build_absolute_uri()
+            next_url = replace_query_param(url, "cursor", self.next_cursor)
+            next_url = replace_query_param(next_url, "limit", self.limit)
+        return Response({"results": data, "next_cursor": self.next_cursor, "next": next_url})
+
+    def _limit(self, raw):
+        try:
+            limit = int(raw) if raw not in (None, "") else self.default_limit
+        except (TypeError, ValueError):
+            limit = self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def _encode(self, values):
+        payload = json.dumps({"o": self.ordering, "v": values}, cls=_CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def _decode(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw.decode("utf-8"))
+            values = payload["v"]
+            ordering = payload["o"]
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        # Un curseur n'est valable que pour le tri qui l'a produit.
+        if ordering != self.ordering or not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+
+def keyset_paginated_response(request, queryset, serialize, always=False):
+    """
+    Pour les APIView : `serialize(iterable) -> données`. Sans opt-in (ni always),
+    Response(serialize(queryset)) comme avant ; sinon la page et les curseurs.
+    """
+    paginator = KeysetPagination()
+    paginator.always = always
+    page = paginator.paginate_queryset(queryset, request)
+    if page is None:
+        return Response(serialize(queryset))
+    return paginator.get_paginated_response(serialize(page))
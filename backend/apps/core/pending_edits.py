@@ -1,14 +1,28 @@
 """
 Application d'une modification en attente (PendingContentEdit) sur l'objet cible.
 Appelé lorsqu'un admin approuve la demande.
+
+Les demandes visant le même objet sont appliquées ensemble (apply_pending_edit_group) :
+payloads fusionnés dans l'ordre, objet chargé et sauvegardé une seule fois
+(save(update_fields=...) sur les seuls champs modifiés). review_pending_edits() traite un
+lot (approbation / refus en masse) groupe par groupe, chacun dans sa transaction.
 """
+from collections import defaultdict
+
+from django.db import transaction
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.conf import settings
 
 from django.contrib.auth import get_user_model
+from modeltranslation.settings import DEFAULT_LANGUAGE as SOURCE_LANGUAGE
+from modeltranslation.utils import build_localized_fieldname, get_language
 
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import PendingContentEdit, SiteConfiguration, Bulletin
 from apps.core.profile_external_links import normalize_external_links
+from apps.core.singletons import site_configuration_for_update
+from apps.core.translation_fingerprints import record_translations, translated_fields
 
 User = get_user_model()
 
@@ -37,156 +51,258 @@ def _apply_siteconfig_translated_payload(config: SiteConfiguration, payload: dic
     config.save()
 
 
-def apply_pending_edit(edit: PendingContentEdit) -> None:
-    """
-    Applique le payload d'une PendingContentEdit sur l'objet concerné.
-    Lève ValueError si content_type ou object_id invalide.
-    """
-    ct = edit.content_type
-    oid = (edit.object_id or "").strip()
-    payload = edit.payload or {}
-
-    if ct == PendingContentEdit.ContentType.SITECONFIG:
-        config = SiteConfiguration.objects.first()
-        if not config:
-            config = SiteConfiguration.objects.create()
-        raw = dict(edit.payload or {})
-        # Traductions multi-langues soumises par le staff (validation admin)
-        if raw.get("kind") == "translation" and isinstance(
-            raw.get("translation_proposal"), dict
-        ):
-            proposal = raw["translation_proposal"]
-            for lang, fields in proposal.items():
-                if lang not in ("en", "es"):
-                    continue
-                if not isinstance(fields, dict):
-                    continue
-                filtered = {
-                    k: v
-                    for k, v in fields.items()
-                    if k in SITE_CONFIG_MARKDOWN_PATCH_KEYS
-                }
-                if filtered:
-                    _apply_siteconfig_translated_payload(config, filtered, lang)
-            return
-        lang = raw.pop("_lang", None) or "fr"
-        if lang not in TRANSLATION_LANGS:
-            lang = "fr"
-        filtered = {
-            k: v
-            for k, v in raw.items()
-            if k in SITE_CONFIG_MARKDOWN_PATCH_KEYS
-        }
-        _apply_siteconfig_translated_payload(config, filtered, lang)
-        return
+class _MergedEdit:
+    """Modifications cumulées de plusieurs demandes sur un objet, sauvegardées en une fois."""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.fields = set()
+        self.translated = []
+
+    def set(self, field, value):
+        setattr(self.obj, field, value)
+        self.fields.add(field)
+        if field in translated_fields(type(self.obj)):
+            # Le descripteur modeltranslation écrit aussi la colonne de la langue active.
+            self.fields.add(build_localized_fieldname(field, get_language()))
+
+    def set_translation(self, field, lang, value):
+        self.set(f"{field}_{lang}", value)
+        # Source FR au moment de la proposition (une demande suivante du groupe peut la changer).
+        self.translated.append((field, lang, getattr(self.obj, f"{field}_{SOURCE_LANGUAGE}", "") or ""))
 
-    if ct == PendingContentEdit.ContentType.BULLETIN:
-        bulletin = Bulletin.objects.get(slug=oid)
-        raw = dict(edit.payload or {})
-        if raw.get("kind") == "translation" and isinstance(raw.get("translation_proposal"), dict):
-            proposal = raw["translation_proposal"]
-            for lang, fields in proposal.items():
-                if lang not in ("en", "es"):
-                    continue
-                if not isinstance(fields, dict):
-                    continue
-                for k in ("title", "content_markdown"):
-                    if k in fields:
-                        setattr(bulletin, f"{k}_{lang}", fields[k])
-            bulletin.save()
+    def save(self):
+        if not self.fields:
             return
-        lang = raw.pop("_lang", None) or "fr"
-        if lang not in TRANSLATION_LANGS:
-            lang = "fr"
-        if "title" in raw:
-            setattr(bulletin, f"title_{lang}", raw["title"])
-        if "content_markdown" in raw:
-            setattr(bulletin, f"content_markdown_{lang}", raw["content_markdown"])
-        if "slug" in raw:
-            bulletin.slug = raw["slug"]
-        if "published_at" in raw:
-            bulletin.published_at = raw["published_at"]
-        if "is_published" in raw:
-            bulletin.is_published = raw["is_published"]
-        bulletin.save()
+        update_fields = set(self.fields)
+        if any(f.name == "updated_at" for f in self.obj._meta.concrete_fields):
+            update_fields.add("updated_at")
+        self.obj.save(update_fields=sorted(update_fields))
+        if self.translated:
+            record_translations(self.obj, self.translated)
+
+
+def _translation_proposal(raw: dict):
+    """(langue, {champ: valeur}) d'une proposition de traduction staff, None si ce n'en est pas une."""
+    if raw.get("kind") != "translation" or not isinstance(raw.get("translation_proposal"), dict):
+        return None
+    return [
+        (lang, fields)
+        for lang, fields in raw["translation_proposal"].items()
+        if lang in ("en", "es") and isinstance(fields, dict)
+    ]
+
+
+def _edit_lang(raw: dict) -> str:
+    lang = raw.pop("_lang", None) or "fr"
+    return lang if lang in TRANSLATION_LANGS else "fr"
+
+
+def _merge_siteconfig(merged: _MergedEdit, raw: dict) -> None:
+    proposal = _translation_proposal(raw)
+    if proposal is not None:
+        for lang, fields in proposal:
+            for k, v in fields.items():
+                if k in SITE_CONFIG_MARKDOWN_PATCH_KEYS:
+                    merged.set_translation(k, lang, v)
         return
+    lang = _edit_lang(raw)
+    for k in SITE_CONFIG_MARKDOWN_PATCH_KEYS:
+        if k in raw:
+            merged.set(f"{k}_{lang}", raw[k])
 
-    if ct == PendingContentEdit.ContentType.USER_ARTIST_BIO:
-        user = User.objects.get(pk=int(oid))
-        raw = dict(edit.payload or {})
-        if raw.get("kind") == "translation" and isinstance(raw.get("translation_proposal"), dict):
-            proposal = raw["translation_proposal"]
-            for lang, fields in proposal.items():
-                if lang not in ("en", "es"):
-                    continue
-                if not isinstance(fields, dict):
-                    continue
-                if "bio" in fields:
-                    setattr(user, f"bio_{lang}", fields["bio"])
-            user.save()
+
+def _merge_bulletin(merged: _MergedEdit, raw: dict) -> None:
+    proposal = _translation_proposal(raw)
+    if proposal is not None:
+        for lang, fields in proposal:
+            for k in ("title", "content_markdown"):
+                if k in fields:
+                    merged.set_translation(k, lang, fields[k])
         return
+    lang = _edit_lang(raw)
+    for k in ("title", "content_markdown"):
+        if k in raw:
+            merged.set(f"{k}_{lang}", raw[k])
+    for k in ("slug", "published_at", "is_published"):
+        if k in raw:
+            merged.set(k, raw[k])
+
+
+def _merge_artist_bio(merged: _MergedEdit, raw: dict) -> None:
+    for lang, fields in _translation_proposal(raw) or ():
+        if "bio" in fields:
+            merged.set_translation("bio", lang, fields["bio"])
+
+
+ORGANIZATION_NODE_EDITABLE_FIELDS = (
+    "name", "description", "short_description", "content",
+    "cta_text", "cta_url", "cover_image", "video_url",
+    "planet_color", "orbit_radius", "orbit_speed", "planet_scale",
+    "planet_type", "visual_source", "is_visible_3d", "external_links",
+)
+
+
+def _merge_organization_node(merged: _MergedEdit, raw: dict) -> None:
+    for field in ORGANIZATION_NODE_EDITABLE_FIELDS:
+        if field not in raw:
+            continue
+        if field == "external_links":
+            merged.set(field, normalize_external_links(raw[field]))
+        else:
+            merged.set(field, raw[field])
+
+
+def _merge_project(merged: _MergedEdit, raw: dict) -> None:
+    for key, value in raw.items():
+        if hasattr(merged.obj, key):
+            merged.set(key, value)
+
+
+def _load_organization_node(oid):
+    from apps.organization.models import OrganizationNode
+
+    return OrganizationNode.objects.get(slug=oid)
+
+
+def _load_project(oid):
+    from apps.projects.models import Project
+
+    return Project.objects.get(slug=oid)
+
+
+# Type → (chargement de l'objet cible depuis object_id, fusion d'un payload).
+_MERGERS = {
+    PendingContentEdit.ContentType.SITECONFIG: (lambda oid: site_configuration_for_update(), _merge_siteconfig),
+    PendingContentEdit.ContentType.BULLETIN: (lambda oid: Bulletin.objects.get(slug=oid), _merge_bulletin),
+    PendingContentEdit.ContentType.USER_ARTIST_BIO: (lambda oid: User.objects.get(pk=int(oid)), _merge_artist_bio),
+    PendingContentEdit.ContentType.ORGANIZATION_NODE: (_load_organization_node, _merge_organization_node),
+    PendingContentEdit.ContentType.PROJECT: (_load_project, _merge_project),
+}
+
+# Type → (modèle, serializer d'écriture) : payloads fusionnés puis validés par le serializer.
+_SERIALIZED = {
+    PendingContentEdit.ContentType.EVENT: (
+        "apps.events.models.Event",
+        "apps.events.serializers.EventWriteSerializer",
+    ),
+    PendingContentEdit.ContentType.COURSE: (
+        "apps.courses.models.Course",
+        "apps.courses.serializers.CourseWriteSerializer",
+    ),
+    PendingContentEdit.ContentType.THEORY_LESSON: (
+        "apps.courses.models.TheoryLesson",
+        "apps.courses.serializers.TheoryLessonWriteSerializer",
+    ),
+}
+
+
+def pending_edit_target_key(edit: PendingContentEdit) -> tuple:
+    """Objet visé par la demande ; chaque création d'artiste est sa propre cible."""
+    if edit.content_type == PendingContentEdit.ContentType.SITECONFIG:
+        return (edit.content_type, "")
+    if edit.content_type == PendingContentEdit.ContentType.USER_ARTIST_CREATE:
+        return (edit.content_type, f"#{edit.pk}")
+    return (edit.content_type, (edit.object_id or "").strip())
+
+
+def apply_pending_edit_group(edits) -> None:
+    """
+    Applique, dans l'ordre, des demandes visant le même objet (même pending_edit_target_key) :
+    l'objet est chargé une fois, les payloads fusionnés, une seule sauvegarde.
+    Lève ValueError si content_type ou object_id invalide.
+    """
+    first = edits[0]
+    ct = first.content_type
+    oid = (first.object_id or "").strip()
 
     if ct == PendingContentEdit.ContentType.USER_ARTIST_CREATE:
         from apps.users.serializers import ArtistCreateSerializer
 
-        serializer = ArtistCreateSerializer(data=payload)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        for edit in edits:
+            serializer = ArtistCreateSerializer(data=edit.payload or {})
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
         return
 
-    if ct == PendingContentEdit.ContentType.EVENT:
-        from apps.events.models import Event
-        from apps.events.serializers import EventWriteSerializer
-        event = Event.objects.get(slug=oid)
-        serializer = EventWriteSerializer(event, data=payload, partial=True)
+    if ct in _SERIALIZED:
+        model_path, serializer_path = _SERIALIZED[ct]
+        obj = import_string(model_path).objects.get(slug=oid)
+        payload = {}
+        for edit in edits:
+            payload.update(edit.payload or {})
+        serializer = import_string(serializer_path)(obj, data=payload, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return
 
-    if ct == PendingContentEdit.ContentType.COURSE:
-        from apps.courses.models import Course
-        from apps.courses.serializers import CourseWriteSerializer
-        course = Course.objects.get(slug=oid)
-        serializer = CourseWriteSerializer(course, data=payload, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        return
+    if ct not in _MERGERS:
+        raise ValueError(f"Content type non géré: {ct}")
+    load, merge = _MERGERS[ct]
+    merged = _MergedEdit(load(oid))
+    for edit in edits:
+        merge(merged, dict(edit.payload or {}))
+    merged.save()
 
-    if ct == PendingContentEdit.ContentType.THEORY_LESSON:
-        from apps.courses.models import TheoryLesson
-        from apps.courses.serializers import TheoryLessonWriteSerializer
-        lesson = TheoryLesson.objects.get(slug=oid)
-        serializer = TheoryLessonWriteSerializer(lesson, data=payload, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        return
 
-    if ct == PendingContentEdit.ContentType.ORGANIZATION_NODE:
-        from apps.organization.models import OrganizationNode
-        node = OrganizationNode.objects.get(slug=oid)
-        editable = [
-            "name", "description", "short_description", "content",
-            "cta_text", "cta_url", "cover_image", "video_url",
-            "planet_color", "orbit_radius", "orbit_speed", "planet_scale",
-            "planet_type", "visual_source", "is_visible_3d", "external_links",
-        ]
-        for field in editable:
-            if field not in payload:
-                continue
-            if field == "external_links":
-                node.external_links = normalize_external_links(payload[field])
-            else:
-                setattr(node, field, payload[field])
-        node.save()
-        return
+def apply_pending_edit(edit: PendingContentEdit) -> None:
+    """
+    Applique le payload d'une PendingContentEdit sur l'objet concerné.
+    Lève ValueError si content_type ou object_id invalide.
+    """
+    apply_pending_edit_group([edit])
 
-    if ct == PendingContentEdit.ContentType.PROJECT:
-        from apps.projects.models import Project
-        project = Project.objects.get(slug=oid)
-        for key, value in payload.items():
-            if hasattr(project, key):
-                setattr(project, key, value)
-        project.save(update_fields=list(payload.keys()) + ["updated_at"])
-        return
 
-    raise ValueError(f"Content type non géré: {ct}")
+def review_pending_edits(ids, action: str, reviewer) -> list:
+    """
+    Approuve (`approve`) ou refuse (`reject`) un lot de demandes.
+    Les demandes en attente sont groupées par objet cible et appliquées par ordre de création,
+    chaque groupe dans sa transaction (l'échec d'un groupe n'annule pas les autres). Les
+    invalidations du cache public sont regroupées : une par famille pour tout le lot.
+    Renvoie un résultat par id : {"id", "status": approved | rejected | skipped | not_found | error, "error"?}.
+    """
+    Status = PendingContentEdit.Status
+    results = {pk: {"id": pk, "status": "not_found"} for pk in ids}
+    groups = defaultdict(list)
+    for edit in PendingContentEdit.objects.filter(pk__in=ids).order_by("created_at", "pk"):
+        if edit.status != Status.PENDING:
+            results[edit.pk] = {"id": edit.pk, "status": "skipped", "error": f"Déjà traitée ({edit.status})"}
+        elif action == "approve":
+            groups[pending_edit_target_key(edit)].append(edit)
+        else:
+            groups[None].append(edit)  # refus : aucune écriture sur les cibles, un seul lot
+    final = Status.APPROVED if action == "approve" else Status.REJECTED
+
+    with deferred_generation_bumps():
+        for group in groups.values():
+            try:
+                with transaction.atomic():
+                    # Verrou + re-vérification : une demande traitée entre-temps n'est pas rejouée.
+                    still_pending = set(
+                        PendingContentEdit.objects.select_for_update()
+                        .filter(pk__in=[e.pk for e in group], status=Status.PENDING)
+                        .values_list("pk", flat=True)
+                    )
+                    for edit in group:
+                        if edit.pk not in still_pending:
+                            results[edit.pk] = {"id": edit.pk, "status": "skipped", "error": "Déjà traitée"}
+                    group = [e for e in group if e.pk in still_pending]
+                    if not group:
+                        continue
+                    if action == "approve":
+                        apply_pending_edit_group(group)
+                    now = timezone.now()
+                    PendingContentEdit.objects.filter(pk__in=[e.pk for e in group]).update(
+                        status=final, reviewed_by=reviewer, reviewed_at=now, updated_at=now
+                    )
+            except Exception as e:
+                for edit in group:
+                    results[edit.pk] = {
+                        "id": edit.pk,
+                        "status": "error",
+                        "error": f"Erreur lors de l'application: {str(e)}",
+                    }
+                continue
+            for edit in group:
+                results[edit.pk] = {"id": edit.pk, "status": final.lower()}
+    return [results[pk] for pk in ids]
@@ -2,7 +2,9 @@
 Serializers Core — MenuItem récursif (parent → children) pour l’API menu.
 """
 from rest_framework import serializers
+from .fieldsets import SparseFieldsetMixin
 from .models import MenuItem, SiteConfiguration, SiteVideoAmbience, ExplorePreset, Bulletin, PendingContentEdit, FaqItem
+from .singletons import get_video_ambience
 
 
 class PendingContentEditSerializer(serializers.ModelSerializer):
@@ -76,13 +78,15 @@ class SiteConfigurationSerializer(serializers.ModelSerializer):
         return ExplorePresetSerializer(obj.active_explore_preset).data if obj.active_explore_preset else None
 
     def get_video_ambience(self, obj):
-        return SiteVideoAmbienceSerializer(SiteVideoAmbience.get_solo()).data
+        return SiteVideoAmbienceSerializer(get_video_ambience()).data
 
 
 class MenuItemSerializer(serializers.ModelSerializer):
     """
     Serializer récursif : chaque item expose ses children (sous-items).
     Utilisé pour GET /api/menu/items/ (racine parent=None).
+    Avec context["menu_children"] ({parent_id: [enfants]}, voir apps/core/menu_tree.py)
+    les enfants sont lus en mémoire au lieu d'une requête par nœud.
     """
 
     children = serializers.SerializerMethodField()
@@ -93,11 +97,15 @@ class MenuItemSerializer(serializers.ModelSerializer):
 
     def get_children(self, obj):
         """Enfants actifs et visibles dans le sous-menu, triés par order."""
-        children = obj.children.filter(is_active=True, is_visible=True).order_by("order")
-        return MenuItemSerializer(children, many=True).data
+        children_map = self.context.get("menu_children")
+        if children_map is not None:
+            children = children_map.get(obj.pk, [])
+        else:
+            children = obj.children.filter(is_active=True, is_visible=True).order_by("order")
+        return MenuItemSerializer(children, many=True, context=self.context).data
 
 
-class BulletinSerializer(serializers.ModelSerializer):
+class BulletinSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Bulletin
         fields = ("id", "title", "slug", "content_markdown", "published_at", "created_at")
@@ -124,7 +132,7 @@ class BulletinAdminSerializer(serializers.ModelSerializer):
         read_only_fields = ("title_en", "title_es", "content_markdown_en", "content_markdown_es")
 
 
-class FaqItemSerializer(serializers.ModelSerializer):
+class FaqItemSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les entrées FAQ publiques."""
 
     class Meta:
@@ -0,0 +1,48 @@
+"""
+Signaux Core — incrément des générations de contenu (apps/core/content_cache.py)
+à chaque save / delete / changement M2M d'un modèle affiché par l'API publique.
+"""
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .content_cache import CONTENT_FAMILIES, bump_generation, families_for_model
+
+# Écritures qui ne changent aucun payload public (ex. connexion → last_login).
+_IGNORED_UPDATE_FIELDS = frozenset({"last_login"})
+
+
+def _on_save(sender, instance=None, update_fields=None, **kwargs):
+    if update_fields and frozenset(update_fields) <= _IGNORED_UPDATE_FIELDS:
+        return
+    bump_generation(*families_for_model(sender._meta.label))
+
+
+def _on_delete(sender, **kwargs):
+    bump_generation(*families_for_model(sender._meta.label))
+
+
+def _on_m2m_changed(sender, action, **kwargs):
+    if not action.startswith("post_"):
+        return
+    families = set()
+    for field in sender._meta.get_fields():
+        if field.is_relation and field.related_model is not None:
+            families.update(families_for_model(field.related_model._meta.label))
+    bump_generation(*sorted(families))
+
+
+def connect_content_signals():
+    """Branche les receivers sur chaque modèle listé dans CONTENT_FAMILIES (appelé par CoreConfig.ready)."""
+    labels = sorted({label for labels in CONTENT_FAMILIES.values() for label in labels})
+    for label in labels:
+        model = apps.get_model(label)
+        uid = f"content_generation:{label}"
+        post_save.connect(_on_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_delete, sender=model, dispatch_uid=uid)
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            m2m_changed.connect(
+                _on_m2m_changed,
+                sender=through,
+                dispatch_uid=f"content_generation:{through._meta.label}",
+            )
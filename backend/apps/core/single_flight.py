@@ -0,0 +1,125 @@
+"""
+Remplissage du cache sans ruée (« single-flight »), réutilisable par toute vue cachée.
+
+get_or_build(key, build, timeout=…) :
+- hit : l'entrée en cache est servie. À l'approche de son expiration, une requête est tirée
+  au sort pour la recalculer en avance (XFetch : now − δ·β·ln(U) ≥ expiration, δ = durée du
+  dernier calcul) ; les autres continuent de lire l'entrée courante ;
+- miss : un seul thread / processus calcule (verrou `cache.add`, TTL court) ; pendant ce
+  temps les autres servent la dernière valeur connue (`stale_key`, stale-while-revalidate)
+  ou, s'il n'y en a pas, attendent le résultat quelques secondes avant de calculer eux-mêmes.
+
+`build()` lève SkipCache pour ne rien stocker (ex. réponse d'erreur).
+"""
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT_LOCK_TIMEOUT = 10  # s : un calcul plus long laisse passer un second calcul
+SINGLE_FLIGHT_WAIT_TIMEOUT = 5.0  # s d'attente max sans valeur périmée à servir
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+STALE_TIMEOUT = 24 * 60 * 60  # durée de vie de la dernière valeur connue
+
+_metrics = Counter()
+_metrics_lock = threading.Lock()
+
+
+class SkipCache(Exception):
+    """Levée par build() : le résultat ne doit pas être mis en cache."""
+
+
+@dataclass
+class Fill:
+    value: Any
+    state: str  # hit | early | built | stale | waited
+    meta: Any = None
+
+
+def fill_metrics() -> dict:
+    """Nombre de lectures par issue (hit, early, built, stale, waited) pour ce processus."""
+    with _metrics_lock:
+        return dict(_metrics)
+
+
+def _done(fill: Fill) -> Fill:
+    with _metrics_lock:
+        _metrics[fill.state] += 1
+    return fill
+
+
+def _refresh_early(entry: dict, now: float, beta: float) -> bool:
+    if beta <= 0:
+        return False
+    return now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires"]
+
+
+def _build_and_store(key, build, timeout, stale_key, stale_timeout, meta):
+    started = time.monotonic()
+    value = build()
+    entry = {"value": value, "delta": time.monotonic() - started, "expires": time.time() + timeout, "meta": meta}
+    cache.set(key, entry, timeout)
+    if stale_key:
+        cache.set(stale_key, entry, stale_timeout)
+    return entry
+
+
+def get_or_build(
+    key: str,
+    build: Callable[[], Any],
+    *,
+    timeout: int,
+    stale_key: str | None = None,
+    stale_timeout: int = STALE_TIMEOUT,
+    meta: Any = None,
+    beta: float = 1.0,
+    lock_timeout: int = SINGLE_FLIGHT_LOCK_TIMEOUT,
+    wait_timeout: float = SINGLE_FLIGHT_WAIT_TIMEOUT,
+) -> Fill:
+    """
+    Valeur de `key`, calculée par `build()` au plus une fois à la fois. `meta` est stocké avec
+    la valeur et rendu avec elle (ex. validateurs HTTP d'une entrée périmée servie).
+    """
+    lock_key = f"{key}:lock"
+    entry = cache.get(key)
+    if entry is not None:
+        if _refresh_early(entry, time.time(), beta) and cache.add(lock_key, 1, lock_timeout):
+            try:
+                fresh = _build_and_store(key, build, timeout, stale_key, stale_timeout, meta)
+            except SkipCache:
+                fresh = None  # on garde l'entrée courante
+            finally:
+                cache.delete(lock_key)
+            if fresh is not None:
+                return _done(Fill(fresh["value"], "early", fresh["meta"]))
+        return _done(Fill(entry["value"], "hit", entry["meta"]))
+
+    deadline = time.monotonic() + wait_timeout
+    stale = None
+    while True:
+        if cache.add(lock_key, 1, lock_timeout):
+            try:
+                entry = _build_and_store(key, build, timeout, stale_key, stale_timeout, meta)
+            finally:
+                cache.delete(lock_key)
+            return _done(Fill(entry["value"], "built", entry["meta"]))
+        if stale is None and stale_key:
+            stale = cache.get(stale_key)
+            if stale is not None:
+                return _done(Fill(stale["value"], "stale", stale["meta"]))
+        if time.monotonic() >= deadline:
+            logger.warning("single-flight: attente dépassée pour %s, calcul sans verrou", key)
+            entry = _build_and_store(key, build, timeout, stale_key, stale_timeout, meta)
+            return _done(Fill(entry["value"], "built", entry["meta"]))
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return _done(Fill(entry["value"], "waited", entry["meta"]))
@@ -0,0 +1,61 @@
+"""
+Accès aux modèles singleton (pk=1) : SiteConfiguration et SiteVideoAmbience.
+
+Lecture : get_site_configuration() / get_video_ambience() lisent la base au plus une fois
+par génération « config » et par processus (les signaux de apps/core/signals.py incrémentent
+la génération à chaque save). Aucune écriture sur un GET : si la ligne n'existe pas encore,
+on renvoie une instance par défaut non sauvegardée. Les instances renvoyées sont partagées
+entre requêtes : ne pas les modifier.
+
+Écriture : site_configuration_for_update() relit la ligne en base et la crée au besoin
+(admin, pending edits, commandes). L'ambiance vidéo ne s'édite que dans l'admin Django.
+"""
+import threading
+
+from .content_cache import get_generations
+from .models import SiteConfiguration, SiteVideoAmbience
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+def _memoized(name, loader):
+    generation = get_generations(("config",))["config"]
+    entry = _memo.get(name)
+    if entry is not None and entry[0] == generation:
+        return entry[1]
+    with _memo_lock:
+        entry = _memo.get(name)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+        obj = loader()
+        _memo[name] = (generation, obj)
+        return obj
+
+
+def _load_site_configuration():
+    config = SiteConfiguration.objects.select_related("active_explore_preset").order_by("pk").first()
+    return config if config is not None else SiteConfiguration(pk=1)
+
+
+def _load_video_ambience():
+    ambience = SiteVideoAmbience.objects.filter(pk=1).first()
+    return ambience if ambience is not None else SiteVideoAmbience(pk=1)
+
+
+def get_site_configuration() -> SiteConfiguration:
+    """Configuration du site en lecture seule (jamais d'INSERT)."""
+    return _memoized("site_configuration", _load_site_configuration)
+
+
+def get_video_ambience() -> SiteVideoAmbience:
+    """Ambiance vidéo en lecture seule (valeurs par défaut du modèle si absente)."""
+    return _memoized("video_ambience", _load_video_ambience)
+
+
+def site_configuration_for_update() -> SiteConfiguration:
+    """Instance fraîche, créée si besoin, à modifier puis save()."""
+    config = SiteConfiguration.objects.order_by("pk").first()
+    if not config:
+        config = SiteConfiguration.objects.create()
+    return config
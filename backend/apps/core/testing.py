@@ -0,0 +1,35 @@
+"""
+Aides partagées par les tests des apps (ruées concurrentes, clients authentifiés).
+"""
+import threading
+
+from django.db import close_old_connections
+from rest_framework.test import APIClient
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def run_concurrently(calls):
+    """Lance chaque appel dans son thread, départ simultané ; renvoie les résultats (ou exceptions)."""
+    barrier = threading.Barrier(len(calls))
+    results = [None] * len(calls)
+
+    def worker(i, call):
+        try:
+            barrier.wait()
+            results[i] = call()
+        except Exception as e:  # noqa: BLE001 — remonté dans les assertions
+            results[i] = e
+        finally:
+            close_old_connections()
+
+    threads = [threading.Thread(target=worker, args=(i, call)) for i, call in enumerate(calls)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
@@ -0,0 +1,446 @@
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone, translation
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.organization.models import OrganizationNode, Pole
+
+from . import content_cache, pending_edits, single_flight
+from .cache_backends import SQLiteCache
+from .jobs import claim_next_job
+from .menu_tree import build_menu_tree
+from .pagination import KeysetPagination, _ordering_of
+from .models import BackgroundJob, Bulletin, MenuItem, PendingContentEdit
+from .testing import client_for
+
+User = get_user_model()
+
+
+class MenuTreeQueryCountTests(TestCase):
+    """GET /api/menu/items/ : une seule requête SQL quelle que soit la forme de l'arbre."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _chain(self, depth, width, prefix):
+        parents = [None]
+        for level in range(depth):
+            created = []
+            for parent in parents:
+                for i in range(width):
+                    created.append(
+                        MenuItem.objects.create(
+                            name=f"{prefix}-{level}-{i}",
+                            slug=f"{prefix}-{level}-{i}-{len(created)}",
+                            parent=parent,
+                            order=width - i,
+                        )
+                    )
+            parents = created
+
+    def test_build_is_one_query_for_shallow_and_deep_trees(self):
+        self._chain(depth=1, width=2, prefix="shallow")
+        with self.assertNumQueries(1):
+            shallow = build_menu_tree("fr")
+        self.assertEqual(len(shallow), 2)
+
+        MenuItem.objects.all().delete()
+        self._chain(depth=4, width=3, prefix="deep")
+        with self.assertNumQueries(1):
+            deep = build_menu_tree("fr")
+        self.assertEqual(len(deep[0]["children"][0]["children"][0]["children"]), 3)
+
+    def test_visibility_and_order_rules(self):
+        root = MenuItem.objects.create(name="Root", slug="root", order=1)
+        MenuItem.objects.create(name="B", slug="b", parent=root, order=2)
+        MenuItem.objects.create(name="A", slug="a", parent=root, order=1)
+        hidden = MenuItem.objects.create(name="Hidden", slug="hidden", parent=root, is_visible=False)
+        MenuItem.objects.create(name="Under hidden", slug="under-hidden", parent=hidden)
+        MenuItem.objects.create(name="Inactive", slug="inactive", parent=root, is_active=False)
+        MenuItem.objects.create(name="Inactive root", slug="inactive-root", is_active=False)
+
+        tree = build_menu_tree("fr")
+        self.assertEqual([item["slug"] for item in tree], ["root"])
+        self.assertEqual([child["slug"] for child in tree[0]["children"]], ["a", "b"])
+
+    def test_endpoint_served_from_cache_until_menu_changes(self):
+        self._chain(depth=3, width=2, prefix="api")
+        first = self.client.get("/api/menu/items/?lang=fr")
+        self.assertEqual(first.status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/menu/items/?lang=fr").json(), first.json())
+
+        MenuItem.objects.create(name="New", slug="new", order=0)
+        self.assertEqual(self.client.get("/api/menu/items/?lang=fr").json()[0]["slug"], "new")
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    """Backend de cache partagé (apps/core/cache_backends.py) sur un fichier propre au test."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = SQLiteCache(Path(tmp.name) / "cache.sqlite3", {"OPTIONS": {"MAX_ENTRIES": 10, "CULL_FREQUENCY": 2}})
+
+    def _advance(self, seconds):
+        now = time.time() + seconds
+        patcher = mock.patch("apps.core.cache_backends.time.time", return_value=now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_add_only_when_missing_or_expired(self):
+        self.assertTrue(self.cache.add("k", "first", timeout=10))
+        self.assertFalse(self.cache.add("k", "second", timeout=10))
+        self.assertEqual(self.cache.get("k"), "first")
+
+        self._advance(11)
+        self.assertTrue(self.cache.add("k", "third", timeout=10))
+        self.assertEqual(self.cache.get("k"), "third")
+
+    def test_incr_keeps_integers_and_rejects_missing_keys(self):
+        self.cache.set("n", 1)
+        self.assertEqual(self.cache.incr("n"), 2)
+        self.assertEqual(self.cache.incr("n", 5), 7)
+        self.assertEqual(self.cache.get("n"), 7)
+        self.cache.set("flag", True)
+        self.assertIs(self.cache.get("flag"), True)
+        with self.assertRaises(ValueError):
+            self.cache.incr("missing")
+        with self.assertRaises(TypeError):
+            self.cache.incr("flag")
+
+    def test_expired_entries_are_invisible(self):
+        self.cache.set("short", "v", timeout=5)
+        self.cache.set("forever", "v", timeout=None)
+        self.assertTrue(self.cache.has_key("short"))
+
+        self._advance(6)
+        self.assertIsNone(self.cache.get("short"))
+        self.assertFalse(self.cache.has_key("short"))
+        self.assertFalse(self.cache.touch("short"))
+        with self.assertRaises(ValueError):
+            self.cache.incr("short")
+        self.assertEqual(self.cache.get("forever"), "v")
+
+    def test_cull_drops_soonest_expiring_entries_beyond_max(self):
+        for i in range(50):  # le contrôle du nombre d'entrées a lieu toutes les 50 écritures
+            self.cache.set(f"k{i}", i, timeout=100 + i)
+
+        (count,) = self.cache._conn().execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        self.assertEqual(count, 25)
+        self.assertIsNone(self.cache.get("k0"))
+        self.assertEqual(self.cache.get("k49"), 49)
+
+
+class ClaimNextJobTests(TestCase):
+    def test_claims_oldest_first_within_running_limit(self):
+        jobs = [BackgroundJob.objects.create(kind="noop") for _ in range(3)]
+        for i, job in enumerate(jobs):
+            BackgroundJob.objects.filter(pk=job.pk).update(created_at=job.created_at + timedelta(seconds=i))
+
+        first = claim_next_job("w1", max_running=2)
+        second = claim_next_job("w2", max_running=2)
+        self.assertEqual([first.pk, second.pk], [jobs[0].pk, jobs[1].pk])
+        self.assertEqual((first.status, first.worker), (BackgroundJob.Status.RUNNING, "w1"))
+        self.assertIsNone(claim_next_job("w3", max_running=2))
+
+        BackgroundJob.objects.filter(pk=first.pk).update(status=BackgroundJob.Status.SUCCEEDED)
+        self.assertEqual(claim_next_job("w3", max_running=2).pk, jobs[2].pk)
+        self.assertIsNone(claim_next_job("w3", max_running=5))
+
+
+class PendingEditReviewTests(TestCase):
+    """Approbation / refus en masse : fusion par cible, re-vérification, isolation des échecs."""
+
+    def setUp(self):
+        self.admin = User.objects.create(username="admin", user_type=User.UserType.ADMIN)
+        self.staff = User.objects.create(username="staff", user_type=User.UserType.STAFF)
+        self.node = OrganizationNode.objects.create(name="Paris", slug="paris", description="Avant")
+        self.bulletin = Bulletin.objects.create(title="Bonjour", slug="news")
+
+    def _edit(self, content_type, object_id, payload, **extra):
+        return PendingContentEdit.objects.create(
+            content_type=content_type, object_id=object_id, payload=payload, requested_by=self.staff, **extra
+        )
+
+    def _review(self, edits, action="approve"):
+        return pending_edits.review_pending_edits([e.pk for e in edits], action, self.admin)
+
+    def test_edits_on_same_target_merge_in_order_into_one_save(self):
+        CT = PendingContentEdit.ContentType
+        edits = [
+            self._edit(CT.ORGANIZATION_NODE, "paris", {"name": "Paris Centre", "description": "Après"}),
+            self._edit(CT.BULLETIN, "news", {"_lang": "en", "title": "Hello"}),
+            self._edit(CT.ORGANIZATION_NODE, "paris", {"name": "Paris 11"}),
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            results = self._review(edits)
+
+        self.assertEqual([r["status"] for r in results], ["approved"] * 3)
+        self.node.refresh_from_db()
+        self.assertEqual((self.node.name_fr, self.node.description_fr), ("Paris 11", "Après"))
+        self.bulletin.refresh_from_db()
+        self.assertEqual((self.bulletin.title_fr, self.bulletin.title_en), ("Bonjour", "Hello"))
+        # Une seule sauvegarde par cible, limitée aux colonnes modifiées (dont celle de _lang).
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        node_updates = [sql for sql in updates if f'"{OrganizationNode._meta.db_table}"' in sql.split(" SET ")[0]]
+        self.assertEqual(len(node_updates), 1)
+        self.assertIn('"name_fr"', node_updates[0])
+        self.assertNotIn('"cta_url"', node_updates[0])
+        bulletin_updates = [sql for sql in updates if f'"{Bulletin._meta.db_table}"' in sql.split(" SET ")[0]]
+        self.assertEqual(len(bulletin_updates), 1)
+        self.assertIn('"title_en"', bulletin_updates[0])
+        self.assertNotIn('"slug"', bulletin_updates[0])
+
+    def test_handled_edits_are_skipped_and_failures_stay_in_their_group(self):
+        CT = PendingContentEdit.ContentType
+        done = self._edit(CT.BULLETIN, "news", {"title": "Déjà"}, status=PendingContentEdit.Status.APPROVED)
+        racing = self._edit(CT.ORGANIZATION_NODE, "paris", {"name": "Perdu"})
+        broken = self._edit(CT.BULLETIN, "missing", {"title": "Introuvable"})
+        ok = self._edit(CT.BULLETIN, "news", {"title": "Nouveau"})
+        target_key = pending_edits.pending_edit_target_key
+
+        def handled_meanwhile(edit):
+            # Un autre admin traite `racing` entre la lecture du lot et le verrou de son groupe.
+            if edit.pk == racing.pk:
+                PendingContentEdit.objects.filter(pk=racing.pk).update(status=PendingContentEdit.Status.REJECTED)
+            return target_key(edit)
+
+        with mock.patch.object(pending_edits, "pending_edit_target_key", side_effect=handled_meanwhile):
+            results = pending_edits.review_pending_edits(
+                [done.pk, racing.pk, broken.pk, ok.pk, 999999], "approve", self.admin
+            )
+
+        self.assertEqual(
+            [r["status"] for r in results], ["skipped", "skipped", "error", "approved", "not_found"]
+        )
+        self.node.refresh_from_db()
+        self.bulletin.refresh_from_db()
+        self.assertEqual((self.node.name, self.bulletin.title), ("Paris", "Nouveau"))
+        broken.refresh_from_db()
+        self.assertEqual(broken.status, PendingContentEdit.Status.PENDING)
+
+    def test_bulk_endpoint_rejects_and_validates_ids(self):
+        CT = PendingContentEdit.ContentType
+        edits = [self._edit(CT.ORGANIZATION_NODE, "paris", {"name": "Refusé"}) for _ in range(2)]
+        client = client_for(self.admin)
+        url = "/api/admin/pending-edits/bulk/"
+
+        response = client.post(url, {"action": "reject", "ids": [e.pk for e in edits]}, format="json")
+        self.assertEqual(response.json()["counts"], {"rejected": 2})
+        self.node.refresh_from_db()
+        self.assertEqual(self.node.name, "Paris")
+
+        for ids in (["1", "x"], list(range(1, 502)), []):
+            response = client.post(url, {"action": "approve", "ids": ids}, format="json")
+            self.assertEqual(response.status_code, 400, ids[:3])
+        staff_response = client_for(self.staff).post(url, {"action": "reject", "ids": [1]}, format="json")
+        self.assertEqual(staff_response.status_code, 403)
+
+
+class PendingEditInvalidationTests(TransactionTestCase):
+    """Chaque groupe valide sa transaction : sans regroupement, une invalidation par groupe."""
+
+    def test_batch_invalidates_each_family_once(self):
+        admin = User.objects.create(username="admin", user_type=User.UserType.ADMIN)
+        CT = PendingContentEdit.ContentType
+        for slug in ("paris", "lyon"):
+            OrganizationNode.objects.create(name=slug, slug=slug)
+        Bulletin.objects.create(title="Bonjour", slug="news")
+        edits = [
+            PendingContentEdit.objects.create(content_type=ct, object_id=oid, payload=payload, requested_by=admin)
+            for ct, oid, payload in [
+                (CT.ORGANIZATION_NODE, "paris", {"name": "Paris 11"}),
+                (CT.ORGANIZATION_NODE, "lyon", {"name": "Lyon 2"}),
+                (CT.BULLETIN, "news", {"title": "Nouveau"}),
+            ]
+        ]
+        with mock.patch.object(content_cache, "_bump_now", wraps=content_cache._bump_now) as bump:
+            pending_edits.review_pending_edits([e.pk for e in edits], "approve", admin)
+        self.assertEqual(bump.call_count, 1)
+
+
+class SingleFlightTests(SimpleTestCase):
+    """get_or_build : verrou, valeur périmée, attente, rafraîchissement anticipé, SkipCache."""
+
+    def setUp(self):
+        cache.clear()
+        self.builds = 0
+
+    def _build(self, value="fresh"):
+        def build():
+            self.builds += 1
+            return value
+
+        return build
+
+    def _entry(self, value, expires_in):
+        return {"value": value, "delta": 1.0, "expires": time.time() + expires_in, "meta": "m"}
+
+    def test_held_lock_serves_stale_entry(self):
+        cache.add("k:lock", 1)
+        cache.set("k:latest", self._entry("old", -60))
+
+        fill = single_flight.get_or_build("k", self._build(), timeout=60, stale_key="k:latest")
+
+        self.assertEqual((fill.value, fill.state, fill.meta, self.builds), ("old", "stale", "m", 0))
+
+    def test_held_lock_without_stale_waits_for_the_builder(self):
+        cache.add("k:lock", 1)
+
+        def other_worker_finishes(seconds):
+            cache.set("k", self._entry("theirs", 60))
+
+        with mock.patch.object(single_flight.time, "sleep", side_effect=other_worker_finishes):
+            fill = single_flight.get_or_build("k", self._build(), timeout=60, stale_key="k:latest")
+
+        self.assertEqual((fill.value, fill.state, self.builds), ("theirs", "waited", 0))
+
+    def test_wait_timeout_builds_without_the_lock(self):
+        cache.add("k:lock", 1)
+        with self.assertLogs("apps.core.single_flight", "WARNING"):
+            fill = single_flight.get_or_build("k", self._build(), timeout=60, wait_timeout=0)
+
+        self.assertEqual((fill.value, fill.state, self.builds), ("fresh", "built", 1))
+        self.assertEqual(cache.get("k")["value"], "fresh")
+
+    def test_early_refresh_follows_beta(self):
+        cache.set("k", self._entry("old", 0.5), 60)
+        with mock.patch.object(single_flight.random, "random", return_value=0.99):
+            kept = single_flight.get_or_build("k", self._build(), timeout=60, beta=0)
+            refreshed = single_flight.get_or_build("k", self._build(), timeout=60, beta=1.0)
+
+        self.assertEqual((kept.value, kept.state), ("old", "hit"))
+        self.assertEqual((refreshed.value, refreshed.state, self.builds), ("fresh", "early", 1))
+        self.assertFalse(cache.get("k:lock"))
+
+    def test_skip_cache_stores_nothing(self):
+        def build():
+            raise single_flight.SkipCache()
+
+        with self.assertRaises(single_flight.SkipCache):
+            single_flight.get_or_build("k", build, timeout=60, stale_key="k:latest")
+        self.assertIsNone(cache.get("k"))
+        self.assertIsNone(cache.get("k:latest"))
+        self.assertIsNone(cache.get("k:lock"))
+
+        # Rafraîchissement anticipé refusé : l'entrée courante reste servie.
+        cache.set("k", self._entry("old", 0.5), 60)
+        with mock.patch.object(single_flight.random, "random", return_value=0.99):
+            fill = single_flight.get_or_build("k", build, timeout=60)
+        self.assertEqual((fill.value, fill.state), ("old", "hit"))
+
+    def test_single_flight_view_never_caches_errors(self):
+        statuses = [404, 200]
+
+        class FlakyView(APIView):
+            authentication_classes = []
+            permission_classes = []
+
+            @content_cache.cache_public_get("organization", single_flight=True)
+            def get(inner_self, request):
+                self.builds += 1
+                status = statuses.pop(0)
+                return Response({"status": status}, status=status)
+
+        view = FlakyView.as_view()
+        factory = APIRequestFactory()
+        responses = [view(factory.get("/flaky/")) for _ in range(3)]
+
+        self.assertEqual([r.status_code for r in responses], [404, 200, 200])
+        self.assertEqual(responses[2].data, {"status": 200})
+        self.assertEqual(self.builds, 2)
+
+
+class KeysetPaginationTests(TestCase):
+    """Curseurs sur colonnes NULL, tri descendant, tri par défaut réécrit par modeltranslation."""
+
+    def setUp(self):
+        cache.clear()
+        day = timezone.now().replace(microsecond=0)
+        same = day - timedelta(days=3)
+        # Dates égales, NULL et created_at identiques : seul pk départage certaines lignes.
+        for i, published in enumerate([day, same, same, None, same, None, day - timedelta(days=1), None]):
+            Bulletin.objects.create(title=f"b{i}", slug=f"b{i}", published_at=published)
+        Bulletin.objects.filter(published_at__isnull=True).update(created_at=day)
+
+    def _walk(self, url, limit):
+        slugs, cursor = [], None
+        while True:
+            query = f"?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+            response = self.client.get(url + query)
+            self.assertEqual(response.status_code, 200)
+            slugs += [row["slug"] for row in response.json()["results"]]
+            cursor = response.json()["next_cursor"]
+            if not cursor:
+                return slugs
+
+    def _paginate(self, queryset, query=""):
+        paginator = KeysetPagination()
+        request = Request(APIRequestFactory().get(f"/x/{query}"))
+        return paginator, paginator.paginate_queryset(queryset, request)
+
+    def test_descending_walk_with_nulls_lists_every_row_once(self):
+        for limit in (1, 2, 3):
+            slugs = self._walk("/api/identite/bulletins/", limit)
+            self.assertEqual(sorted(slugs), sorted(f"b{i}" for i in range(8)), limit)
+            # NULL toujours en fin, y compris en tri descendant.
+            self.assertEqual(set(slugs[-3:]), {"b3", "b5", "b7"})
+            self.assertEqual(slugs[:2], ["b0", "b6"])
+
+    def test_ascending_walk_over_nullable_column(self):
+        queryset = Bulletin.objects.order_by("published_at", "title")
+        seen, query = [], "?limit=2"
+        while True:
+            paginator, page = self._paginate(queryset, query)
+            seen += [b.slug for b in page]
+            if not paginator.next_cursor:
+                break
+            query = f"?limit=2&cursor={paginator.next_cursor}"
+        self.assertEqual(len(seen), 8)
+        self.assertEqual(seen[-3:], ["b3", "b5", "b7"])
+
+    def test_default_ordering_follows_active_language(self):
+        names = [("Zeta", "Alpha"), ("Beta", None), ("Alpha", "Zulu"), ("Gamma", None)]
+        for i, (name, name_en) in enumerate(names):
+            Pole.objects.create(name=name, name_en=name_en, slug=f"p{i}", order=i % 2)
+
+        self.assertEqual(_ordering_of(Pole.objects.all()), ["order", "name_fr", "pk"])
+        with translation.override("en"):
+            self.assertEqual(_ordering_of(Pole.objects.all()), ["order", "name_en", "pk"])
+            seen, query = [], "?limit=1"
+            while True:
+                paginator, page = self._paginate(Pole.objects.all(), query)
+                seen += [p.slug for p in page]
+                if not paginator.next_cursor:
+                    break
+                query = f"?limit=1&cursor={paginator.next_cursor}"
+        # order 0 : Alpha < Zulu ; order 1 : deux name_en NULL, départagés par pk.
+        self.assertEqual((seen[:2], sorted(seen[2:])), (["p0", "p2"], ["p1", "p3"]))
+
+    def test_tampered_or_foreign_cursor_is_404(self):
+        first = self.client.get("/api/identite/bulletins/?limit=2").json()
+        self.assertEqual(self.client.get("/api/identite/bulletins/?cursor=not-base64!").status_code, 404)
+        truncated = first["next_cursor"][:-4]
+        self.assertEqual(self.client.get(f"/api/identite/bulletins/?cursor={truncated}").status_code, 404)
+
+        Pole.objects.create(name="A", slug="a")
+        Pole.objects.create(name="B", slug="b")
+        paginator, _ = self._paginate(Pole.objects.all(), "?limit=1")
+        foreign = self.client.get(f"/api/identite/bulletins/?cursor={paginator.next_cursor}")
+        self.assertEqual(foreign.status_code, 404)
+        with self.assertRaises(NotFound):
+            self._paginate(Bulletin.objects.order_by("title"), f"?cursor={first['next_cursor']}")
@@ -0,0 +1,32 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from .bench import SKIPPED_ROUTES, check_budget, collect_routes, load_budget, run_bench, seed_bench_data
+
+
+class ApiBudgetTests(TestCase):
+    """
+    Chaque route GET de l'API, sur le jeu du banc (`manage.py bench_api`), reste dans le budget
+    versionné perf-budget.json pour les requêtes SQL et la taille (la latence dépend de la
+    machine : elle n'est vérifiée que par `bench_api --check`).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.budget = load_budget()
+        cls.admin = seed_bench_data(cls.budget["scale"])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_every_get_route_is_measured_and_budgeted(self):
+        routes = collect_routes()
+        skipped = {r["route"] for r in routes if "skipped" in r}
+        self.assertEqual(skipped, set(SKIPPED_ROUTES))
+        unbudgeted = [r["route"] for r in routes if "skipped" not in r and r["route"] not in self.budget["routes"]]
+        self.assertEqual(unbudgeted, [], "bench_api --write-budget pour ajouter les nouvelles routes")
+
+    def test_routes_within_query_and_size_budget(self):
+        results = run_bench(collect_routes(), admin=self.admin, iterations=1)
+        failing = check_budget(results, self.budget, metrics=("queries", "bytes"))
+        self.assertEqual([f"{r['page']} : {', '.join(r['violations'])}" for r in failing], [])
@@ -0,0 +1,274 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import Bulletin, TranslationMemory
+from .translation_engine import FakeProvider, TranslationEngine, TranslationProviderError, TranslationTask
+from .translation_fingerprints import stale_fingerprints
+from .translation_memory import TranslationMemoryStore
+
+
+class ScriptedProvider(FakeProvider):
+    """FakeProvider dont certains textes échouent d'abord (erreurs rejouées dans l'ordre)."""
+
+    def __init__(self, errors=None):
+        super().__init__()
+        self.errors = {text: list(queue) for text, queue in (errors or {}).items()}
+        self.texts = []
+
+    def translate(self, text, *, target_lang, context):
+        self.texts.append(text)
+        queue = self.errors.get(text)
+        if queue:
+            with self._lock:
+                self.calls += 1
+            raise queue.pop(0)
+        return super().translate(text, target_lang=target_lang, context=context)
+
+
+class PackedReplyProvider(FakeProvider):
+    """FakeProvider dont la réponse packée est imposée (JSON mal formé, partiel… ou exception levée)."""
+
+    def __init__(self, reply):
+        super().__init__()
+        self.reply = reply
+        self.packed_calls = 0
+
+    def translate_packed(self, items):
+        self.packed_calls += 1
+        with self._lock:
+            self.calls += 1
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+
+def bulletin_tasks(bulletin, targets=("en", "es")):
+    return [
+        TranslationTask(bulletin, field, getattr(bulletin, f"{field}_fr"), lang, f"core.Bulletin.{field}")
+        for field in ("title", "content_markdown")
+        for lang in targets
+    ]
+
+
+def title_tasks(bulletins, target="en"):
+    return [TranslationTask(b, "title", b.title_fr, target, "core.Bulletin.title") for b in bulletins]
+
+
+def engine_for(provider, **options):
+    # Ni cadence ni attente de backoff : les tests restent instantanés.
+    return TranslationEngine(provider, rate=0, backoff=0, **options)
+
+
+class TranslationEngineTests(TestCase):
+    """Moteur de translate_models sur FakeProvider : essais, échecs, dédoublonnage, écritures."""
+
+    def setUp(self):
+        titles = ["Bonjour", "Instable", "Cassé"]
+        self.bulletins = [Bulletin.objects.create(title=title, slug=f"b{i}") for i, title in enumerate(titles)]
+
+    def test_retryable_errors_retry_and_others_fail(self):
+        provider = ScriptedProvider(
+            errors={
+                "Instable": [TranslationProviderError("quota", retryable=True)] * 2,
+                "Cassé": [TranslationProviderError("clé invalide")],
+            }
+        )
+        report = engine_for(provider, max_retries=3).run(title_tasks(self.bulletins))
+
+        self.assertEqual((report.retries, report.provider_calls), (2, 5))
+        self.assertEqual([(task.text, error) for task, error in report.failures], [("Cassé", "clé invalide")])
+        self.assertEqual((report.fields_translated, report.objects_updated), (2, 2))
+        titles = dict(Bulletin.objects.values_list("slug", "title_en"))
+        self.assertEqual(titles, {"b0": "[en] Bonjour", "b1": "[en] Instable", "b2": None})
+
+    def test_retries_stop_at_max_retries(self):
+        provider = ScriptedProvider(errors={"Instable": [TranslationProviderError("503", retryable=True)] * 5})
+        report = engine_for(provider, max_retries=2).run(title_tasks(self.bulletins[1:2]))
+
+        self.assertEqual((report.retries, report.provider_calls, len(report.failures)), (2, 3, 1))
+
+    def test_duplicate_texts_make_one_provider_call(self):
+        same = [Bulletin.objects.create(title="Même titre", slug=f"same-{i}") for i in range(4)]
+        provider = ScriptedProvider()
+        report = engine_for(provider, workers=2).run(title_tasks(same))
+
+        self.assertEqual((provider.texts, report.deduplicated), (["Même titre"], 3))
+        self.assertEqual(
+            set(Bulletin.objects.filter(slug__startswith="same-").values_list("title_en", flat=True)),
+            {"[en] Même titre"},
+        )
+
+    def test_writes_touch_only_translated_columns(self):
+        tasks = title_tasks(self.bulletins[:1])
+        # Modification concurrente d'une autre colonne pendant le run : elle doit survivre.
+        Bulletin.objects.filter(pk=self.bulletins[0].pk).update(slug="renamed", title_fr="Bonjour !")
+
+        with CaptureQueriesContext(connection) as ctx:
+            engine_for(FakeProvider()).run(tasks)
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        bulletin_updates = [sql for sql in updates if f'"{Bulletin._meta.db_table}"' in sql.split(" SET ")[0]]
+        self.assertEqual(len(bulletin_updates), 1)
+        self.assertIn('"title_en"', bulletin_updates[0])
+        self.assertNotIn('"slug"', bulletin_updates[0])
+        self.assertNotIn('"title_fr"', bulletin_updates[0])
+        bulletin = Bulletin.objects.get(pk=self.bulletins[0].pk)
+        self.assertEqual(
+            (bulletin.slug, bulletin.title_fr, bulletin.title_en), ("renamed", "Bonjour !", "[en] Bonjour")
+        )
+
+
+class PackedTranslationTests(TestCase):
+    """Mode packé : une requête par objet, contrat JSON validé, repli champ par champ."""
+
+    def setUp(self):
+        self.bulletin = Bulletin.objects.create(title="Titre", slug="news", content_markdown="Corps")
+
+    def _translations(self):
+        self.bulletin.refresh_from_db()
+        return {
+            (field, lang): getattr(self.bulletin, f"{field}_{lang}")
+            for field in ("title", "content_markdown")
+            for lang in ("en", "es")
+        }
+
+    def test_one_request_per_object(self):
+        other = Bulletin.objects.create(title="Autre", slug="other", content_markdown="Texte")
+        provider = FakeProvider()
+        report = engine_for(provider, pack=True).run(bulletin_tasks(self.bulletin) + bulletin_tasks(other))
+
+        self.assertEqual((provider.calls, report.packed_requests, report.pack_fallbacks), (2, 2, 0))
+        self.assertEqual((report.fields_translated, report.objects_updated), (8, 2))
+        self.assertEqual(self._translations()[("content_markdown", "es")], "[es] Corps")
+
+    def test_malformed_reply_falls_back_field_by_field(self):
+        provider = PackedReplyProvider("Désolé, je ne peux pas répondre en JSON.")
+        report = engine_for(provider, pack=True).run(bulletin_tasks(self.bulletin))
+
+        self.assertEqual((provider.packed_calls, provider.calls), (1, 5))
+        self.assertEqual((report.packed_requests, report.pack_fallbacks, report.failures), (1, 4, []))
+        self.assertEqual(self._translations()[("title", "en")], "[en] Titre")
+
+    def test_partial_reply_keeps_valid_entries(self):
+        # f1 = titre, f2 = contenu : "es" vide, valeur non textuelle et langue absente sont rejouées.
+        reply = '```json\n{"f1": {"en": "Title", "es": ""}, "f2": {"en": 5}, "f9": {"en": "?"}}\n```'
+        provider = PackedReplyProvider(reply)
+        report = engine_for(provider, pack=True).run(bulletin_tasks(self.bulletin))
+
+        self.assertEqual((provider.packed_calls, provider.calls), (1, 4))
+        self.assertEqual((report.packed_requests, report.pack_fallbacks), (1, 3))
+        self.assertEqual(
+            self._translations(),
+            {
+                ("title", "en"): "Title",
+                ("title", "es"): "[es] Titre",
+                ("content_markdown", "en"): "[en] Corps",
+                ("content_markdown", "es"): "[es] Corps",
+            },
+        )
+
+    def test_non_object_json_and_packed_provider_error(self):
+        provider = PackedReplyProvider('["Title"]')
+        report = engine_for(provider, pack=True).run(bulletin_tasks(self.bulletin, targets=("en",)))
+        self.assertEqual((report.pack_fallbacks, report.fields_translated), (2, 2))
+
+        failing = PackedReplyProvider(TranslationProviderError("clé invalide"))
+        report = engine_for(failing, pack=True).run(bulletin_tasks(self.bulletin, targets=("es",)))
+        # Échec de l'appel packé lui-même : chaque champ de l'objet est en échec, sans repli.
+        self.assertEqual((report.packed_requests, report.pack_fallbacks, len(report.failures)), (0, 0, 2))
+
+
+def translate_bulletins(*extra):
+    out = StringIO()
+    call_command(
+        "translate_models", "--target=en", "--model=core.Bulletin", "--provider=fake", *extra, stdout=out, stderr=out
+    )
+    return out.getvalue()
+
+
+class TranslationMemoryTests(TestCase):
+    """Mémoire de traduction : compteurs, réutilisation d'un run à l'autre, éviction."""
+
+    def test_second_run_is_served_from_memory(self):
+        first = [Bulletin.objects.create(title="Stage d'été", slug="first")]
+        provider = FakeProvider()
+        engine_for(provider, memory=TranslationMemoryStore()).run(title_tasks(first))
+        self.assertEqual(provider.calls, 1)
+
+        # Même texte à la normalisation près, sur d'autres objets.
+        second = [Bulletin.objects.create(title="  Stage   d'été ", slug=f"second-{i}") for i in range(2)]
+        provider, store = FakeProvider(), TranslationMemoryStore()
+        report = engine_for(provider, memory=store).run(title_tasks(second))
+
+        self.assertEqual((provider.calls, report.memory_hits), (0, 2))
+        self.assertEqual((store.hits, store.misses), (2, 0))
+        self.assertEqual(TranslationMemory.objects.get().hit_count, 2)
+        self.assertEqual(Bulletin.objects.get(slug="second-1").title_en, "[en] Stage d'été")
+
+    def test_translate_models_rerun_makes_no_provider_call(self):
+        Bulletin.objects.create(title="Bonjour", slug="a", content_markdown="Corps")
+        self.assertIn("calls: 1,", translate_bulletins())
+
+        Bulletin.objects.create(title="Bonjour", slug="b", content_markdown="Corps")
+        output = translate_bulletins()
+        self.assertIn("fields: 2, calls: 0,", output)
+        self.assertIn("memory hits: 2,", output)
+
+    def test_prune_evicts_unused_and_excess_entries(self):
+        now = timezone.now()
+        for i, (context, age) in enumerate([("title", 90), ("title", 1), ("location_name", 2), ("name", 0)]):
+            entry = TranslationMemory.objects.create(
+                source_hash=f"{i:064d}", target_lang="en", context_class=context, source_text="s", translated_text="t"
+            )
+            TranslationMemory.objects.filter(pk=entry.pk).update(last_used_at=now - timedelta(days=age))
+
+        def prune(*args):
+            call_command("prune_translation_memory", *args, stdout=StringIO())
+            return sorted(TranslationMemory.objects.values_list("context_class", flat=True))
+
+        self.assertEqual(prune("--older-than=30"), ["location_name", "name", "title"])
+        self.assertEqual(prune("--context=location_name"), ["name", "title"])
+        self.assertEqual(prune("--max-entries=1"), ["name"])
+
+
+class TranslationFingerprintTests(TestCase):
+    """Empreintes : une source FR modifiée ne rend périmé que ce champ, retraduit au run suivant."""
+
+    def setUp(self):
+        self.edited = Bulletin.objects.create(title="Bonjour", slug="edited", content_markdown="Corps")
+        self.other = Bulletin.objects.create(title="Salut", slug="other", content_markdown="Texte")
+        translate_bulletins()
+        self.edited.refresh_from_db()
+        self.other.refresh_from_db()
+
+    def _stale(self):
+        return sorted(stale_fingerprints(Bulletin, "en").values_list("object_id", "field"))
+
+    def test_editing_source_marks_exactly_that_field_stale(self):
+        self.assertEqual(self._stale(), [])
+
+        self.edited.title = "Bonsoir"
+        self.edited.save()
+        # Sauvegarde sans la colonne source : rien ne change.
+        self.other.is_published = False
+        self.other.save(update_fields=["is_published"])
+
+        self.assertEqual(self._stale(), [(str(self.edited.pk), "title")])
+        output = translate_bulletins()
+        self.assertIn("Updated objects: 1 (fields: 1,", output)
+        self.edited.refresh_from_db()
+        self.assertEqual((self.edited.title_en, self.edited.content_markdown_en), ("[en] Bonsoir", "[en] Corps"))
+        self.assertEqual(self._stale(), [])
+
+    def test_missing_only_ignores_stale_fields(self):
+        self.edited.content_markdown = "Nouveau corps"
+        self.edited.save()
+
+        self.assertIn("Updated objects: 0", translate_bulletins("--missing-only"))
+        self.assertEqual(self._stale(), [(str(self.edited.pk), "content_markdown")])
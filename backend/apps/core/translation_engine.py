@@ -0,0 +1,554 @@
+"""
+Moteur de traduction des champs modeltranslation (commande translate_models, admin).
+
+- Fournisseur interchangeable : GeminiProvider (un seul client pour tout le run) ou
+  FakeProvider (local, latence simulée) pour les tests et les mesures.
+- Appels réseau en parallèle dans un pool de threads borné, cadencés par un seau à jetons
+  partagé ; les erreurs de quota / serveur sont retentées avec backoff exponentiel.
+- Mémoire de traduction (apps/core/translation_memory.py) consultée avant chaque appel.
+- Mode « packé » : tous les champs d'un objet, dans toutes les langues cibles, sont demandés
+  en une seule requête (prompt structuré, réponse JSON validée puis découpée par champ) ;
+  les entrées absentes ou invalides — toutes si la réponse n'est pas un JSON exploitable —
+  repartent en appels champ par champ.
+- Écritures en base faites par le thread appelant, par lots dans une transaction courte,
+  jamais pendant l'attente réseau. Chaque objet est sauvegardé avec update_fields :
+  les signaux (cache public, planning) restent déclenchés ; l'empreinte de la source
+  traduite est enregistrée (apps/core/translation_fingerprints.py).
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Protocol
+
+from django.db import transaction
+from google import genai
+
+from .gemini_utils import gemini_error_message
+from .translation_fingerprints import record_translations
+from .translation_memory import TranslationMemoryStore, memory_key
+
+DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
+# Codes HTTP qui valent la peine d'un nouvel essai (quota, surcharge).
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def build_translation_prompt(text: str, *, target_lang: str, context: str) -> str:
+    return (
+        f"Tu es un traducteur professionnel.\n"
+        f"Contexte du champ : {context}\n"
+        f"Langue cible : {target_lang}\n\n"
+        f"Règles :\n"
+        f"- Traduire uniquement.\n"
+        f"- Conserver la mise en forme (Markdown si présent) et les retours à la ligne.\n"
+        f"- Ne pas altérer les slugs / codes / URLs.\n\n"
+        f"Texte à traduire :\n{text}"
+    )
+
+
+@dataclass(frozen=True)
+class PackedItem:
+    """Un texte d'une requête packée, à traduire dans chacune des langues `targets`."""
+
+    key: str
+    text: str
+    context: str
+    targets: tuple[str, ...]
+
+
+class PackedResponseError(ValueError):
+    """Réponse packée inexploitable (pas un objet JSON)."""
+
+
+def build_packed_translation_prompt(items: list[PackedItem]) -> str:
+    entries = [
+        {"id": item.key, "context": item.context, "targets": list(item.targets), "text": item.text}
+        for item in items
+    ]
+    return (
+        f"Tu es un traducteur professionnel.\n"
+        f"Traduis le champ `text` de chaque entrée dans chacune de ses langues `targets`.\n\n"
+        f"Règles :\n"
+        f"- Traduire uniquement.\n"
+        f"- Conserver la mise en forme (Markdown si présent) et les retours à la ligne.\n"
+        f"- Ne pas altérer les slugs / codes / URLs.\n"
+        f'- Répondre uniquement par un objet JSON {{"<id>": {{"<langue>": "<traduction>"}}}} '
+        f"contenant exactement les ids et les langues demandés.\n\n"
+        f"Entrées :\n{json.dumps(entries, ensure_ascii=False, indent=1)}"
+    )
+
+
+def parse_packed_response(raw: str, items: list[PackedItem]) -> dict[tuple[str, str], str]:
+    """
+    {(id, langue): traduction} pour les entrées valides (chaîne non vide si la source ne l'est
+    pas) ; les autres sont omises. PackedResponseError si `raw` n'est pas un objet JSON.
+    """
+    raw = (raw or "").strip()
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[-1].rsplit("```", 1)[0]
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise PackedResponseError(f"Réponse packée non JSON : {e}") from e
+    if not isinstance(data, dict):
+        raise PackedResponseError("Réponse packée : objet JSON attendu")
+    values = {}
+    for item in items:
+        entry = data.get(item.key)
+        if not isinstance(entry, dict):
+            continue
+        for lang in item.targets:
+            value = entry.get(lang)
+            if isinstance(value, str) and (value.strip() or not item.text.strip()):
+                values[(item.key, lang)] = value.strip()
+    return values
+
+
+class TranslationProviderError(RuntimeError):
+    """Échec d'appel au fournisseur ; `retryable` si un nouvel essai peut réussir."""
+
+    def __init__(self, message: str, *, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TranslationProvider(Protocol):
+    name: str
+
+    def translate(self, text: str, *, target_lang: str, context: str) -> str: ...
+
+    # Optionnel : `translate_packed(items) -> str` (réponse JSON brute), voir translate_packed().
+
+
+class GeminiProvider:
+    """Gemini via google-genai ; le client (et sa connexion HTTP) est partagé entre threads."""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str | None = None, model_name: str | None = None):
+        self.api_key = api_key if api_key is not None else os.getenv("GEMINI_API_KEY", "")
+        if not self.api_key:
+            raise RuntimeError("Missing GEMINI_API_KEY environment variable")
+        self.model_name = model_name or os.getenv("GEMINI_MODEL_NAME") or DEFAULT_GEMINI_MODEL
+        self.client = genai.Client(api_key=self.api_key)
+
+    def translate(self, text: str, *, target_lang: str, context: str) -> str:
+        return self._generate(build_translation_prompt(text, target_lang=target_lang, context=context))
+
+    def translate_packed(self, items: list[PackedItem]) -> str:
+        return self._generate(
+            build_packed_translation_prompt(items), config={"response_mime_type": "application/json"}
+        )
+
+    def _generate(self, prompt: str, config: dict | None = None) -> str:
+        try:
+            resp = self.client.models.generate_content(model=self.model_name, contents=prompt, config=config)
+        except Exception as e:
+            code = getattr(e, "code", None)
+            retryable = code in RETRYABLE_STATUS_CODES or "RESOURCE_EXHAUSTED" in str(e)
+            raise TranslationProviderError(
+                gemini_error_message(str(e), api_key=self.api_key, model_name=self.model_name),
+                retryable=retryable,
+            ) from e
+        # SDK expose généralement `text`
+        return (getattr(resp, "text", None) or str(resp)).strip()
+
+
+class FakeProvider:
+    """Traducteur local : préfixe la langue, après une latence simulée (secondes)."""
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def translate(self, text: str, *, target_lang: str, context: str) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return f"[{target_lang}] {text}"
+
+    def translate_packed(self, items: list[PackedItem]) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return json.dumps(
+            {item.key: {lang: f"[{lang}] {item.text}" for lang in item.targets} for item in items},
+            ensure_ascii=False,
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def _gemini_provider(api_key: str, model_name: str) -> GeminiProvider:
+    return GeminiProvider(api_key=api_key, model_name=model_name)
+
+
+def shared_gemini_provider() -> GeminiProvider:
+    """Fournisseur Gemini réutilisé d'une requête à l'autre (un client par clé / modèle)."""
+    api_key = os.getenv("GEMINI_API_KEY", "")
+    if not api_key:
+        raise RuntimeError("Missing GEMINI_API_KEY environment variable")
+    return _gemini_provider(api_key, os.getenv("GEMINI_MODEL_NAME") or DEFAULT_GEMINI_MODEL)
+
+
+def get_translation_provider(name: str | None = None, **kwargs: Any) -> TranslationProvider:
+    """`name` ou TRANSLATION_PROVIDER (défaut : gemini)."""
+    name = (name or os.getenv("TRANSLATION_PROVIDER") or "gemini").strip().lower()
+    if name == "gemini":
+        return GeminiProvider(**kwargs)
+    if name == "fake":
+        return FakeProvider(**kwargs)
+    raise RuntimeError(f"Fournisseur de traduction inconnu : {name!r} (gemini, fake)")
+
+
+def translate_packed(
+    provider: TranslationProvider, items: list[PackedItem], *, call: Callable | None = None
+) -> tuple[dict[tuple[str, str], Any], int]:
+    """
+    Traduit `items` en un seul appel si le fournisseur sait packer (et qu'il y a plus d'une
+    traduction à faire). Les entrées manquantes ou invalides de la réponse sont retraduites
+    une par une. Une erreur du fournisseur sur l'appel packé est propagée.
+    `call(fn)` enveloppe chaque appel (cadence, nouveaux essais).
+    Renvoie ({(key, langue): traduction | exception}, nombre d'appels de repli).
+    """
+    call = call or (lambda fn: fn())
+    values: dict[tuple[str, str], Any] = {}
+    if hasattr(provider, "translate_packed") and sum(len(item.targets) for item in items) > 1:
+        raw = call(lambda: provider.translate_packed(items))
+        try:
+            values.update(parse_packed_response(raw, items))
+        except PackedResponseError:
+            pass
+    fallbacks = 0
+    for item in items:
+        for lang in item.targets:
+            if (item.key, lang) in values:
+                continue
+            fallbacks += 1
+            try:
+                values[(item.key, lang)] = call(
+                    lambda: provider.translate(item.text, target_lang=lang, context=item.context)
+                )
+            except Exception as e:  # noqa: BLE001 — rendu au champ concerné
+                values[(item.key, lang)] = e
+    return values, fallbacks
+
+
+def translate_packed_with_memory(
+    provider: TranslationProvider, entries: list[tuple[str, str, str]], targets: list[str]
+) -> tuple[dict[tuple[str, str], Any], int]:
+    """
+    entries : (clé, texte, contexte). Mémoire de traduction d'abord, puis une requête packée
+    pour tout ce qui manque (les réponses sont mémorisées).
+    Renvoie ({(clé, langue): traduction | exception}, nombre de traductions venues de la mémoire).
+    """
+    store = TranslationMemoryStore()
+    values: dict[tuple[str, str], Any] = {}
+    items = []
+    for key, text, context in entries:
+        missing = []
+        for lang in targets:
+            cached = store.lookup(text, lang, context)
+            if cached is None:
+                missing.append(lang)
+            else:
+                values[(key, lang)] = cached
+        if missing:
+            items.append(PackedItem(key, text, context, tuple(missing)))
+    if items:
+        translated, _ = translate_packed(provider, items)
+        for item in items:
+            for lang in item.targets:
+                value = translated[(item.key, lang)]
+                if not isinstance(value, Exception):
+                    store.remember(item.text, lang, item.context, value)
+                values[(item.key, lang)] = value
+    store.flush()
+    return values, store.hits
+
+
+class TokenBucket:
+    """Limiteur de débit partagé entre threads : `rate` appels/s, rafale de `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+@dataclass(frozen=True)
+class TranslationTask:
+    """Un champ d'un objet à traduire vers `target` (écrit dans `<field>_<target>`)."""
+
+    obj: Any
+    field: str
+    text: str
+    target: str
+    context: str
+
+    @property
+    def target_attname(self) -> str:
+        return f"{self.field}_{self.target}"
+
+
+@dataclass
+class TranslationReport:
+    objects_updated: int = 0
+    fields_translated: int = 0
+    provider_calls: int = 0
+    retries: int = 0
+    memory_hits: int = 0
+    deduplicated: int = 0
+    packed_requests: int = 0
+    pack_fallbacks: int = 0
+    cancelled: bool = False
+    failures: list[tuple[TranslationTask, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class TranslationEngine:
+    """
+    engine.run(tasks) : traduit en parallèle, écrit par lots, renvoie un TranslationReport.
+    Les tâches d'un même objet doivent être consécutives (l'objet est sauvegardé dès que
+    tous ses champs sont revenus). Avec `memory`, la mémoire de traduction est consultée
+    avant tout appel ; un même texte en cours de traduction n'est demandé qu'une fois.
+    Avec `pack`, les champs restant à traduire d'un objet partent en une requête packée
+    (au plus `pack_max_fields` traductions et `pack_max_chars` caractères source).
+    """
+
+    def __init__(
+        self,
+        provider: TranslationProvider,
+        *,
+        workers: int = 4,
+        rate: float = 5.0,
+        burst: float | None = None,
+        max_retries: int = 4,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        write_batch_size: int = 50,
+        dry_run: bool = False,
+        memory: TranslationMemoryStore | None = None,
+        on_progress: Callable[[TranslationReport], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        pack: bool = False,
+        pack_max_fields: int = 40,
+        pack_max_chars: int = 12_000,
+    ):
+        self.provider = provider
+        self.workers = max(1, workers)
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.write_batch_size = max(1, write_batch_size)
+        self.dry_run = dry_run
+        self.memory = memory
+        self.on_progress = on_progress
+        self.should_stop = should_stop
+        self.pack = pack
+        self.pack_max_fields = max(1, pack_max_fields)
+        self.pack_max_chars = pack_max_chars
+        self._stats_lock = threading.Lock()
+
+    def _with_retries(self, fn: Callable[[], str], report: TranslationReport) -> str:
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            with self._stats_lock:
+                report.provider_calls += 1
+            try:
+                return fn()
+            except TranslationProviderError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+            attempt += 1
+            with self._stats_lock:
+                report.retries += 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+            time.sleep(delay * (0.5 + random.random() / 2))
+
+    def _call_one(self, leads: list[TranslationTask], report: TranslationReport) -> list:
+        (task,) = leads
+        try:
+            value = self._with_retries(
+                lambda: self.provider.translate(task.text, target_lang=task.target, context=task.context), report
+            )
+        except Exception as e:  # noqa: BLE001 — l'échec d'un champ n'arrête pas le run
+            return [e]
+        return [value]
+
+    def _call_packed(self, leads: list[TranslationTask], report: TranslationReport) -> list:
+        """Une requête pour les tâches d'un objet ; un même texte vers plusieurs langues = une entrée."""
+        items: dict[tuple[str, str], list] = {}  # (texte, contexte) → [clé, langues]
+        for task in leads:
+            entry = items.setdefault((task.text, task.context), [f"f{len(items) + 1}", []])
+            entry[1].append(task.target)
+        packed = [PackedItem(key, text, context, tuple(langs)) for (text, context), (key, langs) in items.items()]
+        try:
+            values, fallbacks = translate_packed(
+                self.provider, packed, call=lambda fn: self._with_retries(fn, report)
+            )
+        except Exception as e:  # noqa: BLE001
+            return [e] * len(leads)
+        with self._stats_lock:
+            report.packed_requests += 1
+            report.pack_fallbacks += fallbacks
+        return [values[(items[(task.text, task.context)][0], task.target)] for task in leads]
+
+    def _flush(self, pending: list, report: TranslationReport) -> None:
+        if not pending:
+            return
+        if not self.dry_run:
+            with transaction.atomic():
+                for obj, done in pending:
+                    update_fields = sorted(done)
+                    if hasattr(obj, "updated_at"):
+                        update_fields.append("updated_at")
+                    obj.save(update_fields=update_fields)
+                    record_translations(obj, [(t.field, t.target, t.text) for t in done.values()])
+        report.objects_updated += len(pending)
+        pending.clear()
+        if self.on_progress is not None:
+            self.on_progress(report)
+
+    def run(self, tasks: Iterable[TranslationTask]) -> TranslationReport:
+        report = TranslationReport()
+        started = time.monotonic()
+        remaining: dict[int, int] = {}  # id(obj) → tâches encore en vol
+        done_fields: dict[int, dict] = {}  # id(obj) → {attname cible: tâche}
+        objects: dict[int, Any] = {}
+        to_write: list = []
+        max_in_flight = self.workers * 4
+        submitting = None  # objet dont les tâches ne sont pas toutes soumises
+
+        def finalize(key):
+            if remaining.get(key) != 0 or key == submitting:
+                return
+            if done_fields[key]:
+                to_write.append((objects[key], done_fields[key]))
+            del remaining[key], done_fields[key], objects[key]
+            if len(to_write) >= self.write_batch_size:
+                self._flush(to_write, report)
+
+        def apply(task, value, error=None):
+            key = id(task.obj)
+            if error is not None:
+                report.failures.append((task, error))
+            else:
+                setattr(task.obj, task.target_attname, value)
+                done_fields[key][task.target_attname] = task
+                report.fields_translated += 1
+            remaining[key] -= 1
+            finalize(key)
+
+        def settle(future, leads):
+            for lead, outcome in zip(leads, future.result()):
+                waiting = waiters.pop(memory_key(lead.text, lead.target, lead.context))
+                if isinstance(outcome, Exception):
+                    for task in waiting:
+                        apply(task, None, str(outcome))
+                    continue
+                if self.memory is not None and not self.dry_run:
+                    self.memory.remember(lead.text, lead.target, lead.context, outcome)
+                for task in waiting:
+                    apply(task, outcome)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="translate") as pool:
+            in_flight = {}  # future → tâches « meneuses » (une par texte demandé)
+            waiters = {}  # memory_key → tâches qui attendent ce texte (la meneuse en tête)
+            pack: list[TranslationTask] = []  # meneuses de l'objet en cours, mode packé
+
+            def drain(return_when):
+                finished, _ = wait(in_flight, return_when=return_when)
+                for future in finished:
+                    settle(future, in_flight.pop(future))
+
+            def submit(leads):
+                call = self._call_packed if self.pack else self._call_one
+                in_flight[pool.submit(call, leads, report)] = leads
+                if len(in_flight) >= max_in_flight:
+                    drain(FIRST_COMPLETED)
+
+            def submit_pack():
+                if pack:
+                    leads = pack[:]
+                    pack.clear()
+                    submit(leads)
+
+            for task in tasks:
+                if self.should_stop is not None and self.should_stop():
+                    # Annulation : plus rien de nouveau, ce qui est en vol est écrit.
+                    report.cancelled = True
+                    break
+                key = id(task.obj)
+                if key != submitting:
+                    submit_pack()
+                    previous, submitting = submitting, key
+                    if previous is not None:
+                        finalize(previous)
+                    objects[key] = task.obj
+                    remaining.setdefault(key, 0)
+                    done_fields.setdefault(key, {})
+                remaining[key] += 1
+
+                if self.memory is not None:
+                    cached = self.memory.lookup(task.text, task.target, task.context)
+                    if cached is not None:
+                        report.memory_hits += 1
+                        apply(task, cached)
+                        continue
+                text_key = memory_key(task.text, task.target, task.context)
+                if text_key in waiters:
+                    report.deduplicated += 1
+                    waiters[text_key].append(task)
+                    continue
+                waiters[text_key] = [task]
+                if not self.pack:
+                    submit([task])
+                    continue
+                pack.append(task)
+                if (
+                    len(pack) >= self.pack_max_fields
+                    or sum(len(t.text) for t in pack) >= self.pack_max_chars
+                ):
+                    submit_pack()
+            submit_pack()
+            previous, submitting = submitting, None
+            if previous is not None:
+                finalize(previous)
+            while in_flight:
+                drain(FIRST_COMPLETED)
+        if self.memory is not None:
+            self.memory.flush()
+        self._flush(to_write, report)
+        report.elapsed = time.monotonic() - started
+        if self.on_progress is not None:
+            self.on_progress(report)
+        return report
@@ -0,0 +1,105 @@
+"""
+Suivi des sources traduites (modèle TranslationFingerprint).
+
+Quand une traduction est écrite (translate_models, « Appliquer » admin, approbation d'une
+proposition staff), on enregistre le hash de la source FR utilisée. À chaque save d'un
+modèle traduit, le hash de la source FR actuelle est reporté sur ses empreintes : si le
+texte FR a changé, l'empreinte devient périmée (source_hash ≠ translated_hash) et seul ce
+champ est retraduit au passage suivant.
+
+Une traduction sans empreinte (saisie avant ce suivi) est considérée à jour ;
+`translate_models --record-baseline` enregistre l'état actuel comme référence.
+"""
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from modeltranslation.settings import DEFAULT_LANGUAGE as SOURCE_LANGUAGE
+from modeltranslation.translator import NotRegistered, translator
+
+from .models import TranslationFingerprint
+from .translation_memory import normalize_source
+
+
+def source_fingerprint(text) -> str:
+    return hashlib.sha256(normalize_source(text or "").encode("utf-8")).hexdigest()
+
+
+def translated_fields(model) -> tuple:
+    try:
+        return tuple(translator.get_options_for_model(model).fields)
+    except NotRegistered:
+        return ()
+
+
+def record_translations(obj, entries) -> None:
+    """
+    entries : (field, target_lang, source_text | None). La source par défaut est la valeur
+    FR actuelle de l'objet. L'empreinte est marquée à jour pour ce champ et cette langue.
+    """
+    ct = ContentType.objects.get_for_model(obj)
+    for field, target_lang, source_text in entries:
+        if source_text is None:
+            source_text = getattr(obj, f"{field}_{SOURCE_LANGUAGE}", "")
+        digest = source_fingerprint(source_text)
+        TranslationFingerprint.objects.update_or_create(
+            content_type=ct,
+            object_id=str(obj.pk),
+            field=field,
+            target_lang=target_lang,
+            defaults={"source_hash": digest, "translated_hash": digest},
+        )
+
+
+def stale_fingerprints(model, target_lang, fields=None):
+    """Empreintes périmées d'un modèle pour une langue (queryset)."""
+    qs = TranslationFingerprint.objects.filter(
+        content_type=ContentType.objects.get_for_model(model), target_lang=target_lang
+    ).exclude(translated_hash=F("source_hash"))
+    if fields is not None:
+        qs = qs.filter(field__in=list(fields))
+    return qs
+
+
+def is_stale(obj, field, target_lang) -> bool:
+    return stale_fingerprints(type(obj), target_lang, [field]).filter(object_id=str(obj.pk)).exists()
+
+
+def _on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields = translated_fields(sender)
+    if update_fields is not None:
+        touched = set(update_fields)
+        fields = tuple(f for f in fields if f in touched or f"{f}_{SOURCE_LANGUAGE}" in touched)
+    if not fields:
+        return
+    rows = list(
+        TranslationFingerprint.objects.filter(
+            content_type=ContentType.objects.get_for_model(sender),
+            object_id=str(instance.pk),
+            field__in=fields,
+        )
+    )
+    digests = {}
+    for row in rows:
+        if row.field not in digests:
+            digests[row.field] = source_fingerprint(getattr(instance, f"{row.field}_{SOURCE_LANGUAGE}", ""))
+        if row.source_hash != digests[row.field]:
+            row.source_hash = digests[row.field]
+            row.save(update_fields=["source_hash", "updated_at"])
+
+
+def _on_delete(sender, instance, **kwargs):
+    TranslationFingerprint.objects.filter(
+        content_type=ContentType.objects.get_for_model(sender), object_id=str(instance.pk)
+    ).delete()
+
+
+def connect_fingerprint_signals():
+    """Branche le suivi sur chaque modèle enregistré dans modeltranslation (CoreConfig.ready)."""
+    for model in translator.get_registered_models(abstract=False):
+        uid = f"translation_fingerprint:{model._meta.label}"
+        post_save.connect(_on_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_delete, sender=model, dispatch_uid=uid)
@@ -0,0 +1,107 @@
+"""
+Mémoire de traduction (modèle TranslationMemory).
+
+Clé : (sha256 du texte source normalisé, langue cible, classe de contexte). La classe de
+contexte est le nom du champ ("courses.Schedule.location_name" → "location_name") : un même
+lieu, un même « En savoir plus » ou un même nom de niveau n'est traduit qu'une fois, quel que
+soit le modèle qui le porte.
+
+Politique :
+- une traduction obtenue du fournisseur est mémorisée (sans écraser l'existant) ;
+- une traduction appliquée à la main par un admin remplace l'entrée (correction humaine) ;
+- hit_count / last_used_at sont mis à jour par lots ; `prune_translation_memory` évince les
+  entrées inutilisées depuis N jours, plafonne le nombre d'entrées ou invalide un contexte.
+"""
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import TranslationMemory
+
+_INLINE_SPACES = re.compile(r"[ \t]+")
+
+
+def normalize_source(text: str) -> str:
+    """NFC, fins de ligne unifiées, espaces répétés et de bord retirés (sauts de ligne conservés)."""
+    text = unicodedata.normalize("NFC", str(text)).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(_INLINE_SPACES.sub(" ", line).strip() for line in text.split("\n")).strip()
+
+
+def context_class(context: str) -> str:
+    return (context or "").rsplit(".", 1)[-1]
+
+
+def memory_key(text: str, target_lang: str, context: str) -> tuple:
+    digest = hashlib.sha256(normalize_source(text).encode("utf-8")).hexdigest()
+    return digest, target_lang, context_class(context)
+
+
+class TranslationMemoryStore:
+    """Accès à la mémoire pour un run (commande) ou une requête (admin), avec compteurs."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._known = {}  # clé → traduction, évite de relire la même entrée
+        self._pending_hits = Counter()
+
+    def lookup(self, text: str, target_lang: str, context: str):
+        key = memory_key(text, target_lang, context)
+        if key not in self._known:
+            source_hash, lang, ctx = key
+            entry = (
+                TranslationMemory.objects.filter(source_hash=source_hash, target_lang=lang, context_class=ctx)
+                .only("translated_text")
+                .first()
+            )
+            self._known[key] = entry.translated_text if entry else None
+        value = self._known[key]
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._pending_hits[key] += 1
+        return value
+
+    def remember(self, text: str, target_lang: str, context: str, translated: str, *, overwrite: bool = False):
+        key = memory_key(text, target_lang, context)
+        source_hash, lang, ctx = key
+        lookup = {"source_hash": source_hash, "target_lang": lang, "context_class": ctx}
+        defaults = {"source_text": normalize_source(text), "translated_text": translated}
+        try:
+            with transaction.atomic():
+                if overwrite:
+                    TranslationMemory.objects.update_or_create(**lookup, defaults=defaults)
+                else:
+                    TranslationMemory.objects.get_or_create(**lookup, defaults=defaults)
+        except IntegrityError:
+            # Écrite entre-temps par un autre processus : la première traduction gagne.
+            pass
+        if overwrite or self._known.get(key) is None:
+            self._known[key] = translated
+
+    def flush(self):
+        """Reporte hit_count / last_used_at en base (un UPDATE par entrée touchée)."""
+        now = timezone.now()
+        for (source_hash, lang, ctx), count in self._pending_hits.items():
+            TranslationMemory.objects.filter(source_hash=source_hash, target_lang=lang, context_class=ctx).update(
+                hit_count=F("hit_count") + count, last_used_at=now
+            )
+        self._pending_hits.clear()
+
+
+def translate_with_memory(provider, text: str, *, target_lang: str, context: str) -> str:
+    """Un texte : mémoire d'abord, fournisseur sinon (la réponse est mémorisée)."""
+    store = TranslationMemoryStore()
+    cached = store.lookup(text, target_lang, context)
+    if cached is not None:
+        store.flush()
+        return cached
+    translated = provider.translate(text, target_lang=target_lang, context=context)
+    store.remember(text, target_lang, context, translated)
+    return translated
@@ -1,21 +1,26 @@
 """
 Vues API Core — menu (items racine avec children récursifs), health check.
 """
-import os
 from django.http import JsonResponse
 from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils import timezone, translation
-from django.core.management import call_command
 from django.apps import apps
 from rest_framework import status, viewsets
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from google import genai
-from .gemini_utils import gemini_error_message
-from .models import MenuItem, SiteConfiguration, ExplorePreset, Bulletin, PendingContentEdit, FaqItem
+from .content_cache import cache_public_get, invalidation_metrics
+from .fieldsets import sparse_queryset
+from .jobs import enqueue_job, job_payload, request_cancel
+from .menu_tree import get_menu_tree
+from .pagination import keyset_paginated_response
+from .single_flight import fill_metrics
+from .singletons import get_site_configuration, site_configuration_for_update
+from .translation_engine import shared_gemini_provider, translate_packed_with_memory
+from .translation_fingerprints import is_stale, record_translations
+from .translation_memory import TranslationMemoryStore, translate_with_memory
+from .models import SiteConfiguration, ExplorePreset, Bulletin, PendingContentEdit, FaqItem, BackgroundJob
 from .serializers import (
-    MenuItemSerializer,
     SiteConfigurationSerializer,
     ExplorePresetSerializer,
     BulletinSerializer,
@@ -28,6 +33,7 @@ from .pending_edits import (
     SITE_CONFIG_MARKDOWN_PATCH_KEYS,
     _apply_siteconfig_translated_payload,
     apply_pending_edit,
+    review_pending_edits,
 )
 
 # Langues alignées sur modeltranslation (vision_markdown_fr / _en / _es).
@@ -48,19 +54,43 @@ def _user_is_admin_direct(user) -> bool:
     return getattr(user, "user_type", None) == "ADMIN"
 
 
+def site_configuration_payload(request, lang):
+    """Configuration sérialisée (singleton en lecture seule), réutilisée par /api/bootstrap/."""
+    with translation.override(lang):
+        return SiteConfigurationSerializer(get_site_configuration(), context={'request': request}).data
+
+
 class SiteConfigurationAPIView(APIView):
     """GET /api/config/?lang=fr|en|es — lecture publique (champs traduits modeltranslation)."""
+    @cache_public_get("config")
+    def get(self, request):
+        return Response(site_configuration_payload(request, _request_translation_lang(request)))
+
+
+class BootstrapAPIView(APIView):
+    """
+    GET /api/bootstrap/?lang=fr|en|es
+    Tout ce qu'il faut au premier affichage du front en une réponse :
+    {"lang", "config" (= /api/config/, avec explore_config et video_ambience),
+     "menu" (= /api/menu/items/), "nodes" (= /api/organization/nodes/, version légère)}.
+    Mis en cache par langue ; invalidé dès qu'une des familles config / menu / organization change.
+    """
+
+    @cache_public_get("config", "menu", "organization")
     def get(self, request):
+        from apps.organization.views import organization_nodes_payload
+
         lang = _request_translation_lang(request)
-        config = SiteConfiguration.objects.first()
-        if not config:
-            config = SiteConfiguration.objects.create()
-        translation.activate(lang)
-        try:
-            serializer = SiteConfigurationSerializer(config, context={'request': request})
-            return Response(serializer.data)
-        finally:
-            translation.deactivate()
+        with translation.override(lang):
+            nodes = organization_nodes_payload(request)
+        return Response(
+            {
+                "lang": lang,
+                "config": site_configuration_payload(request, lang),
+                "menu": get_menu_tree(lang),
+                "nodes": nodes,
+            }
+        )
 
 
 def health_check(request):
@@ -75,17 +105,12 @@ class MenuItemListAPIView(APIView):
     GET /api/menu/items/?lang=fr|en|es
     Liste des MenuItem racine (parent=None), avec enfants récursifs. Ordre par order.
     Le paramètre lang active modeltranslation sur le champ name (MenuItem).
+    Arbre construit en une requête et mis en cache par langue (apps/core/menu_tree.py).
     """
 
+    @cache_public_get("menu")
     def get(self, request):
-        lang = _request_translation_lang(request)
-        items = MenuItem.objects.filter(parent=None, is_active=True).order_by("order")
-        translation.activate(lang)
-        try:
-            serializer = MenuItemSerializer(items, many=True)
-            return Response(serializer.data)
-        finally:
-            translation.deactivate()
+        return Response(get_menu_tree(_request_translation_lang(request)))
 
 
 class BulletinListAPIView(APIView):
@@ -93,10 +118,13 @@ class BulletinListAPIView(APIView):
     GET /api/identite/bulletins/
     Liste des bulletins publiés, ordre chronologique inverse (plus récent en premier).
     """
+    @cache_public_get("bulletins")
     def get(self, request):
         qs = Bulletin.objects.filter(is_published=True).order_by("-published_at", "-created_at")
-        serializer = BulletinSerializer(qs, many=True)
-        return Response(serializer.data)
+        qs = sparse_queryset(qs, request, BulletinSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: BulletinSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class BulletinDetailAPIView(APIView):
@@ -104,6 +132,7 @@ class BulletinDetailAPIView(APIView):
     GET /api/identite/bulletins/<slug>/
     Détail d'un bulletin par slug (publiés uniquement).
     """
+    @cache_public_get("bulletins")
     def get(self, request, slug):
         bulletin = get_object_or_404(Bulletin, slug=slug, is_published=True)
         serializer = BulletinSerializer(bulletin)
@@ -116,12 +145,14 @@ class FaqItemListAPIView(APIView):
     Liste des FAQ publiées, ordonnées par le champ order puis date de création.
     Le paramètre lang active modeltranslation pour question / answer.
     """
+    @cache_public_get("faq")
     def get(self, request):
         lang = _request_translation_lang(request)
         qs = FaqItem.objects.filter(is_published=True).order_by("order", "created_at")
+        qs = sparse_queryset(qs, request, FaqItemSerializer)
         translation.activate(lang)
         try:
-            serializer = FaqItemSerializer(qs, many=True)
+            serializer = FaqItemSerializer(qs, many=True, context={"request": request})
             return Response(serializer.data)
         finally:
             translation.deactivate()
@@ -144,16 +175,12 @@ class SiteConfigurationAdminAPIView(APIView):
 
     def get(self, request):
         """Expose les textes EN/ES déjà enregistrés pour Notre vision / Notre histoire (rappel avant traduction)."""
-        config = SiteConfiguration.objects.first()
-        if not config:
-            config = SiteConfiguration.objects.create()
+        config = get_site_configuration()
         return Response({"identity_translations": _siteconfig_identity_translations_payload(config)})
 
     def patch(self, request):
         lang = _request_translation_lang(request)
-        config = SiteConfiguration.objects.first()
-        if not config:
-            config = SiteConfiguration.objects.create()
+        config = site_configuration_for_update()
         payload = {}
         for key in SITE_CONFIG_MARKDOWN_PATCH_KEYS:
             if request.data.get(key) is not None:
@@ -290,6 +317,7 @@ class PendingContentEditListAPIView(APIView):
     """
     GET /api/admin/pending-edits/ — liste des modifications en attente.
     Admin : toutes les demandes PENDING. Staff : uniquement les siennes.
+    Filtre optionnel ?content_type= ; pagination par curseur avec ?limit= / ?cursor=.
     """
     permission_classes = [IsStaffOrSuperUser]
 
@@ -297,9 +325,48 @@ class PendingContentEditListAPIView(APIView):
         qs = PendingContentEdit.objects.filter(status=PendingContentEdit.Status.PENDING)
         if not getattr(request.user, "is_superuser", False):
             qs = qs.filter(requested_by=request.user)
+        if request.query_params.get("content_type"):
+            qs = qs.filter(content_type=request.query_params["content_type"])
         qs = qs.select_related("requested_by", "reviewed_by").order_by("-created_at")
-        serializer = PendingContentEditSerializer(qs, many=True)
-        return Response(serializer.data)
+        return keyset_paginated_response(
+            request, qs, lambda rows: PendingContentEditSerializer(rows, many=True).data
+        )
+
+
+class PendingContentEditBulkAPIView(APIView):
+    """
+    POST /api/admin/pending-edits/bulk/ — approuver ou refuser un lot (admin uniquement).
+    Body: { "action": "approve" | "reject", "ids": [1, 2, …] }
+    Demandes groupées par objet cible, une transaction et une sauvegarde par objet ;
+    retour : un résultat par id (approved, rejected, skipped, not_found, error).
+    """
+    permission_classes = [IsSuperUser]
+    max_ids = 500
+
+    def post(self, request):
+        action = (request.data.get("action") or "").strip().lower()
+        if action not in ("approve", "reject"):
+            return Response(
+                {"error": "action doit être 'approve' ou 'reject'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        raw_ids = request.data.get("ids")
+        if not isinstance(raw_ids, list) or not raw_ids:
+            return Response({"error": "ids doit être une liste non vide"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in raw_ids))
+        except (TypeError, ValueError):
+            return Response({"error": "ids doit contenir des entiers"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > self.max_ids:
+            return Response(
+                {"error": f"{self.max_ids} demandes au plus par lot"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        results = review_pending_edits(ids, action, request.user)
+        counts = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return Response({"results": results, "counts": counts})
 
 
 class PendingContentEditDetailAPIView(APIView):
@@ -341,6 +408,7 @@ class AdminTranslateAPIView(APIView):
 
     Permet de déclencher la commande management `translate_models` pour les traductions EN/ES.
     Ce endpoint est prévu pour l'UX "bouton admin → popup → lancer traduction".
+    Répond 202 avec l'id de la tâche de fond ; suivi via GET /api/admin/jobs/<id>/.
     """
 
     permission_classes = [IsSuperUser]
@@ -373,27 +441,70 @@ class AdminTranslateAPIView(APIView):
             fields_filter = [f.strip() for f in fields_filter.split(",") if f.strip()]
         fields_filter = [str(f).strip() for f in fields_filter if str(f).strip()]
 
-        results = {}
-        # Important: call_command peut être long, mais c'est un endpoint admin.
-        from io import StringIO
+        # La commande peut durer plusieurs minutes : elle part dans la file des tâches de fond
+        # (worker `run_jobs`) et l'admin suit la progression via /api/admin/jobs/<id>/.
+        job = enqueue_job(
+            "translate_models",
+            {
+                "targets": targets,
+                "limit": limit,
+                "dry_run": dry_run,
+                "model": model_filter,
+                "fields": fields_filter,
+            },
+            request.user,
+        )
+        return Response(job_payload(job), status=status.HTTP_202_ACCEPTED)
 
-        for lang in targets:
-            out = StringIO()
-            try:
-                call_command(
-                    "translate_models",
-                    target=lang,
-                    limit=limit,
-                    dry_run=dry_run,
-                    model=model_filter,
-                    fields=",".join(fields_filter) if fields_filter else "",
-                    stdout=out,
-                )
-                results[lang] = {"status": "ok", "output": out.getvalue().strip()}
-            except Exception as e:
-                results[lang] = {"status": "error", "error": str(e)}
 
-        return Response({"results": results}, status=status.HTTP_200_OK)
+class AdminCacheMetricsAPIView(APIView):
+    """GET /api/admin/cache/metrics/ — invalidations et lectures single-flight du cache public (processus courant)."""
+
+    permission_classes = [IsSuperUser]
+
+    def get(self, request):
+        return Response({**invalidation_metrics(), "fills": fill_metrics()})
+
+
+class AdminJobListAPIView(APIView):
+    """GET /api/admin/jobs/?status=&kind= — dernières tâches de fond (50 max)."""
+
+    permission_classes = [IsSuperUser]
+
+    def get(self, request):
+        qs = BackgroundJob.objects.all()
+        if request.query_params.get("status"):
+            qs = qs.filter(status=request.query_params["status"])
+        if request.query_params.get("kind"):
+            qs = qs.filter(kind=request.query_params["kind"])
+        return Response({"results": [job_payload(job) for job in qs.defer("output")[:50]]})
+
+
+class AdminJobDetailAPIView(APIView):
+    """GET /api/admin/jobs/<id>/ — statut, progression et sortie d'une tâche de fond."""
+
+    permission_classes = [IsSuperUser]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(BackgroundJob, pk=job_id)
+        return Response(job_payload(job))
+
+
+class AdminJobCancelAPIView(APIView):
+    """POST /api/admin/jobs/<id>/cancel/ — annule une tâche en file ou en cours."""
+
+    permission_classes = [IsSuperUser]
+
+    def post(self, request, job_id):
+        job = get_object_or_404(BackgroundJob, pk=job_id)
+        if job.status not in (BackgroundJob.Status.QUEUED, BackgroundJob.Status.RUNNING):
+            return Response(
+                {"error": f"Tâche déjà terminée ({job.status})"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        request_cancel(job)
+        job.refresh_from_db()
+        return Response(job_payload(job), status=status.HTTP_202_ACCEPTED)
 
 
 class _TranslationAdminMixin:
@@ -433,10 +544,7 @@ class _TranslationAdminMixin:
         object_id = request.data.get("object_id")
         if model_name == "core.SiteConfiguration":
             if object_id in (None, "", 0, "0"):
-                obj = Model.objects.first()
-                if not obj:
-                    obj = Model.objects.create()
-                return obj
+                return site_configuration_for_update()
         if object_id in (None, ""):
             raise ValueError("object_id est requis pour ce model")
         if model_name == "core.Bulletin":
@@ -452,30 +560,7 @@ class _TranslationAdminMixin:
         return get_object_or_404(Model, pk=object_id)
 
     def _gemini_translate(self, *, text: str, target_lang: str, context: str) -> str:
-        api_key = os.getenv("GEMINI_API_KEY", "")
-        if not api_key:
-            raise RuntimeError("Missing GEMINI_API_KEY environment variable")
-        model_name = os.getenv("GEMINI_MODEL_NAME", "gemini-2.5-flash")
-        client = genai.Client(api_key=api_key)
-
-        prompt = (
-            f"Tu es un traducteur professionnel.\n"
-            f"Contexte du champ : {context}\n"
-            f"Langue cible : {target_lang}\n\n"
-            f"Règles :\n"
-            f"- Traduire uniquement.\n"
-            f"- Conserver la mise en forme (Markdown si présent) et les retours à la ligne.\n"
-            f"- Ne pas altérer les slugs / codes / URLs.\n\n"
-            f"Texte à traduire :\n{text}"
-        )
-        try:
-            resp = client.models.generate_content(model=model_name, contents=prompt)
-        except Exception as e:
-            msg = str(e)
-            raise RuntimeError(
-                gemini_error_message(msg, api_key=api_key, model_name=model_name)
-            ) from e
-        return (getattr(resp, "text", None) or str(resp)).strip()
+        return translate_with_memory(shared_gemini_provider(), text, target_lang=target_lang, context=context)
 
 
 class AdminTranslatePreviewAPIView(_TranslationAdminMixin, APIView):
@@ -483,7 +568,7 @@ class AdminTranslatePreviewAPIView(_TranslationAdminMixin, APIView):
     POST /api/admin/translate/preview/
     Body: { model, object_id?, field, target, source_text? }
     source_text optionnel : texte FR du textarea (même non sauvegardé).
-    Retour: source + valeur cible actuelle + suggestion Gemini.
+    Retour: source + valeur cible actuelle (+ stale si la source FR a changé depuis) + suggestion Gemini.
     """
 
     permission_classes = [IsStaffOrSuperUser]
@@ -526,12 +611,99 @@ class AdminTranslatePreviewAPIView(_TranslationAdminMixin, APIView):
                 "target": target,
                 "source": str(source_val),
                 "current_target": str(current_target),
+                # Traduction existante faite sur une ancienne version du texte FR
+                "stale": bool(current_target) and is_stale(obj, field_name, target),
                 "suggestion": suggestion,
             },
             status=status.HTTP_200_OK,
         )
 
 
+class AdminTranslateBatchPreviewAPIView(_TranslationAdminMixin, APIView):
+    """
+    POST /api/admin/translate/batch-preview/
+    Body: { model, object_id?, fields: [...], targets?: ["en", "es"], source_texts?: {field: texte FR} }
+    Tous les champs et toutes les langues en une seule requête packée (mémoire de traduction d'abord).
+    Retour: par champ, source + valeurs cibles actuelles + stale + suggestion (ou erreur) par langue.
+    """
+
+    permission_classes = [IsStaffOrSuperUser]
+
+    def post(self, request):
+        model_name = str(request.data.get("model") or "").strip()
+        if model_name not in self.ALLOWED_MODEL_FIELDS:
+            return Response({"error": "model non autorisé"}, status=status.HTTP_400_BAD_REQUEST)
+        fields = request.data.get("fields") or []
+        if isinstance(fields, str):
+            fields = [f.strip() for f in fields.split(",") if f.strip()]
+        fields = list(dict.fromkeys(str(f).strip() for f in fields if str(f).strip()))
+        if not fields or any(f not in self.ALLOWED_MODEL_FIELDS[model_name] for f in fields):
+            return Response({"error": "fields non autorisés pour ce model"}, status=status.HTTP_400_BAD_REQUEST)
+        targets = request.data.get("targets") or sorted(self.ALLOWED_TARGETS)
+        if isinstance(targets, str):
+            targets = [targets]
+        targets = list(dict.fromkeys(str(t).lower().strip() for t in targets))
+        if any(t not in self.ALLOWED_TARGETS for t in targets):
+            return Response(
+                {"error": "targets doit contenir uniquement 'en' et/ou 'es'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            obj = self._resolve_object(model_name=model_name, request=request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        overrides = request.data.get("source_texts") or {}
+        if not isinstance(overrides, dict):
+            return Response({"error": "source_texts doit être un objet"}, status=status.HTTP_400_BAD_REQUEST)
+        sources = {}
+        for field_name in fields:
+            override = overrides.get(field_name)
+            if override is not None and str(override).strip() != "":
+                sources[field_name] = str(override)
+            else:
+                src_fr = getattr(obj, f"{field_name}_fr", None)
+                sources[field_name] = str((src_fr if src_fr is not None else "") or getattr(obj, field_name, "") or "")
+        entries = [(f, text, f"{model_name}.{f}") for f, text in sources.items() if text]
+        if not entries:
+            return Response(
+                {"error": "Les champs source FR sont vides, rien à traduire."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            suggestions, memory_hits = translate_packed_with_memory(shared_gemini_provider(), entries, targets)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = {}
+        for field_name, text in sources.items():
+            current = {t: str(getattr(obj, f"{field_name}_{t}", "") or "") for t in targets}
+            result = {
+                "source": text,
+                "current_target": current,
+                "stale": {t: bool(current[t]) and is_stale(obj, field_name, t) for t in targets},
+                "suggestion": {},
+                "errors": {},
+            }
+            for t in targets:
+                value = suggestions.get((field_name, t))
+                if isinstance(value, Exception):
+                    result["errors"][t] = str(value)
+                elif value is not None:
+                    result["suggestion"][t] = value
+            results[field_name] = result
+        return Response(
+            {
+                "model": model_name,
+                "object_id": obj.pk,
+                "targets": targets,
+                "fields": results,
+                "memory_hits": memory_hits,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class AdminTranslateApplyAPIView(_TranslationAdminMixin, APIView):
     """
     POST /api/admin/translate/apply/
@@ -560,6 +732,15 @@ class AdminTranslateApplyAPIView(_TranslationAdminMixin, APIView):
             uf.append("updated_at")
         obj.save(update_fields=uf)
 
+        # Traduction validée par un admin : elle remplace celle de la mémoire
+        # et marque la source FR actuelle comme traduite.
+        src_fr = getattr(obj, f"{field_name}_fr", None) or getattr(obj, field_name, "") or ""
+        if src_fr and value:
+            TranslationMemoryStore().remember(
+                str(src_fr), target, f"{model_name}.{field_name}", value, overwrite=True
+            )
+            record_translations(obj, [(field_name, target, str(src_fr))])
+
         return Response(
             {
                 "model": model_name,
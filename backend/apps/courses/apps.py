@@ -5,3 +5,8 @@ class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.courses"
     verbose_name = "Cours"
+
+    def ready(self):
+        from .timetable import connect_timetable_signals
+
+        connect_timetable_signals()
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.content_cache import bump_generation
+from apps.courses.timetable import rebuild_timetable
+
+
+class Command(BaseCommand):
+    help = "Reconstruit le planning matérialisé (TimetableSlot) à partir des horaires CoF et partenaires."
+
+    def handle(self, *args, **options):
+        count = rebuild_timetable()
+        bump_generation("courses", "partners")
+        self.stdout.write(self.style.SUCCESS(f"Planning reconstruit : {count} créneau(x)."))
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:37
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0003_course_description_en_course_description_es_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimetableSlot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('source', models.CharField(choices=[('cof', 'Capital of Fusion'), ('partner', 'Partenaire')], max_length=10)),
+                ('schedule_id', models.UUIDField()),
+                ('course_id', models.UUIDField()),
+                ('course_name', models.CharField(max_length=255)),
+                ('course_name_fr', models.CharField(max_length=255, null=True)),
+                ('course_name_en', models.CharField(max_length=255, null=True)),
+                ('course_name_es', models.CharField(max_length=255, null=True)),
+                ('course_slug', models.SlugField(max_length=255)),
+                ('style_id', models.UUIDField()),
+                ('style_name', models.CharField(max_length=255)),
+                ('style_name_fr', models.CharField(max_length=255, null=True)),
+                ('style_name_en', models.CharField(max_length=255, null=True)),
+                ('style_name_es', models.CharField(max_length=255, null=True)),
+                ('style_slug', models.SlugField(max_length=255)),
+                ('level_id', models.UUIDField(blank=True, null=True)),
+                ('level_name', models.CharField(blank=True, max_length=255)),
+                ('level_name_fr', models.CharField(blank=True, max_length=255, null=True)),
+                ('level_name_en', models.CharField(blank=True, max_length=255, null=True)),
+                ('level_name_es', models.CharField(blank=True, max_length=255, null=True)),
+                ('level_slug', models.SlugField(blank=True, max_length=255)),
+                ('level_color', models.CharField(blank=True, max_length=50)),
+                ('node_id', models.UUIDField(blank=True, null=True)),
+                ('node_name', models.CharField(blank=True, max_length=255)),
+                ('node_name_fr', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_name_en', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_name_es', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_slug', models.SlugField(blank=True, max_length=255)),
+                ('day_of_week', models.PositiveSmallIntegerField(choices=[(0, 'Lundi'), (1, 'Mardi'), (2, 'Mercredi'), (3, 'Jeudi'), (4, 'Vendredi'), (5, 'Samedi'), (6, 'Dimanche')])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('location_name', models.CharField(blank=True, max_length=255)),
+                ('location_name_fr', models.CharField(blank=True, max_length=255, null=True)),
+                ('location_name_en', models.CharField(blank=True, max_length=255, null=True)),
+                ('location_name_es', models.CharField(blank=True, max_length=255, null=True)),
+            ],
+            options={
+                'verbose_name': 'Créneau du planning',
+                'verbose_name_plural': 'Créneaux du planning',
+                'ordering': ['day_of_week', 'start_time'],
+                'indexes': [models.Index(fields=['day_of_week', 'start_time'], name='timetable_day_start_idx'), models.Index(fields=['style_slug'], name='timetable_style_idx'), models.Index(fields=['level_slug'], name='timetable_level_idx'), models.Index(fields=['node_slug'], name='timetable_node_idx'), models.Index(fields=['course_id'], name='timetable_course_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'schedule_id'), name='unique_timetable_slot_schedule')],
+            },
+        ),
+    ]
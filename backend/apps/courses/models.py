@@ -1,5 +1,5 @@
 """
-Modèles Courses — Course, Schedule, Enrollment. Alignés MCD Phase 1 section 1.4.
+Modèles Courses — Course, Schedule, Enrollment, TimetableSlot (planning matérialisé). Alignés MCD Phase 1 section 1.4.
 """
 from django.db import models
 from apps.core.models import BaseModel
@@ -132,3 +132,56 @@ class TheoryLesson(BaseModel):
 
     def __str__(self):
         return self.title
+
+
+class TimetableSlot(BaseModel):
+    """
+    Créneau du planning hebdomadaire, dénormalisé : une ligne par horaire de cours actif
+    (Schedule CoF ou PartnerSchedule), avec les libellés du cours, du style, du niveau et
+    de la structure recopiés. Table de lecture seule tenue à jour par apps/courses/timetable.py ;
+    les listes de planning la filtrent sans jointure.
+    """
+
+    class Source(models.TextChoices):
+        COF = "cof", "Capital of Fusion"
+        PARTNER = "partner", "Partenaire"
+
+    source = models.CharField(max_length=10, choices=Source.choices)
+    schedule_id = models.UUIDField()
+    course_id = models.UUIDField()
+    course_name = models.CharField(max_length=255)
+    course_slug = models.SlugField(max_length=255)
+    style_id = models.UUIDField()
+    style_name = models.CharField(max_length=255)
+    style_slug = models.SlugField(max_length=255)
+    level_id = models.UUIDField(null=True, blank=True)
+    level_name = models.CharField(max_length=255, blank=True)
+    level_slug = models.SlugField(max_length=255, blank=True)
+    level_color = models.CharField(max_length=50, blank=True)
+    node_id = models.UUIDField(null=True, blank=True)
+    node_name = models.CharField(max_length=255, blank=True)
+    node_slug = models.SlugField(max_length=255, blank=True)
+    day_of_week = models.PositiveSmallIntegerField(choices=Schedule.DAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    location_name = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        verbose_name = "Créneau du planning"
+        verbose_name_plural = "Créneaux du planning"
+        ordering = ["day_of_week", "start_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "schedule_id"], name="unique_timetable_slot_schedule"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["day_of_week", "start_time"], name="timetable_day_start_idx"),
+            models.Index(fields=["style_slug"], name="timetable_style_idx"),
+            models.Index(fields=["level_slug"], name="timetable_level_idx"),
+            models.Index(fields=["node_slug"], name="timetable_node_idx"),
+            models.Index(fields=["course_id"], name="timetable_course_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.course_name} — {self.get_day_of_week_display()} {self.start_time}"
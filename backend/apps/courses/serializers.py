@@ -2,6 +2,8 @@
 Serializers Courses — Course, Schedule et TheoryLesson pour l'API catalogue.
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.users.image_field_api_url import ApiImageField
 from .models import Course, Schedule, TheoryLesson
 
 
@@ -39,7 +41,7 @@ class TeacherSerializer(serializers.Serializer):
     first_name = serializers.CharField()
     last_name = serializers.CharField()
     display_name = serializers.SerializerMethodField()
-    profile_image = serializers.ImageField()
+    profile_image = ApiImageField(source="profile_picture")
 
     def get_display_name(self, obj):
         if obj.first_name and obj.last_name:
@@ -87,7 +89,7 @@ class CourseSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Course allégé pour les listes (sans schedules détaillés)."""
 
     style_name = serializers.CharField(source="style.name", read_only=True)
@@ -123,6 +125,11 @@ class CourseListSerializer(serializers.ModelSerializer):
             "next_schedule",
         )
         read_only_fields = fields
+        sparse_field_sources = {
+            "teachers_count": ("teachers",),
+            "schedules_count": ("schedules",),
+            "next_schedule": ("schedules",),
+        }
 
     def get_teachers_count(self, obj):
         return obj.teachers.count()
@@ -172,7 +179,7 @@ class CourseWriteSerializer(serializers.ModelSerializer):
         )
 
 
-class TheoryLessonSerializer(serializers.ModelSerializer):
+class TheoryLessonSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """TheoryLesson en lecture seule pour GET /api/courses/theory/."""
 
     level_name = serializers.CharField(source="level.name", read_only=True)
@@ -0,0 +1,144 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.core.models import DanceStyle, Level
+from apps.core.testing import client_for
+from apps.organization.models import OrganizationNode
+from apps.partners.models import PartnerCourse, PartnerSchedule
+
+from .models import Course, Schedule, TimetableSlot
+
+User = get_user_model()
+
+Source = TimetableSlot.Source
+
+
+def slot_state():
+    """Contenu comparable de la table (hors id), pour confronter incrémental et reconstruction."""
+    skipped = {"id", "created_at", "updated_at"}
+    fields = [f.attname for f in TimetableSlot._meta.concrete_fields if f.attname not in skipped]
+    return sorted(TimetableSlot.objects.values_list(*fields), key=repr)
+
+
+class TimetableTests(TestCase):
+    """TimetableSlot : mise à jour incrémentale par signaux, filtres du planning, rebuild_timetable."""
+
+    def setUp(self):
+        cache.clear()
+        self.style = DanceStyle.objects.create(name="Bachata", slug="bachata")
+        self.level = Level.objects.create(name="Débutant", slug="debutant")
+        self.node = OrganizationNode.objects.create(name="Paris", slug="paris")
+        self.course = Course.objects.create(
+            name="Bachata 1", slug="bachata-1", style=self.style, level=self.level, node=self.node
+        )
+        self.schedule = Schedule.objects.create(
+            course=self.course, day_of_week=2, start_time="19:00", end_time="20:30", location_name="Studio A"
+        )
+        self.partner_course = PartnerCourse.objects.create(
+            name="Salsa partenaire", slug="salsa-partenaire", style=self.style, level=self.level
+        )
+        self.partner_level = Level.objects.create(name="Avancé", slug="avance")
+        self.partner_schedule = PartnerSchedule.objects.create(
+            course=self.partner_course, day_of_week=4, start_time="20:00", end_time="21:00", level=self.partner_level
+        )
+
+    def _planning(self, query=""):
+        response = self.client.get(f"/api/courses/planning/{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _slot(self, source=Source.COF):
+        return TimetableSlot.objects.filter(source=source).first()
+
+    def test_schedule_save_and_delete(self):
+        self.assertEqual((self._slot().day_of_week, self._slot().location_name), (2, "Studio A"))
+
+        self.schedule.day_of_week = 3
+        self.schedule.save()
+        self.assertEqual(self._slot().day_of_week, 3)
+
+        self.schedule.delete()
+        self.assertIsNone(self._slot())
+        self.assertEqual(TimetableSlot.objects.count(), 1)
+
+    def test_course_deactivation_removes_and_restores_slots(self):
+        self.course.is_active = False
+        self.course.save()
+        self.assertIsNone(self._slot())
+        self.assertEqual([row["source"] for row in self._planning()], ["partner"])
+
+        self.course.is_active = True
+        self.course.save()
+        self.assertEqual(self._slot().schedule_id, self.schedule.pk)
+
+    def test_label_renames_reach_slots_and_cached_planning(self):
+        self.assertEqual({row["style_name"] for row in self._planning()}, {"Bachata"})
+
+        self.style.name = "Bachata sensual"
+        self.style.save()
+        self.level.name = "Initiation"
+        self.level.save()
+        self.node.name = "Paris 11"
+        self.node.save()
+
+        self.assertEqual({row["style_name"] for row in self._planning()}, {"Bachata sensual"})
+        cof = self._planning("?source=cof")[0]
+        self.assertEqual((cof["level_name"], cof["node_name"]), ("Initiation", "Paris 11"))
+
+    def test_deleted_schedule_level_falls_back_to_course_level(self):
+        self.assertEqual(self._slot(Source.PARTNER).level_slug, "avance")
+
+        self.partner_level.delete()
+
+        self.partner_schedule.refresh_from_db()
+        self.assertIsNone(self.partner_schedule.level_id)
+        self.assertEqual(self._slot(Source.PARTNER).level_slug, "debutant")
+
+    def test_partner_admin_schedule_replacement_refreshes_slots(self):
+        admin = User.objects.create(username="admin", user_type=User.UserType.ADMIN)
+        schedules = [
+            {"day_of_week": 0, "start_time": "18:00", "end_time": "19:00", "location_name": "Salle 1"},
+            {"day_of_week": 5, "start_time": "15:00", "end_time": "16:00", "level": str(self.partner_level.pk)},
+        ]
+        response = client_for(admin).patch(
+            f"/api/admin/partners/courses/{self.partner_course.slug}/",
+            {"schedules": json.dumps(schedules)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        rows = self._planning("?source=partner")
+        self.assertEqual(
+            [(row["day_of_week"], row["start_time"], row["level_slug"]) for row in rows],
+            [(0, "18:00", "debutant"), (5, "15:00", "avance")],
+        )
+
+    def test_day_and_source_filters(self):
+        self.assertEqual([row["source"] for row in self._planning()], ["cof", "partner"])
+        self.assertEqual([row["source"] for row in self._planning("?source=partner")], ["partner"])
+        self.assertEqual([row["day_of_week"] for row in self._planning("?day=4")], [4])
+        # Source inconnue : ignorée ; jour invalide : ignoré.
+        self.assertEqual(len(self._planning("?source=other&day=x")), 2)
+        schedules = self.client.get("/api/courses/schedules/?day=2").json()
+        self.assertEqual([row["id"] for row in schedules], [str(self.schedule.pk)])
+
+        self.assertEqual([c["slug"] for c in self.client.get("/api/courses/?day=2").json()], ["bachata-1"])
+        self.assertEqual(self.client.get("/api/courses/?day=4").json(), [])
+
+    def test_rebuild_matches_incremental_state(self):
+        self.style.name = "Bachata sensual"
+        self.style.save()
+        self.partner_level.delete()
+        Schedule.objects.create(course=self.course, day_of_week=6, start_time="11:00", end_time="12:00")
+        incremental = slot_state()
+
+        out = StringIO()
+        call_command("rebuild_timetable", stdout=out)
+
+        self.assertEqual(slot_state(), incremental)
+        self.assertIn("3 créneau", out.getvalue())
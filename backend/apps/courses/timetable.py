@@ -0,0 +1,147 @@
+"""
+Planning hebdomadaire matérialisé (TimetableSlot).
+
+Une ligne par horaire de cours actif, CoF (Schedule) et partenaires (PartnerSchedule),
+avec les libellés recopiés dans chaque langue. Les vues de planning filtrent cette seule
+table (jour, style, niveau, structure) au lieu de joindre horaire → cours → style / niveau / noeud.
+
+Mise à jour incrémentale par signaux :
+- save / delete d'un horaire → ses créneaux ;
+- save d'un cours → les créneaux de ses horaires (activation / désactivation comprises) ;
+- save / delete d'un style, niveau ou noeud → les créneaux qui le recopient.
+`python manage.py rebuild_timetable` reconstruit tout (déploiement, import en masse).
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.localized import localized_copy
+from apps.core.models import DanceStyle, Level
+from apps.organization.models import OrganizationNode
+from apps.partners.models import PartnerCourse, PartnerNode, PartnerSchedule
+
+from .models import Course, Schedule, TimetableSlot
+
+Source = TimetableSlot.Source
+
+
+def _slot(source, schedule, level):
+    course = schedule.course
+    node = course.node
+    return TimetableSlot(
+        source=source,
+        schedule_id=schedule.pk,
+        course_id=course.pk,
+        course_slug=course.slug,
+        style_id=course.style_id,
+        style_slug=course.style.slug,
+        level_id=level.pk if level else None,
+        level_slug=level.slug if level else "",
+        level_color=level.color if level else "",
+        node_id=node.pk if node else None,
+        node_slug=node.slug if node else "",
+        day_of_week=schedule.day_of_week,
+        start_time=schedule.start_time,
+        end_time=schedule.end_time,
+        **localized_copy("course_name", course, "name"),
+        **localized_copy("style_name", course.style, "name"),
+        **localized_copy("level_name", level, "name"),
+        **localized_copy("node_name", node, "name"),
+        **localized_copy("location_name", schedule, "location_name"),
+    )
+
+
+def _schedules(source):
+    if source == Source.COF:
+        return Schedule.objects.select_related("course", "course__style", "course__level", "course__node")
+    return PartnerSchedule.objects.select_related(
+        "course", "course__style", "course__level", "course__node", "level"
+    )
+
+
+def _build(source, schedule):
+    if source == Source.COF:
+        return _slot(source, schedule, schedule.course.level)
+    # Le niveau d'un créneau partenaire prime sur celui du cours.
+    return _slot(source, schedule, schedule.level or schedule.course.level)
+
+
+def refresh_timetable(source, condition):
+    """
+    Recalcule les créneaux des horaires `source` qui vérifient `condition` (Q sur Schedule /
+    PartnerSchedule) : les horaires d'un cours inactif perdent leur créneau, les autres le
+    (re)gagnent.
+    """
+    schedules = list(_schedules(source).filter(condition))
+    if not schedules:
+        return
+    with transaction.atomic():
+        TimetableSlot.objects.filter(source=source, schedule_id__in=[s.pk for s in schedules]).delete()
+        TimetableSlot.objects.bulk_create(
+            [_build(source, s) for s in schedules if s.course.is_active]
+        )
+
+
+def refresh_timetable_slots(**slot_filters):
+    """Recalcule les créneaux existants qui recopient un objet (ex. style_id=…)."""
+    for source in Source.values:
+        schedule_ids = list(
+            TimetableSlot.objects.filter(source=source, **slot_filters).values_list("schedule_id", flat=True)
+        )
+        if schedule_ids:
+            refresh_timetable(source, Q(pk__in=schedule_ids))
+
+
+def rebuild_timetable():
+    """Reconstruit toute la table ; renvoie le nombre de créneaux."""
+    slots = []
+    for source in Source.values:
+        slots.extend(_build(source, s) for s in _schedules(source).filter(course__is_active=True).iterator())
+    with transaction.atomic():
+        TimetableSlot.objects.all().delete()
+        TimetableSlot.objects.bulk_create(slots, batch_size=500)
+    return len(slots)
+
+
+def _on_schedule_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_timetable(_SCHEDULE_SOURCES[sender], Q(pk=instance.pk))
+
+
+def _on_schedule_delete(sender, instance, **kwargs):
+    TimetableSlot.objects.filter(source=_SCHEDULE_SOURCES[sender], schedule_id=instance.pk).delete()
+
+
+def _on_course_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_timetable(_COURSE_SOURCES[sender], Q(course_id=instance.pk))
+
+
+def _on_label_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_timetable_slots(**{_LABEL_FIELDS[sender]: instance.pk})
+
+
+_SCHEDULE_SOURCES = {Schedule: Source.COF, PartnerSchedule: Source.PARTNER}
+_COURSE_SOURCES = {Course: Source.COF, PartnerCourse: Source.PARTNER}
+_LABEL_FIELDS = {
+    DanceStyle: "style_id",
+    Level: "level_id",
+    OrganizationNode: "node_id",
+    PartnerNode: "node_id",
+}
+
+
+def connect_timetable_signals():
+    """Branche les receivers (appelé par CoursesConfig.ready)."""
+    for model in _SCHEDULE_SOURCES:
+        uid = f"timetable:{model._meta.label}"
+        post_save.connect(_on_schedule_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_schedule_delete, sender=model, dispatch_uid=uid)
+    for model in _COURSE_SOURCES:
+        post_save.connect(_on_course_save, sender=model, dispatch_uid=f"timetable:{model._meta.label}")
+    for model in _LABEL_FIELDS:
+        uid = f"timetable:{model._meta.label}"
+        post_save.connect(_on_label_change, sender=model, dispatch_uid=uid)
+        # Un niveau supprimé passe les créneaux partenaires à NULL (SET_NULL, sans signal).
+        post_delete.connect(_on_label_change, sender=model, dispatch_uid=uid)
@@ -1,6 +1,6 @@
 from modeltranslation.translator import register, TranslationOptions
 
-from .models import Course, Schedule, TheoryLesson
+from .models import Course, Schedule, TheoryLesson, TimetableSlot
 
 
 @register(Course)
@@ -17,3 +17,7 @@ class ScheduleTranslationOptions(TranslationOptions):
 class TheoryLessonTranslationOptions(TranslationOptions):
     fields = ("title", "content")
 
+
+@register(TimetableSlot)
+class TimetableSlotTranslationOptions(TranslationOptions):
+    fields = ("course_name", "style_name", "level_name", "node_name", "location_name")
@@ -1,5 +1,6 @@
 """
 Vues API Courses — liste des cours avec filtres ; détail par slug.
+Vues planning — horaires CoF et planning combiné CoF + partenaires (TimetableSlot).
 Vues théorie — liste et détail des leçons de théorie.
 Vues admin — créer, modifier, supprimer cours et leçons (réservé IsSuperUser).
 """
@@ -8,8 +9,11 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from apps.core.permissions import IsSuperUser, IsStaffOrSuperUser
+from apps.core.content_cache import cache_public_get
+from apps.core.fieldsets import sparse_queryset, trim_row
+from apps.core.pagination import keyset_paginated_response
 from apps.core.models import PendingContentEdit
-from .models import Course, TheoryLesson
+from .models import Course, TheoryLesson, TimetableSlot
 from .serializers import (
     CourseSerializer, CourseListSerializer, CourseWriteSerializer,
     TheoryLessonSerializer, TheoryLessonWriteSerializer, ScheduleSerializer
@@ -22,6 +26,7 @@ class CourseListAPIView(APIView):
     Liste des Course actifs. Query params optionnels : style, level, node (slugs ou UUID).
     """
 
+    @cache_public_get("courses")
     def get(self, request):
         qs = Course.objects.filter(is_active=True).select_related(
             "style", "level", "node"
@@ -40,16 +45,22 @@ class CourseListAPIView(APIView):
             else:
                 qs = qs.filter(node__slug=node)
         
-        # Filtre par jour de la semaine
+        # Filtre par jour de la semaine (planning matérialisé : ni jointure ni distinct)
         day = request.query_params.get("day")
         if day is not None:
             try:
-                qs = qs.filter(schedules__day_of_week=int(day)).distinct()
+                qs = qs.filter(
+                    id__in=TimetableSlot.objects.filter(
+                        source=TimetableSlot.Source.COF, day_of_week=int(day)
+                    ).values("course_id")
+                )
             except ValueError:
                 pass
         
-        serializer = CourseListSerializer(qs, many=True)
-        return Response(serializer.data)
+        qs = sparse_queryset(qs, request, CourseListSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: CourseListSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class CourseDetailAPIView(APIView):
@@ -58,6 +69,7 @@ class CourseDetailAPIView(APIView):
     Détail d'un cours actif par slug avec schedules et teachers. 404 si non trouvé ou inactif.
     """
 
+    @cache_public_get("courses")
     def get(self, request, slug):
         course = get_object_or_404(
             Course.objects.select_related("style", "level", "node").prefetch_related("schedules", "teachers"),
@@ -68,54 +80,99 @@ class CourseDetailAPIView(APIView):
         return Response(serializer.data)
 
 
+def _timetable_queryset(request, source=None):
+    """
+    Créneaux du planning matérialisé (TimetableSlot), filtrés sans jointure.
+    Query params : ?day=0 (lundi), ?style=slug, ?level=slug, ?node=slug ou UUID.
+    """
+    qs = TimetableSlot.objects.order_by("day_of_week", "start_time")
+    if source:
+        qs = qs.filter(source=source)
+
+    day = request.query_params.get("day")
+    if day is not None:
+        try:
+            qs = qs.filter(day_of_week=int(day))
+        except ValueError:
+            pass
+
+    style = request.query_params.get("style")
+    if style:
+        qs = qs.filter(style_slug=style)
+
+    level = request.query_params.get("level")
+    if level:
+        qs = qs.filter(level_slug=level)
+
+    node = request.query_params.get("node")
+    if node:
+        if len(node) == 36 and "-" in node:
+            qs = qs.filter(node_id=node)
+        else:
+            qs = qs.filter(node_slug=node)
+    return qs
+
+
 class ScheduleListAPIView(APIView):
     """
     GET /api/courses/schedules/
     Liste de tous les horaires de cours actifs. Utile pour le planning.
-    Query params: ?day=0 (lundi), ?style=slug, ?level=slug
+    Query params: ?day=0 (lundi), ?style=slug, ?level=slug, ?node=slug
     """
 
+    @cache_public_get("courses")
     def get(self, request):
-        from .models import Schedule
-        qs = Schedule.objects.filter(course__is_active=True).select_related(
-            "course", "course__style", "course__level", "course__node"
-        ).order_by("day_of_week", "start_time")
+        qs = _timetable_queryset(request, source=TimetableSlot.Source.COF)
+        return keyset_paginated_response(
+            request, qs, lambda rows: [trim_row(_schedule_row(slot), request) for slot in rows]
+        )
 
-        day = request.query_params.get("day")
-        if day is not None:
-            try:
-                qs = qs.filter(day_of_week=int(day))
-            except ValueError:
-                pass
 
-        style = request.query_params.get("style")
-        if style:
-            qs = qs.filter(course__style__slug=style)
+class PlanningAPIView(APIView):
+    """
+    GET /api/courses/planning/
+    Planning hebdomadaire combiné : créneaux des cours CoF et des cours partenaires.
+    Mêmes filtres que /api/courses/schedules/, plus ?source=cof|partner.
+    """
+
+    @cache_public_get("courses", "partners")
+    def get(self, request):
+        source = request.query_params.get("source")
+        if source not in TimetableSlot.Source.values:
+            source = None
+        qs = _timetable_queryset(request, source=source)
+        return keyset_paginated_response(
+            request, qs, lambda rows: [trim_row(_planning_row(slot), request) for slot in rows]
+        )
 
-        level = request.query_params.get("level")
-        if level:
-            qs = qs.filter(course__level__slug=level)
-
-        data = []
-        for schedule in qs:
-            data.append({
-                "id": str(schedule.id),
-                "course_id": str(schedule.course.id),
-                "course_name": schedule.course.name,
-                "course_slug": schedule.course.slug,
-                "style_name": schedule.course.style.name,
-                "style_slug": schedule.course.style.slug,
-                "level_name": schedule.course.level.name,
-                "level_slug": schedule.course.level.slug,
-                "level_color": schedule.course.level.color,
-                "node_name": schedule.course.node.name,
-                "day_of_week": schedule.day_of_week,
-                "day_display": schedule.get_day_of_week_display(),
-                "start_time": schedule.start_time.strftime("%H:%M"),
-                "end_time": schedule.end_time.strftime("%H:%M"),
-                "location_name": schedule.location_name,
-            })
-        return Response(data)
+
+def _schedule_row(slot):
+    """Ligne plate d'un horaire pour le planning (GET /api/courses/schedules/)."""
+    return {
+        "id": str(slot.schedule_id),
+        "course_id": str(slot.course_id),
+        "course_name": slot.course_name,
+        "course_slug": slot.course_slug,
+        "style_name": slot.style_name,
+        "style_slug": slot.style_slug,
+        "level_name": slot.level_name,
+        "level_slug": slot.level_slug,
+        "level_color": slot.level_color,
+        "node_name": slot.node_name,
+        "day_of_week": slot.day_of_week,
+        "day_display": slot.get_day_of_week_display(),
+        "start_time": slot.start_time.strftime("%H:%M"),
+        "end_time": slot.end_time.strftime("%H:%M"),
+        "location_name": slot.location_name,
+    }
+
+
+def _planning_row(slot):
+    """Ligne du planning combiné : celle de /schedules/ + origine et slug de la structure."""
+    row = _schedule_row(slot)
+    row["source"] = slot.source
+    row["node_slug"] = slot.node_slug
+    return row
 
 
 class TheoryLessonListAPIView(APIView):
@@ -124,13 +181,16 @@ class TheoryLessonListAPIView(APIView):
     Liste des leçons de théorie actives. Query param optionnel : category.
     """
 
+    @cache_public_get("courses")
     def get(self, request):
         qs = TheoryLesson.objects.filter(is_active=True).select_related("level")
         category = request.query_params.get("category")
         if category:
             qs = qs.filter(category=category)
-        serializer = TheoryLessonSerializer(qs, many=True)
-        return Response(serializer.data)
+        qs = sparse_queryset(qs, request, TheoryLessonSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: TheoryLessonSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class TheoryLessonDetailAPIView(APIView):
@@ -139,6 +199,7 @@ class TheoryLessonDetailAPIView(APIView):
     Détail d'une leçon de théorie par slug.
     """
 
+    @cache_public_get("courses")
     def get(self, request, slug):
         lesson = get_object_or_404(
             TheoryLesson.objects.select_related("level"),
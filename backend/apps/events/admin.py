@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Event, EventPass, Registration
+from . import inventory
+from .models import Event, EventPass, PassHold, Registration
 
 
 @admin.register(Event)
@@ -11,10 +12,38 @@ class EventAdmin(admin.ModelAdmin):
 
 @admin.register(EventPass)
 class EventPassAdmin(admin.ModelAdmin):
-    list_display = ("event", "name", "price", "quantity_available")
+    list_display = ("event", "name", "price", "quantity_available", "reserved_count", "remaining")
+    readonly_fields = ("reserved_count",)
 
 
 @admin.register(Registration)
 class RegistrationAdmin(admin.ModelAdmin):
+    """Inscriptions créées par confirm_hold() uniquement ; la suppression rend la place (post_delete)."""
+
     list_display = ("user", "event_pass", "registered_at", "is_paid")
     list_filter = ("event_pass", "is_paid")
+    readonly_fields = ("user", "event_pass")
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(PassHold)
+class PassHoldAdmin(admin.ModelAdmin):
+    """Consultation seule ; la suppression passe par le stock (release_hold)."""
+
+    list_display = ("user", "event_pass", "expires_at")
+    list_filter = ("event_pass",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def delete_model(self, request, obj):
+        inventory.release_hold(obj)
+
+    def delete_queryset(self, request, queryset):
+        for hold in queryset:
+            inventory.release_hold(hold)
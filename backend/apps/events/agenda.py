@@ -0,0 +1,187 @@
+"""
+Agenda unifié matérialisé (AgendaOccurrence).
+
+Une ligne par Event, PartnerEvent, NodeEvent et TrainingSession non annulée, avec l'intervalle
+[starts_at, ends_at] normalisé, les libellés recopiés dans chaque langue et la structure
+rattachée. /api/agenda/ filtre cette seule table (starts_at < fin ET ends_at >= début).
+
+Mise à jour incrémentale par signaux :
+- save / delete d'une source → son occurrence ;
+- save d'un noeud (CoF ou partenaire) → les occurrences qui recopient son nom / slug
+  (sa suppression supprime les sources en cascade, donc leurs occurrences).
+`python manage.py rebuild_agenda` reconstruit tout (déploiement, import en masse).
+"""
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from apps.core.localized import localized_copy
+from apps.organization.models import NodeEvent, OrganizationNode
+from apps.partners.models import PartnerEvent, PartnerNode
+from apps.trainings.models import TrainingSession
+
+from .models import AgendaOccurrence, Event
+
+Source = AgendaOccurrence.Source
+Kind = AgendaOccurrence.Kind
+
+
+def _day_bounds(start_date, end_date):
+    """Journées entières, bornes incluses, dans le fuseau du site."""
+    tz = timezone.get_default_timezone()
+    starts_at = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    ends_at = timezone.make_aware(datetime.combine(max(end_date, start_date), time.max), tz)
+    return starts_at, ends_at
+
+
+def _node_fields(node):
+    return {
+        "node_id": node.pk if node else None,
+        "node_slug": node.slug if node else "",
+        **localized_copy("node_name", node, "name"),
+    }
+
+
+def _from_event(event):
+    starts_at, ends_at = _day_bounds(event.start_date, event.end_date)
+    return AgendaOccurrence(
+        source=Source.EVENT,
+        source_id=event.pk,
+        type=event.type,
+        slug=event.slug,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        all_day=True,
+        image=event.image.name if event.image else None,
+        **localized_copy("title", event, "name"),
+        **localized_copy("location_name", event, "location_name"),
+        **_node_fields(event.node),
+    )
+
+
+def _from_partner_event(event):
+    starts_at, ends_at = _day_bounds(event.start_date, event.end_date)
+    image = event.cover_image or event.image or event.profile_image
+    return AgendaOccurrence(
+        source=Source.PARTNER_EVENT,
+        source_id=event.pk,
+        type=event.type,
+        slug=event.slug,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        all_day=True,
+        image=image.name if image else None,
+        **localized_copy("title", event, "name"),
+        **localized_copy("location_name", event, "location_name"),
+        **_node_fields(event.node),
+    )
+
+
+def _from_node_event(event):
+    return AgendaOccurrence(
+        source=Source.NODE_EVENT,
+        source_id=event.pk,
+        type=Kind.NODE_EVENT,
+        starts_at=event.start_datetime,
+        # Sans fin : un instant (intervalle de longueur nulle).
+        ends_at=max(event.end_datetime or event.start_datetime, event.start_datetime),
+        image=event.image.name if event.image else None,
+        url=event.external_url,
+        **localized_copy("title", event, "title"),
+        **localized_copy("location_name", event, "location"),
+        **_node_fields(event.node),
+    )
+
+
+def _from_training(session):
+    return AgendaOccurrence(
+        source=Source.TRAINING,
+        source_id=session.pk,
+        type=Kind.TRAINING,
+        slug=session.slug,
+        starts_at=session.date,
+        ends_at=session.date + timedelta(minutes=session.duration_minutes),
+        **localized_copy("title", session, "title"),
+        **localized_copy("location_name", session, "location"),
+        **_node_fields(None),
+    )
+
+
+# Source → (modèle, queryset de lecture, construction, exclusion de l'agenda).
+_SOURCES = {
+    Source.EVENT: (Event, lambda: Event.objects.select_related("node"), _from_event, None),
+    Source.PARTNER_EVENT: (
+        PartnerEvent,
+        lambda: PartnerEvent.objects.select_related("node"),
+        _from_partner_event,
+        None,
+    ),
+    Source.NODE_EVENT: (NodeEvent, lambda: NodeEvent.objects.select_related("node"), _from_node_event, None),
+    Source.TRAINING: (
+        TrainingSession,
+        lambda: TrainingSession.objects.all(),
+        _from_training,
+        lambda session: session.is_cancelled,
+    ),
+}
+_MODEL_SOURCES = {model: source for source, (model, *_rest) in _SOURCES.items()}
+
+
+def refresh_agenda(source, pks):
+    """Recalcule les occurrences des objets `pks` de `source` (supprimées si l'objet n'existe plus)."""
+    _model, queryset, build, excluded = _SOURCES[source]
+    pks = list(pks)
+    rows = [obj for obj in queryset().filter(pk__in=pks) if not (excluded and excluded(obj))]
+    with transaction.atomic():
+        AgendaOccurrence.objects.filter(source=source, source_id__in=pks).delete()
+        AgendaOccurrence.objects.bulk_create([build(obj) for obj in rows])
+
+
+def rebuild_agenda():
+    """Reconstruit toute la table ; renvoie le nombre d'occurrences."""
+    occurrences = []
+    for _model, queryset, build, excluded in _SOURCES.values():
+        occurrences.extend(build(obj) for obj in queryset().iterator() if not (excluded and excluded(obj)))
+    with transaction.atomic():
+        AgendaOccurrence.objects.all().delete()
+        AgendaOccurrence.objects.bulk_create(occurrences, batch_size=500)
+    return len(occurrences)
+
+
+def _on_source_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_agenda(_MODEL_SOURCES[sender], [instance.pk])
+
+
+def _on_source_delete(sender, instance, **kwargs):
+    AgendaOccurrence.objects.filter(source=_MODEL_SOURCES[sender], source_id=instance.pk).delete()
+
+
+def _on_node_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    for source in _NODE_SOURCES[sender]:
+        pks = list(
+            AgendaOccurrence.objects.filter(source=source, node_id=instance.pk).values_list("source_id", flat=True)
+        )
+        if pks:
+            refresh_agenda(source, pks)
+
+
+# Un OrganizationNode et un PartnerNode peuvent partager un UUID en théorie : on filtre par source.
+_NODE_SOURCES = {
+    OrganizationNode: (Source.EVENT, Source.NODE_EVENT),
+    PartnerNode: (Source.PARTNER_EVENT,),
+}
+
+
+def connect_agenda_signals():
+    """Branche les receivers (appelé par EventsConfig.ready)."""
+    for model in _MODEL_SOURCES:
+        uid = f"agenda:{model._meta.label}"
+        post_save.connect(_on_source_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_source_delete, sender=model, dispatch_uid=uid)
+    for model in _NODE_SOURCES:
+        post_save.connect(_on_node_change, sender=model, dispatch_uid=f"agenda:{model._meta.label}")
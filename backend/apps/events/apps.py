@@ -5,3 +5,10 @@ class EventsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.events"
     verbose_name = "Événements"
+
+    def ready(self):
+        from .agenda import connect_agenda_signals
+        from .inventory import connect_inventory_signals
+
+        connect_agenda_signals()
+        connect_inventory_signals()
@@ -0,0 +1,147 @@
+"""
+Flux iCalendar (RFC 5545) du planning et de l'agenda, générés en flux.
+
+- Créneaux hebdomadaires (TimetableSlot : Schedule CoF et PartnerSchedule) → VEVENT avec
+  RRULE:FREQ=WEEKLY en heure de Paris (TZID=Europe/Paris, VTIMEZONE inclus) ;
+- occurrences datées (AgendaOccurrence : Event, PartnerEvent, NodeEvent, TrainingSession) →
+  VEVENT à la journée (VALUE=DATE, fin exclusive) ou en UTC.
+
+ics_feed() produit le calendrier morceau par morceau (une ligne VEVENT pliée par objet lu avec
+.iterator()) : un abonnement à tout le planning ne charge jamais toute la table en mémoire.
+"""
+from datetime import timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+
+ICS_TZID = "Europe/Paris"
+ICS_PRODID = "-//Capital of Fusion//Agenda//FR"
+ICS_UID_DOMAIN = "capitaloffusion.fr"
+ICS_CHUNK_SIZE = 500
+
+_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Règles de l'heure d'été européenne (inchangées depuis 1996).
+_VTIMEZONE = (
+    "BEGIN:VTIMEZONE",
+    f"TZID:{ICS_TZID}",
+    "BEGIN:DAYLIGHT",
+    "TZOFFSETFROM:+0100",
+    "TZOFFSETTO:+0200",
+    "TZNAME:CEST",
+    "DTSTART:19700329T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU",
+    "END:DAYLIGHT",
+    "BEGIN:STANDARD",
+    "TZOFFSETFROM:+0200",
+    "TZOFFSETTO:+0100",
+    "TZNAME:CET",
+    "DTSTART:19701025T030000",
+    "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+)
+
+
+def escape_text(value) -> str:
+    """Échappement des valeurs TEXT (\\ ; , et sauts de ligne)."""
+    return (
+        str(value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> bytes:
+    """Ligne de contenu terminée par CRLF, pliée à 75 octets sans couper un caractère UTF-8."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return raw + b"\r\n"
+    parts, start, limit = [], 0, 75
+    while start < len(raw):
+        end = min(start + limit, len(raw))
+        # Ne pas couper au milieu d'une séquence UTF-8 (octets de continuation 10xxxxxx).
+        while end < len(raw) and raw[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(raw[start:end])
+        start, limit = end, 74  # les lignes de continuation commencent par une espace
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _utc(value) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _first_weekday_on_or_after(day, weekday):
+    return day + timedelta(days=(weekday - day.weekday()) % 7)
+
+
+def _slot_lines(slot):
+    # La série commence à la première occurrence après la publication du créneau.
+    local_created = timezone.localtime(slot.created_at, timezone.get_default_timezone())
+    first = _first_weekday_on_or_after(local_created.date(), slot.day_of_week)
+    end_day = first if slot.end_time > slot.start_time else first + timedelta(days=1)
+    summary = slot.course_name if not slot.level_name else f"{slot.course_name} ({slot.level_name})"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:slot-{slot.source}-{slot.schedule_id}@{ICS_UID_DOMAIN}",
+        f"DTSTAMP:{_utc(slot.updated_at)}",
+        f"DTSTART;TZID={ICS_TZID}:{first:%Y%m%d}T{slot.start_time:%H%M%S}",
+        f"DTEND;TZID={ICS_TZID}:{end_day:%Y%m%d}T{slot.end_time:%H%M%S}",
+        f"RRULE:FREQ=WEEKLY;BYDAY={_WEEKDAYS[slot.day_of_week]}",
+        f"SUMMARY:{escape_text(summary)}",
+        f"CATEGORIES:{escape_text(slot.style_name)}",
+    ]
+    if slot.location_name:
+        lines.append(f"LOCATION:{escape_text(slot.location_name)}")
+    if slot.node_name:
+        lines.append(f"DESCRIPTION:{escape_text(slot.node_name)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def _occurrence_lines(occurrence):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{occurrence.source}-{occurrence.source_id}@{ICS_UID_DOMAIN}",
+        f"DTSTAMP:{_utc(occurrence.updated_at)}",
+    ]
+    if occurrence.all_day:
+        tz = timezone.get_default_timezone()
+        first = timezone.localtime(occurrence.starts_at, tz).date()
+        last = timezone.localtime(occurrence.ends_at, tz).date()
+        lines += [f"DTSTART;VALUE=DATE:{first:%Y%m%d}", f"DTEND;VALUE=DATE:{last + timedelta(days=1):%Y%m%d}"]
+    else:
+        lines += [f"DTSTART:{_utc(occurrence.starts_at)}", f"DTEND:{_utc(occurrence.ends_at)}"]
+    lines += [f"SUMMARY:{escape_text(occurrence.title)}", f"CATEGORIES:{occurrence.type}"]
+    if occurrence.location_name:
+        lines.append(f"LOCATION:{escape_text(occurrence.location_name)}")
+    if occurrence.node_name:
+        lines.append(f"DESCRIPTION:{escape_text(occurrence.node_name)}")
+    if occurrence.url:
+        lines.append(f"URL:{occurrence.url}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def ics_feed(name, slots=None, occurrences=None):
+    """Générateur d'octets : VCALENDAR avec les créneaux puis les occurrences datées."""
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"X-WR-TIMEZONE:{ICS_TZID}",
+        *_VTIMEZONE,
+    ]
+    yield b"".join(fold_line(line) for line in header)
+    for queryset, lines_of in ((slots, _slot_lines), (occurrences, _occurrence_lines)):
+        if queryset is None:
+            continue
+        for obj in queryset.iterator(chunk_size=ICS_CHUNK_SIZE):
+            yield b"".join(fold_line(line) for line in lines_of(obj))
+    yield fold_line("END:VCALENDAR")
@@ -0,0 +1,140 @@
+"""
+Stock des pass (EventPass) : réservations temporaires, confirmation, expiration.
+
+- reserved_count compte les places prises (réservations en cours + inscriptions) ; une place
+  se prend par un seul UPDATE conditionnel
+  (reserved_count = reserved_count + 1 WHERE reserved_count < quantity_available) :
+  aucune survente même avec des milliers d'achats simultanés, et « places restantes » se lit
+  sur la ligne du pass, sans COUNT(*) sur les inscriptions.
+- hold_pass() réserve une place HOLD_TTL minutes (idempotent par utilisateur et pass) ;
+  confirm_hold() la transforme en Registration sans toucher au compteur ; release_hold()
+  et l'expiration la rendent au stock.
+- Les réservations expirées sont rendues par `python manage.py release_expired_holds`
+  (balayage périodique) et, pour un pass complet, au moment d'une nouvelle réservation.
+- Hors de ce module (admin, suppression d'un utilisateur), supprimer une inscription rend sa
+  place (post_delete) ; les réservations d'un utilisateur supprimé sont rendues avant la
+  cascade (pre_delete). Pas de post_delete sur PassHold : confirm_hold() garde la place et
+  _drop_holds() ne rend que les lignes qu'il a lui-même supprimées.
+"""
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
+
+from .models import EventPass, PassHold, Registration
+
+HOLD_TTL = timedelta(minutes=10)
+
+
+class SoldOut(Exception):
+    pass
+
+
+class HoldExpired(Exception):
+    pass
+
+
+def _take(pass_id) -> bool:
+    return bool(
+        EventPass.objects.filter(pk=pass_id)
+        .filter(Q(quantity_available__isnull=True) | Q(reserved_count__lt=F("quantity_available")))
+        .update(reserved_count=F("reserved_count") + 1)
+    )
+
+
+def _give_back(pass_id, count) -> None:
+    EventPass.objects.filter(pk=pass_id, reserved_count__gte=count).update(
+        reserved_count=F("reserved_count") - count
+    )
+
+
+def _drop_holds(pass_id, **filters) -> int:
+    """Supprime des réservations d'un pass et rend au stock exactement celles supprimées ici."""
+    with transaction.atomic():
+        # DELETE direct : entre un balayage et une confirmation, un seul des deux compte la ligne.
+        deleted, _ = PassHold.objects.filter(event_pass_id=pass_id, **filters).delete()
+        if deleted:
+            _give_back(pass_id, deleted)
+    return deleted
+
+
+def release_expired_holds(event_pass_id=None, now=None) -> int:
+    """Rend au stock les réservations expirées (d'un pass ou de tous) ; renvoie leur nombre."""
+    now = now or timezone.now()
+    expired = PassHold.objects.filter(expires_at__lte=now)
+    if event_pass_id is not None:
+        expired = expired.filter(event_pass_id=event_pass_id)
+    pass_ids = expired.values_list("event_pass_id", flat=True).distinct()
+    return sum(_drop_holds(pass_id, expires_at__lte=now) for pass_id in list(pass_ids))
+
+
+def hold_pass(event_pass, user, ttl=HOLD_TTL):
+    """
+    (réservation, créée ?) — une réservation en cours du même utilisateur est renvoyée telle
+    quelle. SoldOut si aucune place n'est libre, même après expiration des réservations périmées.
+    """
+    now = timezone.now()
+    current = PassHold.objects.filter(event_pass=event_pass, user=user).first()
+    if current is not None:
+        if current.expires_at > now:
+            return current, False
+        _drop_holds(event_pass.pk, pk=current.pk)
+
+    for attempt in range(2):
+        try:
+            with transaction.atomic():
+                if _take(event_pass.pk):
+                    hold = PassHold.objects.create(event_pass=event_pass, user=user, expires_at=now + ttl)
+                    return hold, True
+        except IntegrityError:
+            # Même utilisateur en parallèle : sa place a été annulée avec la transaction.
+            return PassHold.objects.get(event_pass=event_pass, user=user), False
+        # Pass complet : des réservations expirées non encore balayées libèrent peut-être des places.
+        if attempt or not release_expired_holds(event_pass_id=event_pass.pk, now=now):
+            break
+    raise SoldOut
+
+
+def confirm_hold(hold) -> Registration:
+    """Réservation en cours → inscription (la place reste comptée). HoldExpired sinon."""
+    with transaction.atomic():
+        deleted, _ = PassHold.objects.filter(pk=hold.pk, expires_at__gt=timezone.now()).delete()
+        if not deleted:
+            raise HoldExpired
+        return Registration.objects.create(user_id=hold.user_id, event_pass_id=hold.event_pass_id)
+
+
+def release_hold(hold) -> bool:
+    return bool(_drop_holds(hold.event_pass_id, pk=hold.pk))
+
+
+def recount_inventory() -> int:
+    """Recalcule reserved_count (inscriptions + réservations) ; renvoie le nombre de pass corrigés."""
+    fixed = 0
+    passes = EventPass.objects.annotate(
+        registered=Count("registrations", distinct=True), held=Count("holds", distinct=True)
+    )
+    for event_pass in passes:
+        actual = event_pass.registered + event_pass.held
+        if actual != event_pass.reserved_count:
+            fixed += EventPass.objects.filter(pk=event_pass.pk).update(reserved_count=actual)
+    return fixed
+
+
+def _on_registration_delete(sender, instance, **kwargs):
+    _give_back(instance.event_pass_id, 1)
+
+
+def _on_user_delete(sender, instance, **kwargs):
+    pass_ids = PassHold.objects.filter(user=instance).values_list("event_pass_id", flat=True)
+    for pass_id in list(pass_ids):
+        _drop_holds(pass_id, user=instance)
+
+
+def connect_inventory_signals():
+    """Branche les receivers (appelé par EventsConfig.ready)."""
+    post_delete.connect(_on_registration_delete, sender=Registration, dispatch_uid="inventory:events.Registration")
+    pre_delete.connect(_on_user_delete, sender=get_user_model(), dispatch_uid="inventory:user")
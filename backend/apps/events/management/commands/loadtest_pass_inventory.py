@@ -0,0 +1,103 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.events import inventory
+from apps.events.models import Event, EventPass, PassHold, Registration
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Test de charge local du stock des pass : N acheteurs simultanés sur un pass de S places "
+        "(réservation puis confirmation ou abandon). Vérifie l'absence de survente et la cohérence "
+        "du compteur, puis supprime les données créées."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--buyers", type=int, default=2000, help="Acheteurs (un utilisateur chacun)")
+        parser.add_argument("--stock", type=int, default=500, help="Places du pass")
+        parser.add_argument("--threads", type=int, default=32, help="Requêtes simultanées")
+        parser.add_argument(
+            "--abandon-every", type=int, default=5, help="Un acheteur sur N abandonne sa réservation (0 : aucun)"
+        )
+        parser.add_argument("--keep", action="store_true", help="Conserver l'événement, le pass et les utilisateurs")
+
+    def handle(self, *args, **options) -> None:
+        buyers, stock = options["buyers"], options["stock"]
+        if buyers < 1 or stock < 0 or options["threads"] < 1:
+            raise CommandError("--buyers et --threads doivent être ≥ 1, --stock ≥ 0.")
+        prefix = f"loadtest-{int(time.time())}"
+        event = Event.objects.create(
+            name=prefix, slug=prefix, type=Event.EventType.FESTIVAL, start_date=date.today(), end_date=date.today()
+        )
+        event_pass = EventPass.objects.create(event=event, name="Full pass", quantity_available=stock)
+        users = User.objects.bulk_create(
+            [User(username=f"{prefix}-{i:05d}", email=f"{prefix}-{i}@example.invalid") for i in range(buyers)]
+        )
+        outcomes = {"confirmed": 0, "abandoned": 0, "sold_out": 0, "expired": 0}
+        latencies = []
+        lock = threading.Lock()
+        abandon_every = options["abandon_every"]
+
+        def buy(index_user):
+            index, user = index_user
+            started = time.perf_counter()
+            try:
+                hold, _created = inventory.hold_pass(event_pass, user)
+                if abandon_every and index % abandon_every == 0:
+                    inventory.release_hold(hold)
+                    outcome = "abandoned"
+                else:
+                    inventory.confirm_hold(hold)
+                    outcome = "confirmed"
+            except inventory.SoldOut:
+                outcome = "sold_out"
+            except inventory.HoldExpired:
+                outcome = "expired"
+            finally:
+                close_old_connections()
+            with lock:
+                outcomes[outcome] += 1
+                latencies.append(time.perf_counter() - started)
+
+        self.stdout.write(f"{buyers} acheteurs, {stock} places, {options['threads']} threads…")
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+                list(pool.map(buy, enumerate(users)))
+            elapsed = time.perf_counter() - started
+
+            event_pass.refresh_from_db()
+            registrations = Registration.objects.filter(event_pass=event_pass).count()
+            holds = PassHold.objects.filter(event_pass=event_pass).count()
+            latencies.sort()
+            p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+            self.stdout.write(
+                f"{elapsed:.2f} s — {buyers / elapsed:.0f} achats/s — latence médiane "
+                f"{statistics.median(latencies) * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms"
+            )
+            self.stdout.write(", ".join(f"{k} {v}" for k, v in outcomes.items()))
+            self.stdout.write(
+                f"inscriptions {registrations}, réservations {holds}, compteur {event_pass.reserved_count}, "
+                f"restant {event_pass.remaining}"
+            )
+            problems = []
+            if registrations > stock:
+                problems.append(f"survente : {registrations} inscriptions pour {stock} places")
+            if event_pass.reserved_count != registrations + holds:
+                problems.append("compteur incohérent avec inscriptions + réservations")
+            if outcomes["confirmed"] != registrations:
+                problems.append("confirmations perdues")
+            if problems:
+                raise CommandError(" ; ".join(problems))
+            self.stdout.write(self.style.SUCCESS("OK : pas de survente, compteur cohérent."))
+        finally:
+            if not options["keep"]:
+                event.delete()
+                User.objects.filter(username__startswith=f"{prefix}-").delete()
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.content_cache import bump_generation
+from apps.events.agenda import rebuild_agenda
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'agenda unifié (AgendaOccurrence) à partir des événements, événements partenaires, événements de noeud et sessions de training."
+
+    def handle(self, *args, **options):
+        count = rebuild_agenda()
+        bump_generation("agenda")
+        self.stdout.write(self.style.SUCCESS(f"Agenda reconstruit : {count} occurrence(s)."))
@@ -0,0 +1,39 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.events.inventory import recount_inventory, release_expired_holds
+
+
+class Command(BaseCommand):
+    help = "Rend au stock les réservations de pass expirées (une fois, ou en boucle avec --loop)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--loop", action="store_true", help="Balaye en continu jusqu'à SIGTERM / SIGINT")
+        parser.add_argument("--interval", type=float, default=30.0, help="Secondes entre deux balayages (--loop)")
+        parser.add_argument(
+            "--recount",
+            action="store_true",
+            help="Recalcule d'abord les compteurs depuis les inscriptions et réservations (réparation)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["recount"]:
+            self.stdout.write(f"Compteurs corrigés : {recount_inventory()} pass.")
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+
+        if options["loop"]:
+            signal.signal(signal.SIGTERM, stop)
+            signal.signal(signal.SIGINT, stop)
+        while True:
+            released = release_expired_holds()
+            if released or not options["loop"]:
+                self.stdout.write(f"Réservations expirées rendues au stock : {released}.")
+            if not options["loop"] or stopping:
+                break
+            time.sleep(options["interval"])
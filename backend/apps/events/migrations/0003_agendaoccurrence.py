@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:58
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_description_en_event_description_es_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgendaOccurrence',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('source', models.CharField(choices=[('event', 'Événement'), ('partner_event', 'Événement partenaire'), ('node_event', 'Événement de noeud'), ('training', 'Training')], max_length=20)),
+                ('source_id', models.UUIDField()),
+                ('type', models.CharField(choices=[('FESTIVAL', 'Festival'), ('PARTY', 'Soirée'), ('WORKSHOP', 'Atelier'), ('NODE_EVENT', 'Événement de noeud'), ('TRAINING', 'Training')], max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('title_fr', models.CharField(max_length=255, null=True)),
+                ('title_en', models.CharField(max_length=255, null=True)),
+                ('title_es', models.CharField(max_length=255, null=True)),
+                ('slug', models.SlugField(blank=True, max_length=255)),
+                ('location_name', models.CharField(blank=True, max_length=255)),
+                ('location_name_fr', models.CharField(blank=True, max_length=255, null=True)),
+                ('location_name_en', models.CharField(blank=True, max_length=255, null=True)),
+                ('location_name_es', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_id', models.UUIDField(blank=True, null=True)),
+                ('node_name', models.CharField(blank=True, max_length=255)),
+                ('node_name_fr', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_name_en', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_name_es', models.CharField(blank=True, max_length=255, null=True)),
+                ('node_slug', models.SlugField(blank=True, max_length=255)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('all_day', models.BooleanField(default=False)),
+                ('image', models.ImageField(blank=True, max_length=500, null=True, upload_to='')),
+                ('url', models.URLField(blank=True)),
+            ],
+            options={
+                'verbose_name': "Occurrence de l'agenda",
+                'verbose_name_plural': "Occurrences de l'agenda",
+                'ordering': ['starts_at', 'ends_at'],
+                'indexes': [models.Index(fields=['starts_at', 'ends_at'], name='agenda_start_end_idx'), models.Index(fields=['ends_at'], name='agenda_end_idx'), models.Index(fields=['node_slug', 'starts_at'], name='agenda_node_start_idx'), models.Index(fields=['type', 'starts_at'], name='agenda_type_start_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'source_id'), name='unique_agenda_occurrence_source')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:09
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_reserved_count(apps, schema_editor):
+    EventPass = apps.get_model("events", "EventPass")
+    for event_pass in EventPass.objects.annotate(registered=Count("registrations")).filter(registered__gt=0):
+        EventPass.objects.filter(pk=event_pass.pk).update(reserved_count=event_pass.registered)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_agendaoccurrence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventpass',
+            name='reserved_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reserved_count, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='PassHold',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expires_at', models.DateTimeField()),
+                ('event_pass', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holds', to='events.eventpass')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pass_holds', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Réservation de pass',
+                'verbose_name_plural': 'Réservations de pass',
+                'indexes': [models.Index(fields=['expires_at'], name='pass_hold_expires_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event_pass', 'user'), name='unique_pass_hold_user')],
+            },
+        ),
+    ]
@@ -1,5 +1,7 @@
 """
 Modèles Events — Event, EventPass, Registration. Alignés MCD Phase 1 section 1.5.
+PassHold : réservation temporaire d'une place de pass (stock géré par apps/events/inventory.py).
+AgendaOccurrence : index unifié de l'agenda (événements, événements partenaires et de noeud, trainings).
 """
 from django.db import models
 from apps.core.models import BaseModel
@@ -48,6 +50,8 @@ class EventPass(BaseModel):
     name = models.CharField(max_length=255)
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     quantity_available = models.PositiveIntegerField(null=True, blank=True)
+    # Places prises (réservations en cours + inscriptions), tenu à jour par apps/events/inventory.py.
+    reserved_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name = "Pass événement"
@@ -56,6 +60,13 @@ class EventPass(BaseModel):
     def __str__(self):
         return f"{self.event.name} — {self.name}"
 
+    @property
+    def remaining(self):
+        """Places restantes ; None si le stock n'est pas limité."""
+        if self.quantity_available is None:
+            return None
+        return max(0, self.quantity_available - self.reserved_count)
+
 
 class Registration(BaseModel):
     """Inscription d'un utilisateur à un pass."""
@@ -75,3 +86,81 @@ class Registration(BaseModel):
 
     def __str__(self):
         return f"{self.user} → {self.event_pass}"
+
+
+class PassHold(BaseModel):
+    """
+    Place de pass réservée quelques minutes pendant l'achat. Compte dans reserved_count
+    jusqu'à sa confirmation (→ Registration) ou son expiration (place rendue au stock).
+    """
+
+    event_pass = models.ForeignKey(EventPass, on_delete=models.CASCADE, related_name="holds")
+    user = models.ForeignKey("users.User", on_delete=models.CASCADE, related_name="pass_holds")
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Réservation de pass"
+        verbose_name_plural = "Réservations de pass"
+        constraints = [
+            models.UniqueConstraint(fields=["event_pass", "user"], name="unique_pass_hold_user"),
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"], name="pass_hold_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} → {self.event_pass} (jusqu'à {self.expires_at:%H:%M})"
+
+
+class AgendaOccurrence(BaseModel):
+    """
+    Occurrence de l'agenda, dénormalisée : une ligne par Event, PartnerEvent, NodeEvent et
+    TrainingSession non annulée, sur un intervalle fermé [starts_at, ends_at] (un événement
+    sur des dates couvre les journées entières). Table de lecture seule tenue à jour par
+    apps/events/agenda.py ; /api/agenda/ y répond aux requêtes de chevauchement de dates.
+    """
+
+    class Source(models.TextChoices):
+        EVENT = "event", "Événement"
+        PARTNER_EVENT = "partner_event", "Événement partenaire"
+        NODE_EVENT = "node_event", "Événement de noeud"
+        TRAINING = "training", "Training"
+
+    class Kind(models.TextChoices):
+        FESTIVAL = "FESTIVAL", "Festival"
+        PARTY = "PARTY", "Soirée"
+        WORKSHOP = "WORKSHOP", "Atelier"
+        NODE_EVENT = "NODE_EVENT", "Événement de noeud"
+        TRAINING = "TRAINING", "Training"
+
+    source = models.CharField(max_length=20, choices=Source.choices)
+    source_id = models.UUIDField()
+    type = models.CharField(max_length=20, choices=Kind.choices)
+    title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, blank=True)
+    location_name = models.CharField(max_length=255, blank=True)
+    node_id = models.UUIDField(null=True, blank=True)
+    node_name = models.CharField(max_length=255, blank=True)
+    node_slug = models.SlugField(max_length=255, blank=True)
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    all_day = models.BooleanField(default=False)
+    image = models.ImageField(max_length=500, blank=True, null=True)
+    url = models.URLField(blank=True)
+
+    class Meta:
+        verbose_name = "Occurrence de l'agenda"
+        verbose_name_plural = "Occurrences de l'agenda"
+        ordering = ["starts_at", "ends_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["source", "source_id"], name="unique_agenda_occurrence_source"),
+        ]
+        indexes = [
+            models.Index(fields=["starts_at", "ends_at"], name="agenda_start_end_idx"),
+            models.Index(fields=["ends_at"], name="agenda_end_idx"),
+            models.Index(fields=["node_slug", "starts_at"], name="agenda_node_start_idx"),
+            models.Index(fields=["type", "starts_at"], name="agenda_type_start_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} — {self.starts_at:%d/%m/%Y}"
@@ -1,11 +1,14 @@
 """
-Serializers Events — Event pour l’API calendrier.
+Serializers Events — Event pour l’API calendrier, AgendaOccurrence pour /api/agenda/,
+pass / réservations / inscriptions pour la billetterie.
 """
 from rest_framework import serializers
-from .models import Event
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.users.image_field_api_url import ApiImageField, MediaBatchListSerializer
+from .models import AgendaOccurrence, Event, EventPass, PassHold, Registration
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Event en lecture seule pour GET /api/events/."""
 
     node_name = serializers.CharField(
@@ -46,3 +49,55 @@ class EventWriteSerializer(serializers.ModelSerializer):
             "node",
             "image",
         )
+
+
+class AgendaOccurrenceSerializer(serializers.ModelSerializer):
+    """Occurrence de l'agenda unifié (GET /api/agenda/)."""
+
+    image = ApiImageField()
+
+    class Meta:
+        model = AgendaOccurrence
+        fields = (
+            "source",
+            "source_id",
+            "type",
+            "title",
+            "slug",
+            "starts_at",
+            "ends_at",
+            "all_day",
+            "location_name",
+            "node_id",
+            "node_name",
+            "node_slug",
+            "image",
+            "url",
+        )
+        read_only_fields = fields
+        list_serializer_class = MediaBatchListSerializer
+
+
+class EventPassSerializer(serializers.ModelSerializer):
+    """Pass d'un événement avec les places restantes (null = stock non limité)."""
+
+    remaining = serializers.ReadOnlyField()
+
+    class Meta:
+        model = EventPass
+        fields = ("id", "name", "price", "quantity_available", "remaining")
+        read_only_fields = fields
+
+
+class PassHoldSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PassHold
+        fields = ("id", "event_pass", "expires_at")
+        read_only_fields = fields
+
+
+class RegistrationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Registration
+        fields = ("id", "event_pass", "registered_at", "is_paid")
+        read_only_fields = fields
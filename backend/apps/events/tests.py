@@ -0,0 +1,319 @@
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from apps.core.models import DanceStyle, Level
+from apps.core.testing import client_for, run_concurrently
+from apps.courses.models import Course, Schedule
+from apps.organization.models import OrganizationNode
+from apps.trainings.models import TrainingSession
+
+from .ics import escape_text, fold_line
+from .models import Event, EventPass, PassHold, Registration
+
+User = get_user_model()
+
+
+def make_pass(stock, slug="festival"):
+    event = Event.objects.create(
+        name="Festival", slug=slug, type=Event.EventType.FESTIVAL, start_date=date.today(), end_date=date.today()
+    )
+    return EventPass.objects.create(event=event, name="Full pass", quantity_available=stock)
+
+
+def hold_url(event_pass):
+    return f"/api/events/passes/{event_pass.pk}/hold/"
+
+
+class PassInventoryTests(TestCase):
+    def setUp(self):
+        self.event_pass = make_pass(stock=2)
+        self.users = [User.objects.create(username=f"buyer-{i}") for i in range(3)]
+
+    def _remaining(self):
+        self.event_pass.refresh_from_db()
+        return self.event_pass.remaining
+
+    def test_hold_confirm_and_sell_out(self):
+        first = client_for(self.users[0]).post(hold_url(self.event_pass))
+        self.assertEqual(first.status_code, 201)
+        # Nouvel essai du même acheteur : même réservation, pas de seconde place.
+        retry = client_for(self.users[0]).post(hold_url(self.event_pass))
+        self.assertEqual((retry.status_code, retry.json()["id"]), (200, first.json()["id"]))
+        self.assertEqual(self._remaining(), 1)
+
+        confirmed = client_for(self.users[0]).post(f"/api/events/holds/{first.json()['id']}/confirm/")
+        self.assertEqual(confirmed.status_code, 201)
+        self.assertEqual(self._remaining(), 1)
+
+        self.assertEqual(client_for(self.users[1]).post(hold_url(self.event_pass)).status_code, 201)
+        sold_out = client_for(self.users[2]).post(hold_url(self.event_pass))
+        self.assertEqual(sold_out.status_code, 409)
+        self.assertEqual(self._remaining(), 0)
+
+    def test_release_returns_seat(self):
+        hold = client_for(self.users[0]).post(hold_url(self.event_pass)).json()
+        response = client_for(self.users[0]).delete(f"/api/events/holds/{hold['id']}/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self._remaining(), 2)
+        # Réservation d'un autre utilisateur : 404.
+        other = client_for(self.users[1]).post(hold_url(self.event_pass)).json()
+        self.assertEqual(client_for(self.users[0]).delete(f"/api/events/holds/{other['id']}/").status_code, 404)
+
+    def test_expired_hold_cannot_be_confirmed_and_is_swept(self):
+        hold = client_for(self.users[0]).post(hold_url(self.event_pass)).json()
+        PassHold.objects.filter(pk=hold["id"]).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = client_for(self.users[0]).post(f"/api/events/holds/{hold['id']}/confirm/")
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(self._remaining(), 1)
+
+        out = StringIO()
+        call_command("release_expired_holds", stdout=out)
+        self.assertIn("1", out.getvalue())
+        self.assertEqual(self._remaining(), 2)
+        self.assertFalse(PassHold.objects.exists())
+
+    def test_sold_out_pass_reclaims_expired_holds(self):
+        for user in self.users[:2]:
+            client_for(user).post(hold_url(self.event_pass))
+        PassHold.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = client_for(self.users[2]).post(hold_url(self.event_pass))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(PassHold.objects.count(), 1)
+        self.assertEqual(self._remaining(), 1)
+
+    def test_pass_list_reads_counter(self):
+        Registration.objects.create(user=self.users[0], event_pass=self.event_pass)
+        call_command("release_expired_holds", "--recount", stdout=StringIO())
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/events/{self.event_pass.event.slug}/passes/")
+        self.assertEqual(response.json()[0]["remaining"], 1)
+
+    def test_admin_deletes_return_seats(self):
+        admin_user = User.objects.create(username="root", user_type=User.UserType.ADMIN)
+        self.client.force_login(admin_user)
+        hold = client_for(self.users[0]).post(hold_url(self.event_pass)).json()
+        other = client_for(self.users[1]).post(hold_url(self.event_pass)).json()
+        client_for(self.users[1]).post(f"/api/events/holds/{other['id']}/confirm/")
+        self.assertEqual(self._remaining(), 0)
+
+        response = self.client.post(f"/admin/events/passhold/{hold['id']}/delete/", {"post": "yes"})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._remaining(), 1)
+        registration = Registration.objects.get()
+        response = self.client.post(f"/admin/events/registration/{registration.pk}/delete/", {"post": "yes"})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._remaining(), 2)
+        # Ajout direct interdit : il contournerait le compteur.
+        self.assertEqual(self.client.get("/admin/events/registration/add/").status_code, 403)
+        self.assertEqual(self.client.get("/admin/events/passhold/add/").status_code, 403)
+
+    def test_deleting_user_returns_held_and_registered_seats(self):
+        hold = client_for(self.users[0]).post(hold_url(self.event_pass)).json()
+        client_for(self.users[0]).post(f"/api/events/holds/{hold['id']}/confirm/")
+        other_pass = EventPass.objects.create(event=self.event_pass.event, name="Party pass", quantity_available=1)
+        client_for(self.users[0]).post(hold_url(other_pass))
+
+        self.users[0].delete()
+        other_pass.refresh_from_db()
+        self.assertEqual((self._remaining(), other_pass.remaining), (2, 1))
+
+
+class UpcomingCacheTests(TestCase):
+    """?upcoming=1 filtre sur la date du jour : le changement de jour invalide ETag et cache."""
+
+    def setUp(self):
+        cache.clear()
+        make_pass(stock=1, slug="today")
+
+    def test_midnight_invalidates_cached_upcoming_list(self):
+        first = self.client.get("/api/events/?upcoming=1")
+        self.assertEqual([e["slug"] for e in first.json()], ["today"])
+        revalidate = {"HTTP_IF_NONE_MATCH": first["ETag"], "HTTP_IF_MODIFIED_SINCE": first["Last-Modified"]}
+        self.assertEqual(self.client.get("/api/events/?upcoming=1", **revalidate).status_code, 304)
+
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        with mock.patch("django.utils.timezone.localdate", return_value=tomorrow):
+            response = self.client.get("/api/events/?upcoming=1", **revalidate)
+            since_only = self.client.get(
+                "/api/events/?upcoming=1", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(since_only.status_code, 200)
+
+
+
+class AgendaTests(TestCase):
+    """/api/agenda/ : chevauchement de la fenêtre, filtres, pagination et fenêtre par défaut."""
+
+    def setUp(self):
+        cache.clear()
+        self.today = timezone.localdate()
+        for slug, first, last, kind in [
+            ("past", -5, -3, Event.EventType.FESTIVAL),
+            ("ongoing", -1, 1, Event.EventType.FESTIVAL),
+            ("soon", 2, 2, Event.EventType.PARTY),
+            ("later", 10, 12, Event.EventType.FESTIVAL),
+        ]:
+            Event.objects.create(
+                name=slug,
+                slug=slug,
+                type=kind,
+                start_date=self.today + timedelta(days=first),
+                end_date=self.today + timedelta(days=last),
+            )
+        TrainingSession.objects.create(
+            title="Training",
+            slug="training",
+            date=timezone.make_aware(datetime.combine(self.today + timedelta(days=3), time(19))),
+            capacity=5,
+        )
+
+    def _slugs(self, query=""):
+        response = self.client.get(f"/api/agenda/{query}")
+        self.assertEqual(response.status_code, 200)
+        return [o["slug"] for o in response.json()["results"]]
+
+    def test_window_keeps_overlapping_occurrences(self):
+        self.assertEqual(self._slugs(), ["ongoing", "soon", "training", "later"])
+        start, end = self.today + timedelta(days=1), self.today + timedelta(days=2)
+        # `to` est inclus : un événement qui commence ce jour-là en fait partie.
+        self.assertEqual(self._slugs(f"?from={start}&to={end}"), ["ongoing", "soon"])
+        self.assertEqual(self._slugs(f"?from={self.today - timedelta(days=4)}&to={self.today}"), ["past", "ongoing"])
+
+    def test_type_and_source_filters(self):
+        self.assertEqual(self._slugs("?type=party"), ["soon"])
+        self.assertEqual(self._slugs("?type=FESTIVAL,TRAINING"), ["ongoing", "training", "later"])
+        self.assertEqual(self._slugs("?source=training"), ["training"])
+
+    def test_cursor_pagination_walks_every_occurrence_once(self):
+        pages, url = [], f"/api/agenda/?from={self.today - timedelta(days=10)}&limit=2"
+        while url:
+            body = self.client.get(url).json()
+            pages.append([o["slug"] for o in body["results"]])
+            url = body["next"]
+        self.assertEqual(pages, [["past", "ongoing"], ["soon", "training"], ["later"]])
+
+    def test_invalid_bounds_are_rejected(self):
+        self.assertEqual(self.client.get("/api/agenda/?from=demain").status_code, 400)
+        self.assertEqual(self.client.get("/api/agenda/?to=2025-13-01").status_code, 400)
+
+    def test_default_window_moves_with_the_clock(self):
+        first = self.client.get("/api/agenda/")
+        self.assertEqual(self.client.get("/api/agenda/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+        with mock.patch("django.utils.timezone.now", return_value=timezone.now() + timedelta(days=2)):
+            response = self.client.get("/api/agenda/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([o["slug"] for o in response.json()["results"]], ["soon", "training", "later"])
+
+
+
+class IcsFormattingTests(SimpleTestCase):
+    def test_escape_text(self):
+        self.assertEqual(escape_text("a;b,c\\d\r\ne\nf"), "a\\;b\\,c\\\\d\\ne\\nf")
+        self.assertEqual(escape_text(None), "")
+
+    def test_fold_line_at_75_octets_without_splitting_utf8(self):
+        self.assertEqual(fold_line("SUMMARY:court"), b"SUMMARY:court\r\n")
+        line = "SUMMARY:" + "é" * 60
+        folded = fold_line(line)
+        parts = folded[:-2].split(b"\r\n")
+        self.assertGreater(len(parts), 1)
+        self.assertTrue(all(len(part) <= 75 for part in parts))
+        self.assertTrue(all(part.startswith(b" ") for part in parts[1:]))
+        for part in parts:
+            part.decode("utf-8")  # aucune séquence coupée
+        self.assertEqual(b"".join(p[1:] if i else p for i, p in enumerate(parts)).decode("utf-8"), line)
+
+
+class CalendarFeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        node = OrganizationNode.objects.create(name="Paris", slug="paris")
+        course = Course.objects.create(
+            name="Bachata; niveau 1",
+            slug="bachata-1",
+            style=DanceStyle.objects.create(name="Bachata", slug="bachata"),
+            level=Level.objects.create(name="Débutant", slug="debutant"),
+            node=node,
+        )
+        Schedule.objects.create(course=course, day_of_week=2, start_time="19:00", end_time="20:30")
+        Event.objects.create(
+            name="Festival, été",
+            slug="festival",
+            type=Event.EventType.FESTIVAL,
+            start_date=date(2030, 7, 1),
+            end_date=date(2030, 7, 3),
+            node=node,
+        )
+
+    def test_feed_content(self):
+        response = self.client.get("/api/calendar.ics", HTTP_ACCEPT="text/calendar")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        body = b"".join(response.streaming_content).decode("utf-8")
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("RRULE:FREQ=WEEKLY;BYDAY=WE\r\n", body)
+        self.assertIn("SUMMARY:Bachata\\; niveau 1 (Débutant)\r\n", body)
+        self.assertIn("DTSTART;VALUE=DATE:20300701\r\nDTEND;VALUE=DATE:20300704\r\n", body)
+        self.assertIn("SUMMARY:Festival\\, été\r\n", body)
+        self.assertEqual(self.client.get("/api/calendar/node/inconnu.ics").status_code, 404)
+
+    def test_cached_feed_matches_first_response_and_revalidates(self):
+        first = self.client.get("/api/calendar/node/paris.ics")
+        first_body = b"".join(first.streaming_content)
+
+        with self.assertNumQueries(0):
+            again = self.client.get("/api/calendar/node/paris.ics")
+        self.assertFalse(again.streaming)
+        self.assertEqual(again.content, first_body)
+        for header in ("Content-Type", "Content-Disposition", "ETag", "Last-Modified", "Cache-Control"):
+            self.assertEqual(again[header], first[header], header)
+
+        not_modified = self.client.get("/api/calendar/node/paris.ics", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        Event.objects.filter(slug="festival").first().save()
+        self.assertEqual(
+            self.client.get("/api/calendar/node/paris.ics", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200
+        )
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class PassRushTests(TransactionTestCase):
+    """Ouverture de billetterie : nécessite une base à écritures concurrentes (PostgreSQL)."""
+
+    def test_concurrent_buyers_never_oversell(self):
+        event_pass = make_pass(stock=10, slug="rush")
+        users = [User.objects.create(username=f"rush-{i:02d}") for i in range(60)]
+
+        def buy(user):
+            def call():
+                client = client_for(user)
+                response = client.post(hold_url(event_pass))
+                if response.status_code == 201:
+                    response = client.post(f"/api/events/holds/{response.json()['id']}/confirm/")
+                return response.status_code
+
+            return call
+
+        statuses = run_concurrently([buy(user) for user in users])
+
+        self.assertEqual(sorted(statuses), [201] * 10 + [409] * 50)
+        event_pass.refresh_from_db()
+        self.assertEqual(Registration.objects.filter(event_pass=event_pass).count(), 10)
+        self.assertEqual((event_pass.reserved_count, event_pass.remaining), (10, 0))
@@ -1,6 +1,6 @@
 from modeltranslation.translator import register, TranslationOptions
 
-from .models import Event, EventPass
+from .models import AgendaOccurrence, Event, EventPass
 
 
 @register(Event)
@@ -12,3 +12,7 @@ class EventTranslationOptions(TranslationOptions):
 class EventPassTranslationOptions(TranslationOptions):
     fields = ("name",)
 
+
+@register(AgendaOccurrence)
+class AgendaOccurrenceTranslationOptions(TranslationOptions):
+    fields = ("title", "location_name", "node_name")
@@ -1,17 +1,41 @@
 """
-Vues API Events — liste des événements avec filtres ; détail par slug.
+Vues API Events — liste des événements avec filtres ; détail par slug ; agenda unifié ;
+flux iCalendar (abonnement calendrier) ; billetterie (pass, réservation, confirmation).
 Vues admin — créer, modifier, supprimer (éservé IsSuperUser).
 """
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime, time, timedelta
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.contrib.auth import get_user_model
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from apps.core.permissions import IsSuperUser, IsStaffOrSuperUser
+from apps.core.content_cache import cache_public_get, cache_public_stream, upcoming_clock, upcoming_requested
+from apps.core.fieldsets import sparse_queryset
+from apps.core.pagination import keyset_paginated_response
 from apps.core.models import PendingContentEdit
-from .models import Event
-from .serializers import EventSerializer, EventWriteSerializer
+from apps.core.models import DanceStyle
+from apps.courses.models import Course, TimetableSlot
+from apps.organization.models import OrganizationNode
+from apps.partners.models import Partner, PartnerCourse, PartnerEvent
+from apps.trainings.models import TrainingSession
+from . import inventory
+from .ics import ics_feed
+from .models import AgendaOccurrence, Event, EventPass, PassHold
+from .serializers import (
+    AgendaOccurrenceSerializer,
+    EventPassSerializer,
+    EventSerializer,
+    EventWriteSerializer,
+    PassHoldSerializer,
+    RegistrationSerializer,
+)
 
+AgendaSource = AgendaOccurrence.Source
 
 
 class EventListAPIView(APIView):
@@ -20,13 +44,12 @@ class EventListAPIView(APIView):
     Liste des Event (à venir ou tous). Query params : type, node.
     """
 
+    @cache_public_get("events", clock=upcoming_clock)
     def get(self, request):
         qs = Event.objects.all().select_related("node")
         # Optionnel : seulement à venir
-        upcoming = request.query_params.get("upcoming", "").lower()
-        if upcoming in ("1", "true", "yes"):
-            today = timezone.now().date()
-            qs = qs.filter(end_date__gte=today)
+        if upcoming_requested(request):
+            qs = qs.filter(end_date__gte=timezone.localdate())
         event_type = request.query_params.get("type")
         if event_type:
             qs = qs.filter(type=event_type)
@@ -36,9 +59,157 @@ class EventListAPIView(APIView):
                 qs = qs.filter(node_id=node)
             else:
                 qs = qs.filter(node__slug=node)
-        qs = qs.order_by("start_date")
-        serializer = EventSerializer(qs, many=True)
-        return Response(serializer.data)
+        qs = sparse_queryset(qs.order_by("start_date"), request, EventSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: EventSerializer(rows, many=True, context={"request": request}).data
+        )
+
+
+def _agenda_bound(raw, *, end):
+    """
+    Date (AAAA-MM-JJ) ou date-heure ISO → datetime aware. Une date de fin est incluse
+    (minuit du lendemain). None si le paramètre est invalide.
+    """
+    day = parse_date(raw)
+    if day is not None:
+        value = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    else:
+        value = parse_datetime(raw)
+        if value is None:
+            return None
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+AGENDA_NOW_STEP_MINUTES = 5
+
+
+def _agenda_now():
+    """
+    Début par défaut de la fenêtre : « maintenant » arrondi au pas inférieur. La réponse
+    ne change qu'une fois par pas, et ce début entre dans la clé de cache et l'ETag :
+    une occurrence terminée disparaît au plus AGENDA_NOW_STEP_MINUTES plus tard.
+    """
+    now = timezone.now()
+    return now.replace(minute=now.minute - now.minute % AGENDA_NOW_STEP_MINUTES, second=0, microsecond=0)
+
+
+def _agenda_clock(request):
+    return None if request.query_params.get("from") else _agenda_now()
+
+
+class AgendaAPIView(APIView):
+    """
+    GET /api/agenda/
+    Agenda unifié : événements CoF et partenaires, événements de noeud, sessions de training.
+    Query params : from, to (date ou date-heure ; from = maintenant, au pas de 5 min, par défaut), node (slug ou id),
+    type (ex. FESTIVAL,PARTY ; insensible à la casse), source. Occurrences qui chevauchent
+    [from, to], triées par début ; toujours paginé (limit, cursor).
+    """
+
+    @cache_public_get("agenda", clock=_agenda_clock)
+    def get(self, request):
+        params = request.query_params
+        try:
+            start = _agenda_bound(params["from"], end=False) if params.get("from") else _agenda_now()
+            end = _agenda_bound(params["to"], end=True) if params.get("to") else None
+        except ValueError:
+            start = end = None
+        if start is None or (params.get("to") and end is None):
+            return Response(
+                {"error": "Paramètres from / to invalides (AAAA-MM-JJ ou date-heure ISO)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # Chevauchement : commence avant la fin de la fenêtre et finit après son début.
+        qs = AgendaOccurrence.objects.filter(ends_at__gte=start)
+        if end is not None:
+            qs = qs.filter(starts_at__lt=end)
+        node = params.get("node")
+        if node:
+            if len(node) == 36 and "-" in node:
+                qs = qs.filter(node_id=node)
+            else:
+                qs = qs.filter(node_slug=node)
+        types = [t.strip().upper() for t in params.get("type", "").split(",") if t.strip()]
+        if types:
+            qs = qs.filter(type__in=types)
+        sources = [s.strip().lower() for s in params.get("source", "").split(",") if s.strip()]
+        if sources:
+            qs = qs.filter(source__in=sources)
+        return keyset_paginated_response(
+            request,
+            qs.order_by("starts_at", "ends_at"),
+            lambda rows: AgendaOccurrenceSerializer(rows, many=True, context={"request": request}).data,
+            always=True,
+        )
+
+
+class CalendarFeedAPIView(APIView):
+    """
+    GET /api/calendar.ics                          → tout le planning et l'agenda
+    GET /api/calendar/<scope>/<slug>.ics           → scope : node, partner, style, artist
+    Flux iCalendar diffusé en streaming ; ETag / Last-Modified par génération de contenu
+    (un client qui interroge souvent reçoit des 304) et corps mis en cache par génération.
+    """
+
+    def perform_content_negotiation(self, request, force=False):
+        # Les clients calendrier envoient « Accept: text/calendar » : pas de 406.
+        return super().perform_content_negotiation(request, force=True)
+
+    def _scoped(self, scope, slug):
+        """(nom du calendrier, créneaux, occurrences) pour un scope."""
+        slots = TimetableSlot.objects.all()
+        occurrences = AgendaOccurrence.objects.all()
+        if scope is None:
+            return "Capital of Fusion", slots, occurrences
+        if scope == "node":
+            node = get_object_or_404(OrganizationNode, slug=slug)
+            return (
+                node.name,
+                slots.filter(source=TimetableSlot.Source.COF, node_id=node.pk),
+                occurrences.filter(source__in=(AgendaSource.EVENT, AgendaSource.NODE_EVENT), node_id=node.pk),
+            )
+        if scope == "partner":
+            partner = get_object_or_404(Partner, slug=slug)
+            return (
+                partner.name,
+                slots.filter(
+                    source=TimetableSlot.Source.PARTNER,
+                    course_id__in=PartnerCourse.objects.filter(partner=partner).values("pk"),
+                ),
+                occurrences.filter(
+                    source=AgendaSource.PARTNER_EVENT,
+                    source_id__in=PartnerEvent.objects.filter(partner=partner).values("pk"),
+                ),
+            )
+        if scope == "style":
+            style = get_object_or_404(DanceStyle, slug=slug)
+            return style.name, slots.filter(style_id=style.pk), None
+        if scope == "artist":
+            artist = get_object_or_404(get_user_model(), username=slug)
+            return (
+                artist.get_full_name() or artist.username,
+                slots.filter(
+                    source=TimetableSlot.Source.COF,
+                    course_id__in=Course.objects.filter(teachers=artist).values("pk"),
+                ),
+                occurrences.filter(
+                    source=AgendaSource.TRAINING,
+                    source_id__in=TrainingSession.objects.filter(instructor=artist).values("pk"),
+                ),
+            )
+        raise Http404
+
+    @cache_public_stream("courses", "partners", "agenda")
+    def get(self, request, scope=None, slug=None):
+        name, slots, occurrences = self._scoped(scope, slug)
+        response = StreamingHttpResponse(
+            ics_feed(name, slots.order_by("day_of_week", "start_time"), occurrences),
+            content_type="text/calendar; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'inline; filename="{scope or "calendar"}-{slug or "cof"}.ics"'
+        return response
 
 
 class EventDetailAPIView(APIView):
@@ -47,6 +218,7 @@ class EventDetailAPIView(APIView):
     Détail d'un événement par slug. 404 si non trouvé.
     """
 
+    @cache_public_get("events")
     def get(self, request, slug):
         event = get_object_or_404(
             Event.objects.select_related("node"),
@@ -56,6 +228,69 @@ class EventDetailAPIView(APIView):
         return Response(serializer.data)
 
 
+# ─── Billetterie ──────────────────────────────────────────────────────────────
+
+class EventPassListAPIView(APIView):
+    """
+    GET /api/events/<slug>/passes/
+    Pass d'un événement et places restantes (lues sur le compteur du pass, jamais mises en cache).
+    """
+
+    def get(self, request, slug):
+        event = get_object_or_404(Event.objects.only("pk"), slug=slug)
+        passes = EventPass.objects.filter(event=event).order_by("price", "name")
+        return Response(EventPassSerializer(passes, many=True).data)
+
+
+class PassHoldCreateAPIView(APIView):
+    """
+    POST /api/events/passes/<uuid>/hold/
+    Réserve une place quelques minutes. 201 (nouvelle), 200 (réservation en cours renvoyée), 409 (complet).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pass_id):
+        event_pass = get_object_or_404(EventPass, pk=pass_id)
+        try:
+            hold, created = inventory.hold_pass(event_pass, request.user)
+        except inventory.SoldOut:
+            return Response({"error": "Ce pass est complet."}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            PassHoldSerializer(hold).data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+
+
+def _own_hold(request, hold_id):
+    return get_object_or_404(PassHold, pk=hold_id, user=request.user)
+
+
+class PassHoldConfirmAPIView(APIView):
+    """
+    POST /api/events/holds/<uuid>/confirm/
+    Réservation → inscription (201) ; 410 si elle a expiré.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, hold_id):
+        try:
+            registration = inventory.confirm_hold(_own_hold(request, hold_id))
+        except inventory.HoldExpired:
+            return Response({"error": "La réservation a expiré."}, status=status.HTTP_410_GONE)
+        return Response(RegistrationSerializer(registration).data, status=status.HTTP_201_CREATED)
+
+
+class PassHoldDetailAPIView(APIView):
+    """
+    DELETE /api/events/holds/<uuid>/
+    Abandon de la réservation : la place retourne au stock.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request, hold_id):
+        inventory.release_hold(_own_hold(request, hold_id))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 # ─── Admin views ──────────────────────────────────────────────────────────────
 
 class EventAdminAPIView(APIView):
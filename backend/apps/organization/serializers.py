@@ -4,14 +4,15 @@ Serializers Organization — Pole, OrganizationNode (paramètres 3D) + NodeEvent
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
-from apps.users.image_field_api_url import serialize_image_field_for_api
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.users.image_field_api_url import ApiImageField, MediaBatchListSerializer
 
 from .models import OrganizationNode, NodeEvent, Pole
 
 User = get_user_model()
 
 
-class PoleSerializer(serializers.ModelSerializer):
+class PoleSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Pôle avec nombre de membres (staff/admin) calculé côté API."""
 
     members_count = serializers.IntegerField(read_only=True)
@@ -21,22 +22,22 @@ class PoleSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "slug", "order", "members_count")
 
 
-class StaffMemberSerializer(serializers.Serializer):
+class StaffMemberSerializer(SparseFieldsetMixin, serializers.Serializer):
     """Membre du staff (User STAFF ou ADMIN) pour la page Organisation > Staff."""
     id = serializers.UUIDField(read_only=True)
     username = serializers.CharField(read_only=True)
     first_name = serializers.CharField(read_only=True)
     last_name = serializers.CharField(read_only=True)
-    profile_picture = serializers.SerializerMethodField()
+    profile_picture = ApiImageField()
     staff_role = serializers.CharField(read_only=True, allow_blank=True)
     staff_role_display = serializers.SerializerMethodField()
     pole = serializers.SerializerMethodField()
     bio = serializers.CharField(read_only=True, allow_blank=True)
 
-    def get_profile_picture(self, obj):
-        return serialize_image_field_for_api(
-            obj.profile_picture, self.context.get("request")
-        )
+    class Meta:
+        list_serializer_class = MediaBatchListSerializer
+        # get_staff_role_display() relit staff_role : ne pas le différer avec ?fields=.
+        sparse_field_sources = {"staff_role_display": ("staff_role",)}
 
     def get_staff_role_display(self, obj):
         return obj.get_staff_role_display() if getattr(obj, "staff_role", None) else ""
@@ -65,11 +66,17 @@ class NodeEventSerializer(serializers.ModelSerializer):
         )
 
 
-class OrganizationNodeSerializer(serializers.ModelSerializer):
+class OrganizationNodeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Noeud avec paramètres 3D et événements pour Explore / overlay / organigramme."""
 
     node_events = NodeEventSerializer(many=True, read_only=True)
     parent_slug = serializers.SerializerMethodField()
+    # URLs absolues pour les fichiers (ImageField/FileField), comme les serializers "partners"
+    profile_image = ApiImageField()
+    cover_image = ApiImageField()
+    music_file = ApiImageField()
+    model_3d = ApiImageField()
+    planet_texture = ApiImageField()
 
     class Meta:
         model = OrganizationNode
@@ -111,22 +118,13 @@ class OrganizationNodeSerializer(serializers.ModelSerializer):
             "is_visible_3d",
             "node_events",
         )
+        list_serializer_class = MediaBatchListSerializer
 
     def get_parent_slug(self, obj):
         return obj.parent.slug if obj.parent else None
 
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        # Aligner avec les serializers "partners" : exposer des URLs absolues pour les fichiers (ImageField/FileField)
-        for key in ("profile_image", "cover_image", "music_file", "model_3d", "planet_texture"):
-            data[key] = serialize_image_field_for_api(
-                getattr(instance, key, None), request
-            )
-        return data
 
-
-class OrganizationNodeLightSerializer(serializers.ModelSerializer):
+class OrganizationNodeLightSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Version allégée pour /explore : uniquement les champs nécessaires au canvas 3D
     + node_events pour les compteurs, sans les gros champs texte/médias d'overlay.
@@ -134,6 +132,10 @@ class OrganizationNodeLightSerializer(serializers.ModelSerializer):
 
     node_events = NodeEventSerializer(many=True, read_only=True)
     parent_slug = serializers.SerializerMethodField()
+    profile_image = ApiImageField()
+    cover_image = ApiImageField()
+    model_3d = ApiImageField()
+    planet_texture = ApiImageField()
 
     class Meta:
         model = OrganizationNode
@@ -166,16 +168,7 @@ class OrganizationNodeLightSerializer(serializers.ModelSerializer):
             "is_visible_3d",
             "node_events",
         )
+        list_serializer_class = MediaBatchListSerializer
 
     def get_parent_slug(self, obj):
         return obj.parent.slug if obj.parent else None
-
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        # Même logique URL absolue que le serializer complet
-        for key in ("profile_image", "cover_image", "model_3d", "planet_texture"):
-            data[key] = serialize_image_field_for_api(
-                getattr(instance, key, None), request
-            )
-        return data
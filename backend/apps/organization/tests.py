@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+User = get_user_model()
+
+
+class StaffListTests(TestCase):
+    """GET /api/organization/staff/ : sparse fieldsets sans requête par ligne."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _staff(self, count):
+        roles = list(User.StaffRole)
+        User.objects.bulk_create(
+            User(
+                username=f"staff-{i}",
+                first_name=f"Staff {i:02d}",
+                user_type=User.UserType.STAFF,
+                staff_role=roles[i % len(roles)],
+            )
+            for i in range(count)
+        )
+
+    def _fetch(self, query=""):
+        cache.clear()
+        response = self.client.get(f"/api/organization/staff/{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_fields_query_count_is_constant(self):
+        for count in (2, 12):
+            User.objects.all().delete()
+            self._staff(count)
+            with self.assertNumQueries(1):
+                rows = self._fetch("?fields=id,staff_role_display")
+            self.assertEqual(len(rows), count)
+            self.assertEqual(set(rows[0]), {"id", "staff_role_display"})
+            self.assertEqual(rows[0]["staff_role_display"], "Enseignant")
+
+    def test_full_rows_keep_every_field(self):
+        self._staff(1)
+        (row,) = self._fetch()
+        self.assertEqual(row["staff_role"], "TEACHER")
+        self.assertEqual(row["staff_role_display"], "Enseignant")
+        self.assertIsNone(row["profile_picture"])
+        self.assertIsNone(row["pole"])
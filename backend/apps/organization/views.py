@@ -5,14 +5,14 @@ Vues admin — modifier les noeuds d'organisation (staff ou superuser).
 from rest_framework.views import APIView
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 
-from apps.core.api_response import json_response_no_store
+from apps.core.content_cache import bump_generation, cache_public_get
+from apps.core.fieldsets import sparse_queryset
 from apps.core.profile_external_links import parse_external_links_param
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from django.db.models import Count
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from apps.core.permissions import IsStaffOrSuperUser
 from apps.core.views import _user_is_admin_direct
 from apps.core.models import PendingContentEdit
@@ -26,64 +26,65 @@ from .serializers import (
 
 User = get_user_model()
 
-# Clés de cache pour l'API nœuds (TTL 10 min, invalidées à chaque save/delete)
-NODES_LIGHT_CACHE_KEY = "org_nodes_light"
-NODES_STRUCTURE_CACHE_KEY = "org_nodes_structure"
+# Cache de la liste des nœuds : famille "organization" des générations de contenu
+# (incrémentée par signal à chaque save/delete de OrganizationNode / NodeEvent).
 NODES_CACHE_TIMEOUT = 10 * 60  # 10 minutes
 
 
 def invalidate_nodes_cache():
-    """Supprime les caches list nodes (appelé par signal post_save/post_delete)."""
-    cache.delete(NODES_LIGHT_CACHE_KEY)
-    cache.delete(NODES_STRUCTURE_CACHE_KEY)
+    """Invalide les réponses cachées des nœuds (tous les workers, toutes les variantes)."""
+    bump_generation("organization")
+
+
+def organization_nodes_payload(request, for_structure=False):
+    """
+    Nœuds sérialisés : version légère des nœuds visibles en 3D par défaut,
+    tous les nœuds complets pour l'organigramme. Réutilisé par /api/bootstrap/.
+    """
+    if for_structure:
+        qs = (
+            OrganizationNode.objects.all()
+            .select_related("parent")
+            .prefetch_related("node_events")
+            .order_by("created_at")
+        )
+        serializer_class = OrganizationNodeSerializer
+    else:
+        qs = (
+            OrganizationNode.objects.filter(is_visible_3d=True)
+            .select_related("parent")
+            .prefetch_related("node_events")
+            .defer(
+                "description",
+                "content",
+                "cta_text",
+                "cta_url",
+                "video_url",
+                "music_type",
+                "music_youtube_url",
+                "music_file",
+            )
+            .order_by("created_at")
+        )
+        serializer_class = OrganizationNodeLightSerializer
+
+    qs = sparse_queryset(qs, request, serializer_class)
+    return serializer_class(qs, many=True, context={"request": request}).data
 
 
 class OrganizationNodeListAPIView(APIView):
     """
     GET /api/organization/nodes/
     Par défaut : noeuds visibles en 3D (is_visible_3d=True), avec node_events — cache 10 min.
+    Route d'entrée d'Explore : recalcul single-flight (une requête à la fois, les autres reçoivent
+    la liste précédente pendant le calcul).
     GET /api/organization/nodes/?for_structure=1 : tous les noeuds (organigramme), cache 10 min.
     """
 
+    @cache_public_get("organization", timeout=NODES_CACHE_TIMEOUT, single_flight=True)
     def get(self, request):
         for_structure = request.query_params.get("for_structure") in ("1", "true")
-        cache_key = NODES_STRUCTURE_CACHE_KEY if for_structure else NODES_LIGHT_CACHE_KEY
-
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
-
-        if for_structure:
-            qs = (
-                OrganizationNode.objects.all()
-                .select_related("parent")
-                .prefetch_related("node_events")
-                .order_by("created_at")
-            )
-            serializer_class = OrganizationNodeSerializer
-        else:
-            qs = (
-                OrganizationNode.objects.filter(is_visible_3d=True)
-                .select_related("parent")
-                .prefetch_related("node_events")
-                .defer(
-                    "description",
-                    "content",
-                    "cta_text",
-                    "cta_url",
-                    "video_url",
-                    "music_type",
-                    "music_youtube_url",
-                    "music_file",
-                )
-                .order_by("created_at")
-            )
-            serializer_class = OrganizationNodeLightSerializer
-
-        serializer = serializer_class(qs, many=True, context={"request": request})
-        data = serializer.data
-        cache.set(cache_key, data, NODES_CACHE_TIMEOUT)
-        return Response(data)
+        return Response(organization_nodes_payload(request, for_structure=for_structure))
 
 
 class PoleListAPIView(APIView):
@@ -91,9 +92,10 @@ class PoleListAPIView(APIView):
     GET /api/organization/poles/
     Liste des pôles avec le nombre de membres (utilisateurs staff/admin rattachés).
     """
+    @cache_public_get("organization")
     def get(self, request):
         qs = Pole.objects.annotate(members_count=Count("members")).order_by("order", "name")
-        serializer = PoleSerializer(qs, many=True)
+        serializer = PoleSerializer(qs, many=True, context={"request": request})
         return Response(serializer.data)
 
 
@@ -103,6 +105,7 @@ class StaffListAPIView(APIView):
     Liste des membres du staff (User avec user_type STAFF ou ADMIN).
     Query: ?pole=<slug> pour filtrer par pôle.
     """
+    @cache_public_get("organization")
     def get(self, request):
         qs = User.objects.filter(
             user_type__in=[User.UserType.STAFF, User.UserType.ADMIN],
@@ -111,8 +114,9 @@ class StaffListAPIView(APIView):
         pole_slug = request.query_params.get("pole")
         if pole_slug:
             qs = qs.filter(pole__slug=pole_slug)
+        qs = sparse_queryset(qs, request, StaffMemberSerializer)
         serializer = StaffMemberSerializer(qs, many=True, context={"request": request})
-        return json_response_no_store(serializer.data)
+        return Response(serializer.data)
 
 
 class OrganizationNodeDetailAPIView(APIView):
@@ -121,6 +125,7 @@ class OrganizationNodeDetailAPIView(APIView):
     Détail d'un noeud par slug (pour overlay).
     """
 
+    @cache_public_get("organization")
     def get(self, request, slug):
         node = get_object_or_404(
             OrganizationNode.objects.prefetch_related("node_events"),
@@ -4,7 +4,7 @@ Vues API admin partenaires — création (staff / superuser).
 import json
 
 from django.contrib.auth import get_user_model
-from django.db.models import Prefetch
+from django.db.models import Prefetch, Q
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils.dateparse import parse_date
@@ -13,9 +13,12 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from apps.core.content_cache import bump_generation
 from apps.core.permissions import IsStaffOrSuperUser
 from apps.core.profile_external_links import parse_external_links_param
 from apps.core.models import DanceStyle, Level
+from apps.courses.models import TimetableSlot
+from apps.courses.timetable import refresh_timetable
 from apps.users.image_field_api_url import serialize_image_field_for_api
 from .models import Partner, PartnerNode, PartnerEvent, PartnerCourse, PartnerSchedule
 from .serializers import (
@@ -398,6 +401,9 @@ class PartnerCourseAdminDetailAPIView(_StaffAuthMixin, APIView):
                     )
                 if new_objs:
                     PartnerSchedule.objects.bulk_create(new_objs)
+                    # bulk_create n'émet pas post_save
+                    bump_generation("partners")
+                    refresh_timetable(TimetableSlot.Source.PARTNER, Q(course_id=course.pk))
 
         course = (
             PartnerCourse.objects.select_related("style", "level", "node", "partner")
@@ -4,7 +4,8 @@ Serializers Partners — PartnerNode, PartnerEvent, PartnerCourse (lecture seule
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from apps.users.image_field_api_url import serialize_image_field_for_api
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.users.image_field_api_url import ApiImageField, MediaBatchListSerializer
 
 from .models import Partner, PartnerNode, PartnerEvent, PartnerCourse, PartnerSchedule
 
@@ -22,24 +23,21 @@ class PartnerMinimalSerializer(serializers.ModelSerializer):
 class LinkedArtistMinimalSerializer(serializers.ModelSerializer):
     """Artiste annuaire (User avec professions) pour liens depuis une structure partenaire."""
 
+    profile_picture = ApiImageField()
+
     class Meta:
         model = User
         fields = ("id", "username", "first_name", "last_name", "profile_picture")
 
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        data["profile_picture"] = serialize_image_field_for_api(
-            getattr(instance, "profile_picture", None), request
-        )
-        return data
-
 
-class PartnerNodeSerializer(serializers.ModelSerializer):
+class PartnerNodeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Structure partenaire pour liste et détail (avec parent_slug pour arbre)."""
 
     parent_slug = serializers.SerializerMethodField()
     linked_artists = LinkedArtistMinimalSerializer(many=True, read_only=True)
+    profile_image = ApiImageField()
+    cover_image = ApiImageField()
+    background_music = ApiImageField()
 
     class Meta:
         model = PartnerNode
@@ -62,24 +60,13 @@ class PartnerNodeSerializer(serializers.ModelSerializer):
             "background_music_youtube_url",
             "linked_artists",
         )
+        list_serializer_class = MediaBatchListSerializer
 
     def get_parent_slug(self, obj):
         return obj.parent.slug if obj.parent else None
 
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        for key in ("profile_image", "cover_image"):
-            data[key] = serialize_image_field_for_api(
-                getattr(instance, key, None), request
-            )
-        data["background_music"] = serialize_image_field_for_api(
-            getattr(instance, "background_music", None), request
-        )
-        return data
-
 
-class PartnerEventSerializer(serializers.ModelSerializer):
+class PartnerEventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Événement partenaire pour GET /api/partners/events/."""
 
     node_name = serializers.CharField(
@@ -91,6 +78,9 @@ class PartnerEventSerializer(serializers.ModelSerializer):
     partner_name = serializers.CharField(
         source="partner.name", read_only=True, allow_null=True
     )
+    profile_image = ApiImageField()
+    cover_image = ApiImageField()
+    image = ApiImageField()
 
     class Meta:
         model = PartnerEvent
@@ -114,15 +104,7 @@ class PartnerEventSerializer(serializers.ModelSerializer):
             "image",
         )
         read_only_fields = fields
-
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        for key in ("image", "profile_image", "cover_image"):
-            data[key] = serialize_image_field_for_api(
-                getattr(instance, key, None), request
-            )
-        return data
+        list_serializer_class = MediaBatchListSerializer
 
 
 class PartnerScheduleSerializer(serializers.ModelSerializer):
@@ -145,7 +127,7 @@ class PartnerScheduleSerializer(serializers.ModelSerializer):
         )
 
 
-class PartnerCourseSerializer(serializers.ModelSerializer):
+class PartnerCourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Cours partenaire pour GET /api/partners/courses/."""
 
     style_name = serializers.CharField(source="style.name", read_only=True)
@@ -160,6 +142,7 @@ class PartnerCourseSerializer(serializers.ModelSerializer):
         source="partner.name", read_only=True, allow_null=True
     )
     schedules = PartnerScheduleSerializer(many=True, read_only=True)
+    image = ApiImageField()
 
     class Meta:
         model = PartnerCourse
@@ -184,11 +167,4 @@ class PartnerCourseSerializer(serializers.ModelSerializer):
             "schedules",
         )
         read_only_fields = fields
-
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        request = self.context.get("request")
-        data["image"] = serialize_image_field_for_api(
-            getattr(instance, "image", None), request
-        )
-        return data
+        list_serializer_class = MediaBatchListSerializer
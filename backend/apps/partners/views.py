@@ -7,6 +7,9 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from apps.core.content_cache import cache_public_get, upcoming_clock, upcoming_requested
+from apps.core.fieldsets import sparse_queryset
+from apps.core.pagination import keyset_paginated_response
 from .models import PartnerNode, PartnerEvent, PartnerCourse
 
 User = get_user_model()
@@ -24,6 +27,7 @@ class PartnerNodeListAPIView(APIView):
     ?for_structure=1 : tous avec parent_slug (pour arbre / annuaire).
     """
 
+    @cache_public_get("partners")
     def get(self, request):
         for_structure = request.query_params.get("for_structure") in ("1", "true")
         qs = PartnerNode.objects.all().select_related("parent", "partner").prefetch_related(
@@ -36,8 +40,10 @@ class PartnerNodeListAPIView(APIView):
             qs = qs.order_by("created_at")
         else:
             qs = qs.order_by("name")
-        serializer = PartnerNodeSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        qs = sparse_queryset(qs, request, PartnerNodeSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: PartnerNodeSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class PartnerNodeDetailAPIView(APIView):
@@ -46,6 +52,7 @@ class PartnerNodeDetailAPIView(APIView):
     Détail d'une structure partenaire par slug.
     """
 
+    @cache_public_get("partners")
     def get(self, request, slug):
         node = get_object_or_404(
             PartnerNode.objects.select_related("partner", "parent").prefetch_related(
@@ -66,21 +73,21 @@ class PartnerEventListAPIView(APIView):
     Liste des événements partenaires. Query params : type, node (slug), upcoming.
     """
 
+    @cache_public_get("partners", clock=upcoming_clock)
     def get(self, request):
         qs = PartnerEvent.objects.all().select_related("node", "partner")
-        upcoming = request.query_params.get("upcoming", "").lower()
-        if upcoming in ("1", "true", "yes"):
-            today = timezone.now().date()
-            qs = qs.filter(end_date__gte=today)
+        if upcoming_requested(request):
+            qs = qs.filter(end_date__gte=timezone.localdate())
         event_type = request.query_params.get("type")
         if event_type:
             qs = qs.filter(type=event_type)
         node = request.query_params.get("node")
         if node:
             qs = qs.filter(node__slug=node)
-        qs = qs.order_by("start_date")
-        serializer = PartnerEventSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        qs = sparse_queryset(qs.order_by("start_date"), request, PartnerEventSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: PartnerEventSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class PartnerEventDetailAPIView(APIView):
@@ -89,6 +96,7 @@ class PartnerEventDetailAPIView(APIView):
     Détail d'un événement partenaire par slug.
     """
 
+    @cache_public_get("partners")
     def get(self, request, slug):
         event = get_object_or_404(
             PartnerEvent.objects.select_related("node", "partner"),
@@ -104,6 +112,7 @@ class PartnerCourseListAPIView(APIView):
     Liste des cours partenaires actifs. Query params : style, level, node (slug).
     """
 
+    @cache_public_get("partners")
     def get(self, request):
         qs = PartnerCourse.objects.filter(is_active=True).select_related(
             "style", "level", "node", "partner"
@@ -117,8 +126,10 @@ class PartnerCourseListAPIView(APIView):
         node = request.query_params.get("node")
         if node:
             qs = qs.filter(node__slug=node)
-        serializer = PartnerCourseSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        qs = sparse_queryset(qs, request, PartnerCourseSerializer)
+        return keyset_paginated_response(
+            request, qs, lambda rows: PartnerCourseSerializer(rows, many=True, context={"request": request}).data
+        )
 
 
 class PartnerCourseDetailAPIView(APIView):
@@ -127,6 +138,7 @@ class PartnerCourseDetailAPIView(APIView):
     Détail d'un cours partenaire par slug.
     """
 
+    @cache_public_get("partners")
     def get(self, request, slug):
         course = get_object_or_404(
             PartnerCourse.objects.select_related("style", "level", "node", "partner").prefetch_related(
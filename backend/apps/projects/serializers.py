@@ -1,13 +1,14 @@
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import Project, ProjectCategory
 
-class ProjectCategorySerializer(serializers.ModelSerializer):
+class ProjectCategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     name = serializers.ReadOnlyField()
     class Meta:
         model = ProjectCategory
         fields = ['id', 'title', 'name', 'description']
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     category = ProjectCategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=ProjectCategory.objects.all(), source='category', write_only=True, required=False, allow_null=True
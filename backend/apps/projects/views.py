@@ -2,11 +2,12 @@
 Views Projects — Catégories et projets.
 """
 from rest_framework import viewsets, permissions
+from apps.core.fieldsets import SparseFieldsetViewMixin
 from .models import ProjectCategory, Project
 from .serializers import ProjectCategorySerializer, ProjectSerializer
 
 
-class ProjectCategoryViewSet(viewsets.ModelViewSet):
+class ProjectCategoryViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les catégories de projets.
     GET: public, POST/PUT/DELETE: admin.
@@ -20,7 +21,7 @@ class ProjectCategoryViewSet(viewsets.ModelViewSet):
         return [permissions.IsAdminUser()]
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les projets.
     GET: public, POST/PUT/DELETE: admin.
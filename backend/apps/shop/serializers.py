@@ -2,10 +2,11 @@
 Serializers Shop — Catégories et produits.
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import Category, Product
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les catégories de produits."""
     products_count = serializers.SerializerMethodField()
 
@@ -37,7 +38,7 @@ class ProductSerializer(serializers.ModelSerializer):
         ]
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer allégé pour les listes de produits."""
     category_name = serializers.ReadOnlyField(source="category.name")
     category_slug = serializers.ReadOnlyField(source="category.slug")
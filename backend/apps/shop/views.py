@@ -2,11 +2,12 @@
 Views Shop — Catégories et produits.
 """
 from rest_framework import viewsets, permissions
+from apps.core.fieldsets import SparseFieldsetViewMixin
 from .models import Category, Product
 from .serializers import CategorySerializer, ProductSerializer, ProductListSerializer
 
 
-class ProductCategoryViewSet(viewsets.ModelViewSet):
+class ProductCategoryViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les catégories de produits.
     GET: public, POST/PUT/DELETE: admin.
@@ -21,7 +22,7 @@ class ProductCategoryViewSet(viewsets.ModelViewSet):
         return [permissions.IsAdminUser()]
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les produits.
     GET: public, POST/PUT/DELETE: admin.
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class TrainingsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.trainings"
+    verbose_name = "Trainings"
+
+    def ready(self):
+        from .registration import connect_registration_signals
+
+        connect_registration_signals()
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from apps.trainings.registration import recount_seats
+
+
+class Command(BaseCommand):
+    help = "Recalcule les places confirmées des sessions de training et sert la liste d'attente (réparation)."
+
+    def handle(self, *args, **options) -> None:
+        self.stdout.write(f"Compteurs corrigés : {recount_seats()} session(s).")
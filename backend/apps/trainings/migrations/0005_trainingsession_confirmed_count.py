@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:04
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_confirmed_count(apps, schema_editor):
+    TrainingSession = apps.get_model("trainings", "TrainingSession")
+    sessions = TrainingSession.objects.annotate(
+        confirmed=Count("registrations", filter=Q(registrations__status="confirmed"))
+    ).filter(confirmed__gt=0)
+    for session in sessions:
+        TrainingSession.objects.filter(pk=session.pk).update(confirmed_count=session.confirmed)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trainings', '0004_ensure_trainingregistration_table'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingsession',
+            name='confirmed_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Inscrits confirmés'),
+        ),
+        migrations.RunPython(backfill_confirmed_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='trainingregistration',
+            index=models.Index(fields=['session', 'status', 'created_at'], name='training_reg_queue_idx'),
+        ),
+    ]
@@ -59,6 +59,8 @@ class TrainingSession(BaseModel):
         verbose_name="Niveau"
     )
     is_cancelled = models.BooleanField(default=False, verbose_name="Annulé")
+    # Places confirmées, tenu à jour par apps/trainings/registration.py (UPDATE conditionnel).
+    confirmed_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="Inscrits confirmés")
 
     class Meta:
         verbose_name = "Session de training"
@@ -68,6 +70,20 @@ class TrainingSession(BaseModel):
     def __str__(self):
         return f"{self.title} - {self.date.strftime('%d/%m/%Y %H:%M')}"
 
+    def save(self, *args, **kwargs):
+        # confirmed_count n'est écrit que par registration.py (UPDATE conditionnel) : une
+        # sauvegarde complète (PATCH admin, admin Django) réécrirait sinon la valeur lue avant
+        # une inscription ou une désinscription concurrente.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name != "confirmed_count"
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def spots_left(self):
+        return max(0, self.capacity - self.confirmed_count)
+
     @property
     def instructor_display(self):
         if self.instructor:
@@ -78,7 +94,12 @@ class TrainingSession(BaseModel):
 class TrainingRegistration(BaseModel):
     """
     Inscription d'un utilisateur à une session de training.
+    La liste d'attente est servie dans l'ordre d'inscription (created_at).
     """
+    CONFIRMED = "confirmed"
+    WAITLIST = "waitlist"
+    CANCELLED = "cancelled"
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -103,6 +124,9 @@ class TrainingRegistration(BaseModel):
         verbose_name = "Inscription training"
         verbose_name_plural = "Inscriptions training"
         unique_together = ["user", "session"]
+        indexes = [
+            models.Index(fields=["session", "status", "created_at"], name="training_reg_queue_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username} → {self.session.title}"
@@ -0,0 +1,150 @@
+"""
+Inscriptions aux sessions de training, sans survente.
+
+- Une place se prend par un seul UPDATE conditionnel
+  (confirmed_count = confirmed_count + 1 WHERE confirmed_count < capacity) : deux
+  inscriptions simultanées ne peuvent pas confirmer la dernière place toutes les deux.
+  Sans place, l'inscription va en liste d'attente.
+- register() est idempotent : un nouvel essai (double clic, retry réseau) renvoie
+  l'inscription existante au lieu d'une erreur ; une course sur la contrainte unique
+  (user, session) rend la place prise en trop.
+- unregister() verrouille la ligne de la session, libère la place et la donne au premier
+  de la liste d'attente (fill_from_waitlist, aussi appelé quand la capacité augmente).
+- Toute inscription confirmée qui disparaît (désinscription, admin, suppression de
+  l'utilisateur ou passage à un autre statut) rend sa place via les receivers branchés par
+  connect_registration_signals() ; recount_seats() (`python manage.py recount_training_seats`)
+  répare les compteurs.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .models import TrainingRegistration, TrainingSession
+
+CONFIRMED = TrainingRegistration.CONFIRMED
+WAITLIST = TrainingRegistration.WAITLIST
+CANCELLED = TrainingRegistration.CANCELLED
+
+
+def _take_seat(session_id) -> bool:
+    return bool(
+        TrainingSession.objects.filter(
+            pk=session_id, is_cancelled=False, confirmed_count__lt=F("capacity")
+        ).update(confirmed_count=F("confirmed_count") + 1)
+    )
+
+
+def _release_seat(session_id) -> None:
+    TrainingSession.objects.filter(pk=session_id, confirmed_count__gt=0).update(
+        confirmed_count=F("confirmed_count") - 1
+    )
+
+
+def register(session, user):
+    """(inscription, créée ?) — confirmée s'il reste une place, en liste d'attente sinon."""
+    existing = TrainingRegistration.objects.filter(session=session, user=user).first()
+    if existing is not None and existing.status != CANCELLED:
+        return existing, False
+    try:
+        with transaction.atomic():
+            if existing is not None:
+                # Inscription annulée (admin) : on repart en fin de file.
+                existing.delete()
+            status = CONFIRMED if _take_seat(session.pk) else WAITLIST
+            registration = TrainingRegistration.objects.create(session=session, user=user, status=status)
+    except IntegrityError:
+        # Même utilisateur inscrit en parallèle : la transaction (et sa place) est annulée.
+        return TrainingRegistration.objects.get(session=session, user=user), False
+    return registration, True
+
+
+def _lock_session(session_id):
+    # Désinscriptions et promotions d'une même session en série ; les inscriptions, elles,
+    # n'attendent ce verrou que le temps de leur UPDATE de place.
+    TrainingSession.objects.select_for_update().filter(pk=session_id).first()
+
+
+@transaction.atomic
+def fill_from_waitlist(session_id):
+    """Confirme la liste d'attente, dans l'ordre, tant qu'il reste des places."""
+    _lock_session(session_id)
+    promoted = []
+    while True:
+        candidate = (
+            TrainingRegistration.objects.filter(session_id=session_id, status=WAITLIST)
+            .order_by("created_at", "pk")
+            .first()
+        )
+        if candidate is None or not _take_seat(session_id):
+            break
+        if TrainingRegistration.objects.filter(pk=candidate.pk, status=WAITLIST).update(status=CONFIRMED):
+            promoted.append(candidate)
+        else:
+            _release_seat(session_id)
+    return promoted
+
+
+def _give_seat_to_waitlist(session_id) -> None:
+    _release_seat(session_id)
+    fill_from_waitlist(session_id)
+
+
+def unregister(session, user) -> bool:
+    """Supprime l'inscription ; une place confirmée libérée passe au premier en attente (post_delete)."""
+    with transaction.atomic():
+        _lock_session(session.pk)
+        registration = TrainingRegistration.objects.filter(session=session, user=user).first()
+        if registration is None:
+            return False
+        registration.delete()
+    return True
+
+
+def recount_seats() -> int:
+    """Recalcule confirmed_count (inscriptions confirmées) ; renvoie le nombre de sessions corrigées."""
+    fixed = 0
+    sessions = TrainingSession.objects.annotate(
+        actual=Count("registrations", filter=Q(registrations__status=CONFIRMED))
+    )
+    for session in sessions:
+        if session.actual != session.confirmed_count:
+            fixed += TrainingSession.objects.filter(pk=session.pk).update(confirmed_count=session.actual)
+            fill_from_waitlist(session.pk)
+    return fixed
+
+
+def _on_registration_delete(sender, instance, **kwargs):
+    # Couvre aussi la cascade d'un utilisateur supprimé : pas de pre_delete sur User, le
+    # collecteur enverrait un second post_delete pour une ligne déjà supprimée.
+    if instance.status == CONFIRMED:
+        _give_seat_to_waitlist(instance.session_id)
+
+
+def _on_registration_pre_save(sender, instance, raw=False, **kwargs):
+    # Statut en base avant une sauvegarde ORM (admin, shell) ; les promotions de
+    # fill_from_waitlist() passent par un UPDATE et ne déclenchent rien.
+    instance._stored_status = None
+    if not raw and not instance._state.adding:
+        instance._stored_status = (
+            TrainingRegistration.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+        )
+
+
+def _on_registration_save(sender, instance, created=False, raw=False, **kwargs):
+    before = getattr(instance, "_stored_status", None)
+    if created or raw or before is None or before == instance.status:
+        return
+    if before == CONFIRMED:
+        _give_seat_to_waitlist(instance.session_id)
+    elif instance.status == CONFIRMED:
+        # Confirmation forcée : la ligne compte, même au-delà de la capacité.
+        TrainingSession.objects.filter(pk=instance.session_id).update(confirmed_count=F("confirmed_count") + 1)
+
+
+def connect_registration_signals():
+    """Branche les receivers (appelé par TrainingsConfig.ready)."""
+    uid = "registration:trainings.TrainingRegistration"
+    post_delete.connect(_on_registration_delete, sender=TrainingRegistration, dispatch_uid=uid)
+    pre_save.connect(_on_registration_pre_save, sender=TrainingRegistration, dispatch_uid=uid)
+    post_save.connect(_on_registration_save, sender=TrainingRegistration, dispatch_uid=uid)
+
@@ -2,10 +2,11 @@
 Serializers Trainings — Pass d'abonnement et sessions.
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import SubscriptionPass, TrainingSession, TrainingRegistration
 
 
-class SubscriptionPassSerializer(serializers.ModelSerializer):
+class SubscriptionPassSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les pass d'abonnement."""
     class Meta:
         model = SubscriptionPass
@@ -16,12 +17,12 @@ class SubscriptionPassSerializer(serializers.ModelSerializer):
         ]
 
 
-class TrainingSessionSerializer(serializers.ModelSerializer):
+class TrainingSessionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer pour les sessions de training."""
     instructor_display = serializers.ReadOnlyField()
     level_name = serializers.ReadOnlyField(source="level.name")
-    registrations_count = serializers.SerializerMethodField()
-    spots_left = serializers.SerializerMethodField()
+    registrations_count = serializers.IntegerField(source="confirmed_count", read_only=True)
+    spots_left = serializers.ReadOnlyField()
 
     class Meta:
         model = TrainingSession
@@ -32,13 +33,6 @@ class TrainingSessionSerializer(serializers.ModelSerializer):
             "created_at", "updated_at"
         ]
 
-    def get_registrations_count(self, obj):
-        return obj.registrations.filter(status="confirmed").count()
-
-    def get_spots_left(self, obj):
-        confirmed = obj.registrations.filter(status="confirmed").count()
-        return max(0, obj.capacity - confirmed)
-
 
 class TrainingRegistrationSerializer(serializers.ModelSerializer):
     """Serializer pour les inscriptions aux sessions."""
@@ -0,0 +1,148 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from apps.core.testing import client_for, run_concurrently
+
+from .models import TrainingRegistration, TrainingSession
+
+User = get_user_model()
+
+
+def make_session(capacity, slug="rush"):
+    return TrainingSession.objects.create(
+        title="Training rush", slug=slug, date=timezone.now() + timedelta(days=1), capacity=capacity
+    )
+
+
+def register_url(session):
+    return f"/api/trainings/sessions/{session.slug}/register/"
+
+
+def post_as(user, url):
+    def call():
+        return client_for(user).post(url).status_code
+
+    return call
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class RegistrationRushTests(TransactionTestCase):
+    """Inscriptions simultanées sur une même session (nécessite une base à écritures concurrentes)."""
+
+    def test_many_threads_never_overbook(self):
+        session = make_session(capacity=5)
+        users = [User.objects.create(username=f"rush-{i:02d}") for i in range(30)]
+
+        statuses = run_concurrently([post_as(user, register_url(session)) for user in users])
+
+        self.assertEqual(statuses, [201] * len(users))
+        session.refresh_from_db()
+        confirmed = TrainingRegistration.objects.filter(session=session, status="confirmed").count()
+        self.assertEqual(confirmed, 5)
+        self.assertEqual(session.confirmed_count, 5)
+        self.assertEqual(TrainingRegistration.objects.filter(session=session, status="waitlist").count(), 25)
+
+    def test_same_user_retries_are_idempotent(self):
+        session = make_session(capacity=3)
+        user = User.objects.create(username="double-click")
+
+        statuses = run_concurrently([post_as(user, register_url(session)) for _ in range(10)])
+
+        self.assertEqual(sorted(statuses), [200] * 9 + [201])
+        session.refresh_from_db()
+        self.assertEqual(session.confirmed_count, 1)
+        self.assertEqual(TrainingRegistration.objects.filter(session=session).count(), 1)
+
+
+class WaitlistTests(TestCase):
+    def setUp(self):
+        self.session = make_session(capacity=2, slug="waitlist")
+        self.users = [User.objects.create(username=f"wl-{i}") for i in range(4)]
+        for user in self.users:
+            client_for(user).post(register_url(self.session))
+
+    def _statuses(self):
+        regs = TrainingRegistration.objects.filter(session=self.session)
+        return {r.user.username: r.status for r in regs.select_related("user")}
+
+    def test_unregister_promotes_first_in_line(self):
+        response = client_for(self.users[0]).delete(f"/api/trainings/sessions/{self.session.slug}/unregister/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self._statuses(), {"wl-1": "confirmed", "wl-2": "confirmed", "wl-3": "waitlist"})
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.confirmed_count, 2)
+
+    def test_unregister_from_waitlist_keeps_seats(self):
+        client_for(self.users[3]).delete(f"/api/trainings/sessions/{self.session.slug}/unregister/")
+
+        self.assertEqual(self._statuses(), {"wl-0": "confirmed", "wl-1": "confirmed", "wl-2": "waitlist"})
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.confirmed_count, 2)
+
+    def test_capacity_increase_fills_from_waitlist(self):
+        admin = User.objects.create(username="admin", user_type=User.UserType.ADMIN)
+        response = client_for(admin).patch(
+            f"/api/trainings/sessions/{self.session.slug}/", {"capacity": 3}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["registrations_count"], 3)
+        self.assertEqual(self._statuses()["wl-2"], "confirmed")
+        self.assertEqual(self._statuses()["wl-3"], "waitlist")
+
+    def test_list_counts_without_loading_registrations(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/trainings/sessions/")
+        row = response.json()[0]
+        self.assertEqual((row["registrations_count"], row["spots_left"]), (2, 0))
+
+    def test_full_save_of_stale_instance_keeps_counter(self):
+        stale = TrainingSession.objects.get(pk=self.session.pk)
+        for user in (self.users[3], self.users[2], self.users[0]):
+            client_for(user).delete(f"/api/trainings/sessions/{self.session.slug}/unregister/")
+
+        stale.title = "Renamed"
+        stale.save()
+
+        self.session.refresh_from_db()
+        self.assertEqual((self.session.title, self.session.confirmed_count), ("Renamed", 1))
+
+    def _confirmed_count(self):
+        self.session.refresh_from_db()
+        return self.session.confirmed_count
+
+    def test_deleting_user_promotes_first_in_line(self):
+        self.users[0].delete()
+
+        self.assertEqual(self._statuses(), {"wl-1": "confirmed", "wl-2": "confirmed", "wl-3": "waitlist"})
+        self.assertEqual(self._confirmed_count(), 2)
+
+    def test_admin_delete_and_cancel_return_seats(self):
+        TrainingRegistration.objects.get(user=self.users[0]).delete()
+        self.assertEqual(self._statuses()["wl-2"], "confirmed")
+
+        cancelled = TrainingRegistration.objects.get(user=self.users[1])
+        cancelled.status = TrainingRegistration.CANCELLED
+        cancelled.save()
+
+        self.assertEqual(self._statuses(), {"wl-1": "cancelled", "wl-2": "confirmed", "wl-3": "confirmed"})
+        self.assertEqual(self._confirmed_count(), 2)
+        # Une inscription annulée peut se réinscrire : en fin de file, sans place rendue deux fois.
+        self.assertEqual(client_for(self.users[1]).post(register_url(self.session)).json()["status"], "waitlist")
+        self.assertEqual(self._confirmed_count(), 2)
+
+    def test_recount_repairs_counter_and_serves_waitlist(self):
+        TrainingSession.objects.filter(pk=self.session.pk).update(capacity=3, confirmed_count=3)
+
+        out = StringIO()
+        call_command("recount_training_seats", stdout=out)
+
+        self.assertIn("1 session", out.getvalue())
+        self.assertEqual(self._statuses()["wl-2"], "confirmed")
+        self.assertEqual(self._confirmed_count(), 3)
@@ -2,10 +2,12 @@
 Views Trainings — Pass d'abonnement et sessions.
 """
 from rest_framework import viewsets, permissions, status
+from apps.core.fieldsets import SparseFieldsetViewMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
-from .models import SubscriptionPass, TrainingSession, TrainingRegistration
+from . import registration as seats
+from .models import SubscriptionPass, TrainingSession
 from .serializers import (
     SubscriptionPassSerializer,
     TrainingSessionSerializer,
@@ -13,7 +15,7 @@ from .serializers import (
 )
 
 
-class SubscriptionPassViewSet(viewsets.ModelViewSet):
+class SubscriptionPassViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les pass d'abonnement.
     GET: public, POST/PUT/DELETE: admin.
@@ -28,7 +30,7 @@ class SubscriptionPassViewSet(viewsets.ModelViewSet):
         return [permissions.IsAdminUser()]
 
 
-class TrainingSessionViewSet(viewsets.ModelViewSet):
+class TrainingSessionViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API pour les sessions de training.
     GET: public, POST/PUT/DELETE: admin.
@@ -49,55 +51,42 @@ class TrainingSessionViewSet(viewsets.ModelViewSet):
         if level:
             qs = qs.filter(level__slug=level)
         
-        return qs.select_related("instructor", "level").prefetch_related("registrations")
+        return qs.select_related("instructor", "level")
 
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
             return [permissions.AllowAny()]
+        if self.action in ["register", "unregister"]:
+            return [permissions.IsAuthenticated()]
         return [permissions.IsAdminUser()]
 
+    def perform_update(self, serializer):
+        # save() n'écrit pas confirmed_count (voir TrainingSession.save) : relu après coup.
+        session = serializer.save()
+        # Capacité augmentée : les places libérées vont à la liste d'attente.
+        seats.fill_from_waitlist(session.pk)
+        session.refresh_from_db(fields=["confirmed_count"])
+
     @action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
     def register(self, request, slug=None):
-        """Inscription à une session."""
+        """
+        Inscription à une session : confirmée s'il reste une place, liste d'attente sinon.
+        Idempotent : déjà inscrit → 200 avec l'inscription existante.
+        """
         session = self.get_object()
-        user = request.user
-
-        # Vérifier si déjà inscrit
-        if TrainingRegistration.objects.filter(user=user, session=session).exists():
-            return Response(
-                {"error": "Vous êtes déjà inscrit à cette session."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Vérifier la capacité
-        confirmed_count = session.registrations.filter(status="confirmed").count()
-        if confirmed_count >= session.capacity:
-            reg_status = "waitlist"
-        else:
-            reg_status = "confirmed"
-
-        registration = TrainingRegistration.objects.create(
-            user=user,
-            session=session,
-            status=reg_status
-        )
+        registration, created = seats.register(session, request.user)
         return Response(
             TrainingRegistrationSerializer(registration).data,
-            status=status.HTTP_201_CREATED
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
         )
 
     @action(detail=True, methods=["delete"], permission_classes=[permissions.IsAuthenticated])
     def unregister(self, request, slug=None):
-        """Désinscription d'une session."""
+        """Désinscription d'une session ; la place libérée passe au premier en liste d'attente."""
         session = self.get_object()
-        user = request.user
-
-        try:
-            registration = TrainingRegistration.objects.get(user=user, session=session)
-            registration.delete()
+        if seats.unregister(session, request.user):
             return Response(status=status.HTTP_204_NO_CONTENT)
-        except TrainingRegistration.DoesNotExist:
-            return Response(
-                {"error": "Vous n'êtes pas inscrit à cette session."},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        return Response(
+            {"error": "Vous n'êtes pas inscrit à cette session."},
+            status=status.HTTP_404_NOT_FOUND
+        )
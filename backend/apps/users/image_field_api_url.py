@@ -1,6 +1,22 @@
-"""URLs exposées API pour ImageField (fichier local ou Cloudinary)."""
+"""
+URLs exposées API pour ImageField (fichier local ou Cloudinary).
+
+Le calcul d'une URL (storage.url(), build_absolute_uri, passage en https) est mémorisé
+dans un LRU borné, clé (storage, nom de fichier, schéma + hôte de la requête) : un même
+fichier n'est résolu qu'une fois par processus, quelle que soit la liste qui l'affiche.
+Un fichier remplacé change de nom, donc de clé ; rien à invalider.
+"""
+import threading
+from collections import OrderedDict
 from urllib.parse import urlparse
 
+from rest_framework import serializers
+
+MEDIA_URL_CACHE_SIZE = 4096
+
+_media_urls = OrderedDict()
+_media_urls_lock = threading.Lock()
+
 
 def strip_embedded_absolute_url(url: str) -> str:
     """
@@ -34,14 +50,7 @@ def https_media_url(url: str, request) -> str:
     return url
 
 
-def serialize_image_field_for_api(field_file, request):
-    """
-    URL absolue pour l’API (profil, couverture, etc.).
-    `request` peut être None (URLs relatives pour chemins locaux).
-    """
-    if not field_file:
-        return None
-    raw_name = (field_file.name if hasattr(field_file, "name") else "") or ""
+def _compute_media_url(field_file, raw_name, request):
     if raw_name.startswith("http://") or raw_name.startswith("https://"):
         return https_media_url(strip_embedded_absolute_url(raw_name), request)
     if raw_name.startswith("//"):
@@ -56,3 +65,90 @@ def serialize_image_field_for_api(field_file, request):
     if request:
         return https_media_url(request.build_absolute_uri(url), request)
     return url
+
+
+def _media_url_key(field_file, raw_name, request):
+    storage = getattr(field_file, "storage", None)
+    storage_key = f"{type(storage).__module__}.{type(storage).__qualname__}" if storage is not None else ""
+    origin = (request.scheme, request.get_host()) if request else None
+    return (storage_key, raw_name, origin)
+
+
+def clear_media_url_cache():
+    with _media_urls_lock:
+        _media_urls.clear()
+
+
+def serialize_image_field_for_api(field_file, request):
+    """
+    URL absolue pour l’API (profil, couverture, etc.).
+    `request` peut être None (URLs relatives pour chemins locaux).
+    """
+    if not field_file:
+        return None
+    raw_name = (field_file.name if hasattr(field_file, "name") else "") or ""
+    if not raw_name:
+        return _compute_media_url(field_file, raw_name, request)
+    key = _media_url_key(field_file, raw_name, request)
+    with _media_urls_lock:
+        if key in _media_urls:
+            _media_urls.move_to_end(key)
+            return _media_urls[key]
+    url = _compute_media_url(field_file, raw_name, request)
+    with _media_urls_lock:
+        _media_urls[key] = url
+        if len(_media_urls) > MEDIA_URL_CACHE_SIZE:
+            _media_urls.popitem(last=False)
+    return url
+
+
+def resolve_media_urls(field_files, request) -> dict:
+    """
+    Résout en une passe les URLs d'un lot de fichiers (ex. toutes les photos d'une page
+    d'artistes) : {name: url}. Chaque nom distinct n'est calculé qu'une fois.
+    """
+    urls = {}
+    for field_file in field_files:
+        name = (getattr(field_file, "name", "") or "") if field_file else ""
+        if name and name not in urls:
+            urls[name] = serialize_image_field_for_api(field_file, request)
+    return urls
+
+
+def serialize_image_fields_for_api(instance, names, request) -> dict:
+    """{champ: url} pour plusieurs ImageField/FileField d'une même instance."""
+    return {name: serialize_image_field_for_api(getattr(instance, name, None), request) for name in names}
+
+
+class ApiImageField(serializers.Field):
+    """
+    ImageField en lecture : URL API calculée une seule fois (serialize_image_field_for_api),
+    ou lue dans context["media_urls"] quand la liste les a résolues en lot.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        name = getattr(value, "name", None)
+        media_urls = self.context.get("media_urls")
+        if name and media_urls is not None and name in media_urls:
+            return media_urls[name]
+        return serialize_image_field_for_api(value, self.context.get("request"))
+
+
+class MediaBatchListSerializer(serializers.ListSerializer):
+    """many=True : résout toutes les URLs d'images de la page avant de sérialiser les lignes."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        image_fields = [
+            field.source for field in self.child.fields.values() if isinstance(field, ApiImageField)
+        ]
+        if rows and image_fields:
+            self.context["media_urls"] = resolve_media_urls(
+                (getattr(row, name, None) for row in rows for name in image_fields),
+                self.context.get("request"),
+            )
+        return super().to_representation(rows)
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import DanceProfession
 
 User = get_user_model()
@@ -7,6 +8,7 @@ User = get_user_model()
 class Command(BaseCommand):
     help = "Crée des artistes de démo pour tester la page Artistes."
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         prof = DanceProfession.objects.get(slug="professeur")
         dj = DanceProfession.objects.get(slug="dj")
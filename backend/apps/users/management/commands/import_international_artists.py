@@ -8,6 +8,7 @@ from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand, CommandError
 from django.utils.text import slugify
 
+from apps.core.content_cache import deferred_generation_bumps
 from apps.core.models import DanceProfession
 
 
@@ -141,6 +142,7 @@ class Command(BaseCommand):
             help="Chemin du dossier contenant 1 sous-dossier par artiste (images cherchées aussi dans les sous-dossiers).",
         )
 
+    @deferred_generation_bumps()
     def handle(self, *args, **options):
         root = Path(options["dir"]).expanduser()
         if not root.exists() or not root.is_dir():
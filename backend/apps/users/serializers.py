@@ -3,8 +3,9 @@ from django.contrib.auth import get_user_model
 from apps.organization.models import OrganizationRole
 from apps.core.models import DanceProfession
 
-from apps.users.image_field_api_url import serialize_image_field_for_api
+from apps.users.image_field_api_url import ApiImageField, MediaBatchListSerializer
 from apps.core.profile_external_links import normalize_external_links
+from apps.core.fieldsets import SparseFieldsetMixin
 
 User = get_user_model()
 
@@ -15,12 +16,16 @@ class DanceProfessionSerializer(serializers.ModelSerializer):
         model = DanceProfession
         fields = ['id', 'name', 'slug']
 
-class ArtistSerializer(serializers.ModelSerializer):
+class ArtistSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer pour l'affichage public d'un artiste.
+    Les vues publiques préchargent professions (triées) et structures partenaires
+    (triées par nom, to_attr="partner_structures_ordered") : aucun tri Python ici.
     """
     professions = DanceProfessionSerializer(many=True, read_only=True)
     linked_partner_structures = serializers.SerializerMethodField()
+    profile_picture = ApiImageField()
+    cover_image = ApiImageField()
 
     class Meta:
         model = User
@@ -42,8 +47,12 @@ class ArtistSerializer(serializers.ModelSerializer):
             "external_links",
             "linked_partner_structures",
         ]
+        list_serializer_class = MediaBatchListSerializer
 
     def get_linked_partner_structures(self, obj):
+        ordered = getattr(obj, "partner_structures_ordered", None)
+        if ordered is not None:
+            return [{"name": n.name, "slug": n.slug} for n in ordered]
         cache = getattr(obj, "_prefetched_objects_cache", None) or {}
         if "linked_partner_structures" in cache:
             nodes = list(cache["linked_partner_structures"])
@@ -54,14 +63,10 @@ class ArtistSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        request = self.context.get("request")
-        for key in ("profile_picture", "cover_image"):
-            data[key] = serialize_image_field_for_api(
-                getattr(instance, key, None), request
+        if "external_links" in data:  # absent si exclu par ?fields= / ?omit=
+            data["external_links"] = normalize_external_links(
+                getattr(instance, "external_links", None) or {}
             )
-        data["external_links"] = normalize_external_links(
-            getattr(instance, "external_links", None) or {}
-        )
         return data
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -0,0 +1,84 @@
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.models import DanceProfession
+from apps.partners.models import PartnerNode
+
+from .models import User
+
+# Plafond de temps (mur) de GET /api/users/artists/ à froid sur 5 000 artistes (~2,5 s en local,
+# SQLite). Large exprès : il attrape une régression d'ordre de grandeur (N+1, sérialisation
+# quadratique), pas le bruit d'une machine lente.
+ARTIST_LIST_5K_MAX_SECONDS = 10.0
+
+
+def make_artists(count, prefix="artist"):
+    """Fixture de benchmark : `count` artistes avec 2 professions, photo et une structure partenaire."""
+    dancer, _ = DanceProfession.objects.get_or_create(slug="danseur", defaults={"name": "Danseur"})
+    teacher, _ = DanceProfession.objects.get_or_create(slug="professeur", defaults={"name": "Professeur"})
+    node, _ = PartnerNode.objects.get_or_create(slug="bench-structure", defaults={"name": "Bench structure"})
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{prefix}-{i:05d}",
+                first_name=f"Prénom {i}",
+                last_name=f"Nom {i}",
+                artist_display_order=i % 10,
+                profile_picture=f"users/profiles/{prefix}-{i}.jpg",
+                cover_image="https://res.cloudinary.com/demo/image/upload/cover.jpg" if i % 2 else "",
+            )
+            for i in range(count)
+        ]
+    )
+    Through = User.professions.through
+    Through.objects.bulk_create(
+        [Through(user_id=u.pk, danceprofession_id=p.pk) for u in users for p in (dancer, teacher)]
+    )
+    LinkThrough = User.linked_partner_structures.through
+    LinkThrough.objects.bulk_create(
+        [LinkThrough(user_id=u.pk, partnernode_id=node.pk) for u in users[::3]]
+    )
+    return users
+
+
+class ArtistDirectoryQueryTests(TestCase):
+    """GET /api/users/artists/ : nombre de requêtes indépendant du nombre d'artistes."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _fetch(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = self.client.get("/api/users/artists/")
+            self.elapsed = time.perf_counter() - started
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_query_count_is_constant_and_time_bounded_up_to_5k_artists(self):
+        make_artists(20, prefix="small")
+        small, small_queries = self._fetch()
+        self.assertEqual(len(small), 20)
+
+        make_artists(4980, prefix="large")
+        large, large_queries = self._fetch()
+        self.assertEqual(len(large), 5000)
+        self.assertEqual(large_queries, small_queries)
+        self.assertLess(self.elapsed, ARTIST_LIST_5K_MAX_SECONDS, f"5 000 artistes servis en {self.elapsed:.2f} s")
+
+    def test_payload_shape_and_ordering(self):
+        make_artists(3)
+        User.objects.create(username="no-profession")
+        artists, _ = self._fetch()
+        self.assertEqual(len(artists), 3)
+        first = artists[0]
+        self.assertEqual([p["slug"] for p in first["professions"]], ["danseur", "professeur"])
+        self.assertEqual(first["linked_partner_structures"], [{"name": "Bench structure", "slug": "bench-structure"}])
+        self.assertTrue(first["profile_picture"].endswith("/artist-0.jpg"))
+        self.assertIsNone(first["cover_image"])
+        self.assertEqual(artists[1]["cover_image"], "https://res.cloudinary.com/demo/image/upload/cover.jpg")
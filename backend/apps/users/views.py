@@ -10,6 +10,8 @@ from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from django.contrib.auth import authenticate
+from django.db.models import Exists, OuterRef, Prefetch
+from django.db.models.functions import Lower
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,9 @@ from google.auth.transport import requests as google_requests
 from apps.core.models import DanceProfession, PendingContentEdit
 from apps.partners.models import PartnerNode
 from apps.core.api_response import json_response_no_store
+from apps.core.content_cache import cache_public_get
+from apps.core.fieldsets import sparse_queryset
+from apps.core.pagination import keyset_paginated_response
 from apps.core.permissions import IsStaffOrSuperUser
 from apps.core.profile_external_links import normalize_external_links, parse_external_links_param
 
@@ -171,25 +176,45 @@ class MeAPIView(APIView):
             "is_superuser": bool(getattr(user, "is_superuser", False)),
         })
 
+
+def _has_profession():
+    """EXISTS sur la table de liaison : pas de JOIN + DISTINCT sur users_user."""
+    return Exists(User.professions.through.objects.filter(user_id=OuterRef("pk")))
+
+
+def artist_directory_queryset():
+    """
+    Artistes avec leurs relations préchargées et déjà triées en SQL (ArtistSerializer
+    n'a plus rien à trier) : professions par nom, structures partenaires par nom
+    insensible à la casse dans `partner_structures_ordered`.
+    """
+    return User.objects.prefetch_related(
+        Prefetch("professions", queryset=DanceProfession.objects.order_by("name")),
+        Prefetch(
+            "linked_partner_structures",
+            queryset=PartnerNode.objects.only("id", "name", "slug").order_by(Lower("name")),
+            to_attr="partner_structures_ordered",
+        ),
+    )
+
+
 class ArtistListAPIView(APIView):
     """
     GET /api/users/artists/
     Liste publique des artistes (utilisateurs ayant des professions).
-    Pas de cache ici : LocMemCache + plusieurs workers Gunicorn faisait servir
-    d'anciennes URLs (ex. /media/media/...) après upload tant qu'un worker
-    n'avait pas été invalidé.
+    Cache partagé par génération "artists" : un upload incrémente la génération
+    pour tous les workers (l'ancien LocMemCache servait d'anciennes URLs
+    /media/media/... tant qu'un worker n'avait pas été invalidé).
+    ETag + must-revalidate remplacent l'ancien no-store : jamais de liste périmée,
+    mais un 304 sans corps quand rien n'a changé.
     """
     permission_classes = [AllowAny]
 
+    @cache_public_get("artists")
     def get(self, request):
         staff_only = request.query_params.get('staff_only')
 
-        artists = (
-            User.objects.filter(professions__isnull=False)
-            .distinct()
-            .select_related("dance_level")
-            .prefetch_related("professions", "linked_partner_structures")
-        )
+        artists = artist_directory_queryset().filter(_has_profession())
 
         if staff_only == 'true':
             artists = artists.filter(is_staff_member=True)
@@ -203,8 +228,10 @@ class ArtistListAPIView(APIView):
             "username",
         )
 
-        serializer = ArtistSerializer(artists, many=True, context={'request': request})
-        return json_response_no_store(serializer.data)
+        artists = sparse_queryset(artists, request, ArtistSerializer)
+        return keyset_paginated_response(
+            request, artists, lambda rows: ArtistSerializer(rows, many=True, context={'request': request}).data
+        )
 
 
 class ArtistDetailAPIView(APIView):
@@ -214,11 +241,12 @@ class ArtistDetailAPIView(APIView):
     """
     permission_classes = [AllowAny]
 
+    @cache_public_get("artists")
     def get(self, request, username):
         artist = (
-            User.objects.filter(username=username, professions__isnull=False)
-            .select_related("dance_level")
-            .prefetch_related("professions", "linked_partner_structures")
+            artist_directory_queryset()
+            .filter(username=username)
+            .filter(_has_profession())
             .first()
         )
         if artist:
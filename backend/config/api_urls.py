@@ -8,10 +8,16 @@ from apps.core.views import (
     health_check,
     SiteConfigurationAPIView,
     SiteConfigurationAdminAPIView,
+    BootstrapAPIView,
     AdminTranslateAPIView,
     AdminTranslatePreviewAPIView,
+    AdminTranslateBatchPreviewAPIView,
     AdminTranslateApplyAPIView,
     AdminTranslateSubmitPendingAPIView,
+    AdminCacheMetricsAPIView,
+    AdminJobListAPIView,
+    AdminJobDetailAPIView,
+    AdminJobCancelAPIView,
     seed_database,
     ExplorePresetViewSet,
     BulletinListAPIView,
@@ -20,15 +26,18 @@ from apps.core.views import (
     BulletinAdminDetailAPIView,
     PendingContentEditListAPIView,
     PendingContentEditDetailAPIView,
+    PendingContentEditBulkAPIView,
     FaqItemListAPIView,
 )
 from apps.courses.views import (
-    CourseListAPIView, CourseDetailAPIView, ScheduleListAPIView,
+    CourseListAPIView, CourseDetailAPIView, ScheduleListAPIView, PlanningAPIView,
     TheoryLessonListAPIView, TheoryLessonDetailAPIView,
     CourseAdminAPIView, CourseAdminDetailAPIView,
     TheoryLessonAdminAPIView, TheoryLessonAdminDetailAPIView,
 )
 from apps.events.views import (
+    AgendaAPIView, CalendarFeedAPIView,
+    EventPassListAPIView, PassHoldCreateAPIView, PassHoldConfirmAPIView, PassHoldDetailAPIView,
     EventListAPIView, EventDetailAPIView,
     EventAdminAPIView, EventAdminDetailAPIView,
 )
@@ -96,6 +105,7 @@ urlpatterns = [
     path("artists/", include("apps.artists.urls")),
     path("health/", health_check),
     path("config/", SiteConfigurationAPIView.as_view()),
+    path("bootstrap/", BootstrapAPIView.as_view()),
     path("menu/items/", MenuItemListAPIView.as_view()),
     path("identite/bulletins/", BulletinListAPIView.as_view()),
     path("identite/bulletins/<slug:slug>/", BulletinDetailAPIView.as_view()),
@@ -105,13 +115,21 @@ urlpatterns = [
     # ── Courses (lecture) ────────────────────────────────────────────────────
     path("courses/", CourseListAPIView.as_view()),
     path("courses/schedules/", ScheduleListAPIView.as_view()),
+    path("courses/planning/", PlanningAPIView.as_view()),
     path("courses/theory/", TheoryLessonListAPIView.as_view()),
     path("courses/theory/<slug:slug>/", TheoryLessonDetailAPIView.as_view()),
     path("courses/<slug:slug>/", CourseDetailAPIView.as_view()),
 
     # ── Events (lecture) ─────────────────────────────────────────────────────
     path("events/", EventListAPIView.as_view()),
+    path("events/passes/<uuid:pass_id>/hold/", PassHoldCreateAPIView.as_view()),
+    path("events/holds/<uuid:hold_id>/", PassHoldDetailAPIView.as_view()),
+    path("events/holds/<uuid:hold_id>/confirm/", PassHoldConfirmAPIView.as_view()),
     path("events/<slug:slug>/", EventDetailAPIView.as_view()),
+    path("events/<slug:slug>/passes/", EventPassListAPIView.as_view()),
+    path("agenda/", AgendaAPIView.as_view()),
+    path("calendar.ics", CalendarFeedAPIView.as_view()),
+    path("calendar/<str:scope>/<str:slug>.ics", CalendarFeedAPIView.as_view()),
 
     # ── Organization (lecture) ───────────────────────────────────────────────
     path("organization/nodes/", OrganizationNodeListAPIView.as_view()),
@@ -154,12 +172,18 @@ urlpatterns = [
     path("admin/config/", SiteConfigurationAdminAPIView.as_view()),
     path("admin/translate/", AdminTranslateAPIView.as_view()),
     path("admin/translate/preview/", AdminTranslatePreviewAPIView.as_view()),
+    path("admin/translate/batch-preview/", AdminTranslateBatchPreviewAPIView.as_view()),
     path("admin/translate/apply/", AdminTranslateApplyAPIView.as_view()),
     path("admin/translate/submit-pending/", AdminTranslateSubmitPendingAPIView.as_view()),
+    path("admin/cache/metrics/", AdminCacheMetricsAPIView.as_view()),
+    path("admin/jobs/", AdminJobListAPIView.as_view()),
+    path("admin/jobs/<uuid:job_id>/", AdminJobDetailAPIView.as_view()),
+    path("admin/jobs/<uuid:job_id>/cancel/", AdminJobCancelAPIView.as_view()),
     path("admin/identite/bulletins/", BulletinAdminListCreateAPIView.as_view()),
     path("admin/identite/bulletins/<slug:slug>/", BulletinAdminDetailAPIView.as_view()),
     path("admin/pending-edits/", PendingContentEditListAPIView.as_view()),
     path("admin/pending-edits/<int:pk>/", PendingContentEditDetailAPIView.as_view()),
+    path("admin/pending-edits/bulk/", PendingContentEditBulkAPIView.as_view()),
     path("admin/partners/", PartnerAdminListCreateAPIView.as_view()),
     path("admin/partners/course-meta/", PartnerCourseMetaAPIView.as_view()),
     path("admin/partners/brands/<slug:slug>/", PartnerBrandAdminDetailAPIView.as_view()),
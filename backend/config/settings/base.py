@@ -3,6 +3,7 @@ Configuration Django commune (base).
 DB et DEBUG sont surchargés dans local.py / production.py.
 """
 import os
+import sys
 from pathlib import Path
 import environ
 
@@ -47,6 +48,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "apps.core.middleware_translation.TranslationLanguageMiddleware",
+    "apps.core.middleware_invalidation.ContentInvalidationMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -119,6 +121,8 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.TokenAuthentication",
     ],
+    # Opt-in (?limit= / ?cursor=) : sans ces paramètres les ViewSets renvoient la liste complète.
+    "DEFAULT_PAGINATION_CLASS": "apps.core.pagination.KeysetPagination",
 }
 
 CORS_ALLOWED_ORIGINS = [
@@ -137,11 +141,41 @@ CORS_ALLOW_CREDENTIALS = True
 X_FRAME_OPTIONS = 'SAMEORIGIN'
 SILENCED_SYSTEM_CHECKS = ['security.W019'] # Optionnel si on veut éviter l'alerte sur SAMEORIGIN
 
-# Cache en mémoire locale (LocMem) — simple, pas de dépendance externe.
-# Suffisant pour Railway (unique instance) ; pour multi-instances, passer à Redis.
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
+# Cache partagé entre workers Gunicorn (un LocMemCache par processus servait des
+# données périmées : l'invalidation ne touchait que le worker ayant traité l'écriture).
+# CACHE_URL :
+#   - vide / sqlite:///chemin/cache.sqlite3 : fichier SQLite commun aux workers du projet
+#     (défaut : BASE_DIR/cache.sqlite3, propre à chaque checkout)
+#   - redis://host:6379/0 : Redis (multi-instances ; nécessite le paquet `redis`)
+#   - locmem:// : mémoire locale (un seul processus ; défaut de `manage.py test`, dont les
+#     cache.clear() ne doivent pas vider le cache d'un serveur lancé à côté)
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+_cache_url = env("CACHE_URL", default="locmem://" if TESTING else "").strip()
+if _cache_url.startswith(("redis://", "rediss://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _cache_url,
+        }
     }
-}
+elif _cache_url.startswith("locmem://"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-snowflake",
+        }
+    }
+else:
+    _cache_path = _cache_url[len("sqlite://"):] if _cache_url.startswith("sqlite://") else ""
+    CACHES = {
+        "default": {
+            "BACKEND": "apps.core.cache_backends.SQLiteCache",
+            "LOCATION": _cache_path or os.path.join(BASE_DIR, "cache.sqlite3"),
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
+# Tâches de fond (apps/core/jobs.py, `python manage.py run_jobs`) : nombre max de tâches
+# en cours simultanément, tous workers confondus. Les traductions admin ne prennent ainsi
+# jamais plus de ressources que prévu aux processus web.
+JOB_MAX_RUNNING = env.int("JOB_MAX_RUNNING", default=1)
@@ -191,30 +191,79 @@ export async function rejectPendingEdit(id: number): Promise<PendingContentEditA
     return handleResponse(res);
 }
 
+export interface PendingEditBulkResult {
+    id: number;
+    status: "approved" | "rejected" | "skipped" | "not_found" | "error";
+    error?: string;
+}
+
+/** Approuve ou refuse un lot de demandes (une transaction par objet cible). */
+export async function reviewPendingEditsBulk(
+    action: "approve" | "reject",
+    ids: number[]
+): Promise<{ results: PendingEditBulkResult[]; counts: Record<string, number> }> {
+    const res = await fetch(`${getApiBaseUrl()}/api/admin/pending-edits/bulk/`, {
+        method: "POST",
+        headers: authHeaders(),
+        body: JSON.stringify({ action, ids }),
+    });
+    return handleResponse(res);
+}
+
 // ─── Traductions (admin) ─────────────────────────────────────────────────────
 export type TranslateTargetLang = "en" | "es";
 
-export interface AdminTranslateResponse {
-    results: Record<
-        TranslateTargetLang,
-        | { status: "ok"; output: string }
-        | { status: "error"; error: string }
-    >;
+export type AdminJobStatus = "queued" | "running" | "succeeded" | "failed" | "cancelled";
+
+/** Tâche de fond (file `run_jobs`) : traduction en masse, etc. */
+export interface AdminJob {
+    id: string;
+    kind: string;
+    status: AdminJobStatus;
+    params: Record<string, unknown>;
+    progress: {
+        targets?: TranslateTargetLang[];
+        objects_updated?: number;
+        fields_translated?: number;
+        failures?: number;
+    };
+    output: string;
+    error: string;
+    cancel_requested: boolean;
+    created_at: string;
+    started_at: string | null;
+    finished_at: string | null;
 }
 
+/** Met la traduction en file : la réponse (202) est la tâche créée, à suivre avec getAdminJob. */
 export async function translateModelsAdmin(payload: {
     targets: TranslateTargetLang[];
     limit?: number;
     dry_run?: boolean;
     model?: string;
     fields?: string[];
-}): Promise<AdminTranslateResponse> {
+}): Promise<AdminJob> {
     const res = await fetch(`${getApiBaseUrl()}/api/admin/translate/`, {
         method: "POST",
         headers: authHeaders(),
         body: JSON.stringify(payload),
     });
-    return handleResponse(res) as Promise<AdminTranslateResponse>;
+    return handleResponse(res) as Promise<AdminJob>;
+}
+
+export async function getAdminJob(jobId: string): Promise<AdminJob> {
+    const res = await fetch(`${getApiBaseUrl()}/api/admin/jobs/${jobId}/`, {
+        headers: authHeaders(),
+    });
+    return handleResponse(res) as Promise<AdminJob>;
+}
+
+export async function cancelAdminJob(jobId: string): Promise<AdminJob> {
+    const res = await fetch(`${getApiBaseUrl()}/api/admin/jobs/${jobId}/cancel/`, {
+        method: "POST",
+        headers: authHeaders(),
+    });
+    return handleResponse(res) as Promise<AdminJob>;
 }
 
 export interface AdminTranslatePreviewResponse {
@@ -243,6 +292,40 @@ export async function previewTranslationAdmin(payload: {
     return handleResponse(res) as Promise<AdminTranslatePreviewResponse>;
 }
 
+export interface AdminTranslateBatchPreviewResponse {
+    model: string;
+    object_id: number | string;
+    targets: TranslateTargetLang[];
+    fields: Record<
+        string,
+        {
+            source: string;
+            current_target: Partial<Record<TranslateTargetLang, string>>;
+            stale: Partial<Record<TranslateTargetLang, boolean>>;
+            suggestion: Partial<Record<TranslateTargetLang, string>>;
+            errors: Partial<Record<TranslateTargetLang, string>>;
+        }
+    >;
+    memory_hits: number;
+}
+
+/** Plusieurs champs, EN et ES, en une seule requête de traduction. */
+export async function previewTranslationBatchAdmin(payload: {
+    model: string;
+    object_id?: number | string;
+    fields: string[];
+    targets?: TranslateTargetLang[];
+    /** Textes FR du formulaire, par champ (même non encore enregistrés en base). */
+    source_texts?: Record<string, string>;
+}): Promise<AdminTranslateBatchPreviewResponse> {
+    const res = await fetch(`${getApiBaseUrl()}/api/admin/translate/batch-preview/`, {
+        method: "POST",
+        headers: authHeaders(),
+        body: JSON.stringify(payload),
+    });
+    return handleResponse(res) as Promise<AdminTranslateBatchPreviewResponse>;
+}
+
 /** Staff : proposition de traductions en attente validation admin. */
 export async function submitTranslationPending(payload: {
     model: string;